@@ -1 +1,24 @@
 from django.contrib import admin
+
+from .models import AppVersion
+
+
+class AppVersionAdmin(admin.ModelAdmin):
+    """
+    AppVersionAdmin
+    - 저장 / 삭제하면 updated_at / 개수가 바뀌어 AppVersionView의 캐시된 응답을 다시 생성
+    """
+
+    list_display = (
+        "id",
+        "device_type",
+        "server_type",
+        "version",
+        "force_update",
+        "created_at",
+    )
+    list_filter = ("device_type", "server_type")
+    ordering = ["-id"]
+
+
+admin.site.register(AppVersion, AppVersionAdmin)
@@ -3,3 +3,6 @@ from django.apps import AppConfig
 
 class CommonsConfig(AppConfig):
     name = "commons"
+
+    def ready(self):
+        from commons import signals  # noqa: F401
@@ -0,0 +1,118 @@
+import timeit
+
+from project_api.custom_exception_handler import custom_exception_handler
+from project_api.custom_http_status import HTTPStatus
+from project_api.utils import StandardException
+from rest_framework.exceptions import ValidationError
+from rest_framework.renderers import JSONRenderer
+from rest_framework.views import exception_handler
+
+from django.core.management.base import BaseCommand
+from django.utils import translation
+from django.utils.translation import ugettext_lazy
+
+
+def previous_exception_handler(exc, context):
+    """이전 custom_exception_handler (에러마다 HTTPStatus 전체로 메시지 dict 생성)"""
+    response = exception_handler(exc, context)
+
+    if response is not None:
+        http_code_to_message = {v.value: v.description for v in HTTPStatus}
+
+        error_payload = {
+            "status_code": 0,
+            "message": "",
+        }
+        error = error_payload
+        status_code = response.status_code
+
+        error["status_code"] = status_code
+
+        if type(exc) is StandardException:
+            error["message"] = str(exc)
+            error["details"] = {}
+        else:
+            try:
+                error["message"] = f"{http_code_to_message[status_code]} [Parameter: "
+                field_name_list = []
+                for field_name, field_error in response.data.items():
+                    field_name_list.append(field_name)
+                error["message"] += ",".join(field_name_list)
+                error["message"] += "]"
+                error["details"] = response.data
+            except KeyError:
+                error["message"] = ugettext_lazy("error")
+
+        if error_payload["status_code"] == 401:
+            error_payload["message"] = "존재하지 않는 토큰입니다. 다시 로그인 해주십시오"
+
+        response.data = error_payload
+    return response
+
+
+def get_benchmark_exceptions():
+    return {
+        "400 validation": lambda: ValidationError(
+            {
+                "nickname": ["Duplicate nickname"],
+                "email": ["Enter a valid email address."],
+            }
+        ),
+        "422 standard": lambda: StandardException(422, ugettext_lazy("Incorrect Code")),
+    }
+
+
+class Command(BaseCommand):
+    """
+    에러 응답(custom_exception_handler) microbenchmark
+
+    - 자주 발생하는 400 / 422 에러를 handler로 처리하고 JSON bytes로 만드는 시간 비교
+      (이전 handler는 JSONRenderer로 변환)
+    - 예시: `python manage.py benchmark_exception_handler --number 20000`
+    """
+
+    help = (
+        "Compare error response latency of the previous and current exception handler"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--number",
+            type=int,
+            default=20000,
+            help="Errors handled per case",
+        )
+
+    def measure(self, name, render, make_exception, number):
+        render(make_exception())
+        seconds = timeit.timeit(lambda: render(make_exception()), number=number)
+        per_call_us = seconds / number * 1e6
+        self.stdout.write(f"{name:<40} {per_call_us:12.1f} us/error")
+        return per_call_us
+
+    def handle(self, *args, **options):
+        renderer = JSONRenderer()
+
+        def render_previous(exc):
+            return renderer.render(previous_exception_handler(exc, {}).data)
+
+        def render_current(exc):
+            return custom_exception_handler(exc, {}).rendered_content
+
+        with translation.override("ko"):
+            for case, make_exception in get_benchmark_exceptions().items():
+                before = self.measure(
+                    f"{case} (previous)",
+                    render_previous,
+                    make_exception,
+                    options["number"],
+                )
+                after = self.measure(
+                    f"{case} (current)",
+                    render_current,
+                    make_exception,
+                    options["number"],
+                )
+                self.stdout.write(
+                    self.style.SUCCESS(f"{case}: {before / after:.1f}x faster")
+                )
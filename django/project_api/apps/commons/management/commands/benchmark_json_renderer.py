@@ -0,0 +1,126 @@
+import io
+import json
+import timeit
+from datetime import datetime, time, timedelta
+
+from project_api.parsers import ORJSONParser
+from project_api.renderers import ORJSONRenderer
+from commons.serializers import CountryCodeSerializer
+from exercises.serializers import (
+    ExerciseDetailRecordSerializer,
+    ExerciseRecordSerializer,
+)
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from django.core.management.base import BaseCommand
+
+
+def get_exercise_detail_payload(samples):
+    """운동기록 상세 조회(ExerciseRecordView) 응답과 같은 형식 (1초마다 기록한 샘플)"""
+    start_datetime = datetime(2022, 12, 19, 11, 27, 55, 351813)
+    data = ExerciseRecordSerializer(
+        {
+            "id": 1,
+            "start_datetime": start_datetime,
+            "total_distance": samples * 2.8,
+            "total_time": time(1, 0, 0),
+            "average_speed": 10.08,
+            "total_calories": 612.5,
+            "user": {"id": 1, "nickname": "runner"},
+        }
+    ).data
+    data["detail"] = ExerciseDetailRecordSerializer(
+        [
+            {
+                "start_time": start_datetime + timedelta(seconds=index),
+                "duration": index,
+                "distance": index * 2.8,
+                "heart_rate": 120 + index % 40,
+                "altitude": 35.2 + index % 7,
+                "latitude": 37.5665 + index * 0.00001,
+                "longitude": 126.978 + index * 0.00001,
+                "speed": 10.08,
+            }
+            for index in range(samples)
+        ],
+        many=True,
+    ).data
+    return data
+
+
+def get_country_code_payload(count):
+    """국가 코드 조회(CountryCodeView) 응답과 같은 형식"""
+    return CountryCodeSerializer(
+        [
+            {"id": index, "name": f"대한민국 {index}", "code": f"+{index}"}
+            for index in range(1, count + 1)
+        ],
+        many=True,
+    ).data
+
+
+class Command(BaseCommand):
+    """
+    JSON renderer / parser microbenchmark
+
+    - DRF 기본 JSONRenderer / JSONParser와 orjson renderer / parser(project_api.renderers, parsers)의 시간 비교
+    - 운동기록 상세 조회 / 국가 코드 조회 응답 렌더링과 운동기록 저장 요청 body 파싱
+    - 예시: `python manage.py benchmark_json_renderer --samples 3600 --number 50`
+    """
+
+    help = "Compare DRF's JSON renderer/parser with the orjson renderer/parser"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--samples",
+            type=int,
+            default=3600,
+            help="Detail samples in the exercise record payload",
+        )
+        parser.add_argument(
+            "--number",
+            type=int,
+            default=50,
+            help="Repetitions per measurement",
+        )
+
+    def measure(self, name, function, number):
+        function()
+        seconds = timeit.timeit(function, number=number)
+        per_call_us = seconds / number * 1e6
+        self.stdout.write(f"{name:<45} {per_call_us:12.1f} us")
+        return per_call_us
+
+    def compare(self, name, default_function, orjson_function, number):
+        before = self.measure(f"{name} (DRF)", default_function, number)
+        after = self.measure(f"{name} (orjson)", orjson_function, number)
+        self.stdout.write(self.style.SUCCESS(f"{name}: {before / after:.1f}x faster"))
+
+    def handle(self, *args, **options):
+        number = options["number"]
+        default_renderer = JSONRenderer()
+        orjson_renderer = ORJSONRenderer()
+
+        for name, payload, payload_number in (
+            (
+                "render exercise detail",
+                get_exercise_detail_payload(options["samples"]),
+                number,
+            ),
+            ("render country codes", get_country_code_payload(240), number * 20),
+        ):
+            self.compare(
+                name,
+                lambda: default_renderer.render(payload),
+                lambda: orjson_renderer.render(payload),
+                payload_number,
+            )
+
+        body = json.dumps(get_exercise_detail_payload(options["samples"])).encode()
+        self.compare(
+            "parse exercise record body",
+            lambda: JSONParser().parse(io.BytesIO(body), parser_context={}),
+            lambda: ORJSONParser().parse(io.BytesIO(body), parser_context={}),
+            number,
+        )
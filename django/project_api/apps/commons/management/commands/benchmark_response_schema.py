@@ -0,0 +1,107 @@
+import timeit
+from datetime import datetime, time, timedelta
+
+from commons.serializers import CountryCodeSerializer, country_code_schema
+from exercises.serializers import (
+    ExerciseDetailRecordSerializer,
+    ExerciseRecordSerializer,
+    exercise_detail_record_schema,
+    exercise_record_schema,
+)
+
+from django.core.management.base import BaseCommand
+
+
+def get_exercise_record(samples):
+    """운동기록 상세 조회(ExerciseRecordView)에서 변환하는 데이터 (1초마다 기록한 샘플)"""
+    start_datetime = datetime(2022, 12, 19, 11, 27, 55, 351813)
+    record = {
+        "id": 1,
+        "start_datetime": start_datetime,
+        "total_distance": samples * 2.8,
+        "total_time": time(1, 0, 0),
+        "average_speed": 10.08,
+        "total_calories": 612.5,
+        "user": {"id": 1, "nickname": "runner"},
+    }
+    details = [
+        {
+            "start_time": start_datetime + timedelta(seconds=index),
+            "duration": index,
+            "distance": index * 2.8,
+            "heart_rate": 120 + index % 40,
+            "altitude": 35.2 + index % 7,
+            "latitude": 37.5665 + index * 0.00001,
+            "longitude": 126.978 + index * 0.00001,
+            "speed": 10.08,
+        }
+        for index in range(samples)
+    ]
+    return record, details
+
+
+class Command(BaseCommand):
+    """
+    응답 serializer / ResponseSchema microbenchmark
+
+    - serializer(...).data와 ResponseSchema(project_api.response_schema) encode의 시간 비교
+    - 운동기록 상세 조회 / 국가 코드 조회 응답 데이터 변환
+    - 예시: `python manage.py benchmark_response_schema --samples 3600 --number 20`
+    """
+
+    help = "Compare serializer .data with the compiled response schemas"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--samples",
+            type=int,
+            default=3600,
+            help="Detail samples in the exercise record",
+        )
+        parser.add_argument(
+            "--number",
+            type=int,
+            default=20,
+            help="Repetitions per measurement",
+        )
+
+    def measure(self, name, function, number):
+        function()
+        seconds = timeit.timeit(function, number=number)
+        per_call_us = seconds / number * 1e6
+        self.stdout.write(f"{name:<45} {per_call_us:12.1f} us")
+        return per_call_us
+
+    def compare(self, name, serializer_function, schema_function, number):
+        if serializer_function() != schema_function():
+            raise AssertionError(f"{name}: output is different")
+        before = self.measure(f"{name} (serializer)", serializer_function, number)
+        after = self.measure(f"{name} (schema)", schema_function, number)
+        self.stdout.write(self.style.SUCCESS(f"{name}: {before / after:.1f}x faster"))
+
+    def handle(self, *args, **options):
+        number = options["number"]
+        record, details = get_exercise_record(options["samples"])
+        self.compare(
+            "exercise record",
+            lambda: ExerciseRecordSerializer(record).data,
+            lambda: exercise_record_schema.encode(record),
+            number * 100,
+        )
+        self.compare(
+            "exercise detail",
+            lambda: ExerciseDetailRecordSerializer(details, many=True).data,
+            lambda: exercise_detail_record_schema.encode_many(details),
+            number,
+        )
+
+        country_codes = [
+            {"id": index, "name": f"대한민국 {index}", "code": f"+{index}"}
+            for index in range(1, 241)
+        ]
+        self.compare(
+            "country codes",
+            lambda: CountryCodeSerializer(country_codes, many=True).data,
+            lambda: country_code_schema.encode_many(country_codes),
+            number * 20,
+        )
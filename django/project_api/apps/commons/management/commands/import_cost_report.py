@@ -0,0 +1,54 @@
+from project_api.import_cost import (
+    get_package_costs,
+    get_total_import_time,
+    measure_import_cost,
+)
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    """
+    서버 시작 시 import 비용을 모듈 / 패키지별로 보여주는 커맨드
+
+    - 새 프로세스에서 --module(기본 project_api.wsgi = gunicorn worker 시작과 같음)을 import 하면서 측정
+    - 예시: `python manage.py import_cost_report --limit 30`
+    """
+
+    help = "Report per-module import cost of a fresh process importing the app"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--module",
+            default="project_api.wsgi",
+            help="Module to import in the measured process",
+        )
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=20,
+            help="Number of rows shown in each table",
+        )
+
+    def handle(self, *args, **options):
+        costs = measure_import_cost(options["module"], cwd=settings.BASE_DIR)
+        limit = options["limit"]
+
+        self.stdout.write(
+            f"Importing {options['module']}: {get_total_import_time(costs) / 1000:.1f} ms, "
+            f"{len(costs)} modules"
+        )
+
+        self.stdout.write("\nSlowest modules (cumulative ms / self ms):")
+        for cost in sorted(costs, key=lambda cost: cost.cumulative_us, reverse=True)[
+            :limit
+        ]:
+            self.stdout.write(
+                f"{cost.cumulative_us / 1000:10.1f} {cost.self_us / 1000:10.1f}  "
+                f"{'  ' * cost.depth}{cost.module}"
+            )
+
+        self.stdout.write("\nSlowest packages (self ms):")
+        for package, self_us in get_package_costs(costs)[:limit]:
+            self.stdout.write(f"{self_us / 1000:10.1f}  {package}")
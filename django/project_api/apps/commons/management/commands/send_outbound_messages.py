@@ -0,0 +1,69 @@
+import time
+
+from commons.outbound import (
+    OUTBOUND_MESSAGE_BATCH_SIZE,
+    OUTBOUND_MESSAGE_MAX_ATTEMPTS,
+    get_outbound_message_transport,
+    send_outbound_messages,
+)
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+
+class Command(BaseCommand):
+    """
+    외부 발송 대기열(OutboundMessage)의 이메일 / 문자를 발송하는 worker 커맨드
+
+    - 기본은 계속 실행하면서 대기 중인 메시지가 없으면 --interval초 동안 쉬었다가 다시 확인
+    - --once 옵션을 주면 현재 대기 중인 메시지만 발송하고 종료 (cron / 테스트용)
+    - 예시: `python manage.py send_outbound_messages --batch-size 50 --interval 1`
+    """
+
+    help = "Send queued SES emails and SNS text messages"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=OUTBOUND_MESSAGE_BATCH_SIZE,
+            help="Number of messages claimed per transaction",
+        )
+        parser.add_argument(
+            "--max-attempts",
+            type=int,
+            default=OUTBOUND_MESSAGE_MAX_ATTEMPTS,
+            help="Mark a message as failed after this many attempts",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=1.0,
+            help="Seconds to sleep when the queue is empty",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Send the messages that are due now and exit",
+        )
+
+    def handle(self, *args, **options):
+        transport = get_outbound_message_transport()
+        total = 0
+
+        while True:
+            count = send_outbound_messages(
+                transport,
+                batch_size=options["batch_size"],
+                max_attempts=options["max_attempts"],
+            )
+            total += count
+
+            if count < options["batch_size"]:
+                if options["once"]:
+                    break
+                time.sleep(options["interval"])
+                # 오래 실행되는 프로세스라 끊어졌거나 오래된 DB 연결은 정리
+                close_old_connections()
+
+        self.stdout.write(self.style.SUCCESS(f"Processed {total} outbound messages"))
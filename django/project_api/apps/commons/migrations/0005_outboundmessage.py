@@ -0,0 +1,75 @@
+# Generated by Django 3.2.12 on 2026-10-18 21:46
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("commons", "0004_auto_20230103_0807"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="OutboundMessage",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "channel",
+                    models.CharField(
+                        choices=[("email", "이메일(SES)"), ("sms", "문자(SNS)")],
+                        max_length=10,
+                        verbose_name="발송 채널",
+                    ),
+                ),
+                ("recipient", models.CharField(max_length=255, verbose_name="수신자")),
+                (
+                    "subject",
+                    models.CharField(blank=True, max_length=255, verbose_name="제목"),
+                ),
+                ("body", models.TextField(verbose_name="내용")),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "발송 대기"),
+                            ("sent", "발송 완료"),
+                            ("failed", "발송 실패"),
+                        ],
+                        default="pending",
+                        max_length=10,
+                        verbose_name="발송 상태",
+                    ),
+                ),
+                (
+                    "attempts",
+                    models.PositiveSmallIntegerField(
+                        default=0, verbose_name="발송 시도 횟수"
+                    ),
+                ),
+                (
+                    "next_attempt_at",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now, verbose_name="다음 발송 시도 시간"
+                    ),
+                ),
+                ("last_error", models.TextField(blank=True, verbose_name="마지막 에러")),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("sent_at", models.DateTimeField(null=True)),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name="outboundmessage",
+            index=models.Index(
+                fields=["status", "next_attempt_at"], name="outbound_message_queue_idx"
+            ),
+        ),
+    ]
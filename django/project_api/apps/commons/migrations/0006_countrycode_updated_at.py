@@ -0,0 +1,21 @@
+# Generated by Django 3.2.12 on 2026-10-19 09:12
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("commons", "0005_outboundmessage"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="countrycode",
+            name="updated_at",
+            field=models.DateTimeField(
+                auto_now=True, default=django.utils.timezone.now
+            ),
+            preserve_default=False,
+        ),
+    ]
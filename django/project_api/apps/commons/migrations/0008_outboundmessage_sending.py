@@ -0,0 +1,27 @@
+# Generated by Django 3.2.12 on 2026-10-19 10:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("commons", "0007_appversion_updated_at"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="outboundmessage",
+            name="status",
+            field=models.CharField(
+                choices=[
+                    ("pending", "발송 대기"),
+                    ("sending", "발송 중"),
+                    ("sent", "발송 완료"),
+                    ("failed", "발송 실패"),
+                ],
+                default="pending",
+                max_length=10,
+                verbose_name="발송 상태",
+            ),
+        ),
+    ]
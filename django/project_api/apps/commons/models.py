@@ -1,6 +1,7 @@
 import binascii
 
 from django.db import models
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 
@@ -56,9 +57,68 @@ class AppVersion(models.Model):
     msg = models.CharField(verbose_name="강제 업데이트시 얼럿 메시지", max_length=100)
     store_url = models.CharField(verbose_name="스토어 URL", max_length=255)
     created_at = models.DateTimeField(auto_now_add=True)
+    # 캐시한 버전 정보 응답이 최신인지 확인하는 용도 (commons.utils.get_queryset_version)
+    updated_at = models.DateTimeField(auto_now=True)
 
 
 class CountryCode(models.Model):
     country_en_name = models.CharField(verbose_name="영문 국가명", max_length=100)
     country_ko_name = models.CharField(verbose_name="한글 국가명", max_length=100)
     code = models.CharField(verbose_name="국가 코드", max_length=10)
+    # 캐시한 국가 코드 응답이 최신인지 확인하는 용도 (commons.utils.get_queryset_version)
+    updated_at = models.DateTimeField(auto_now=True)
+
+
+class OutboundMessageChannel(models.TextChoices):
+    """외부 발송 채널"""
+
+    EMAIL = "email", "이메일(SES)"
+    SMS = "sms", "문자(SNS)"
+
+
+class OutboundMessageStatus(models.TextChoices):
+    """외부 발송 상태"""
+
+    PENDING = "pending", "발송 대기"
+    SENDING = "sending", "발송 중"
+    SENT = "sent", "발송 완료"
+    FAILED = "failed", "발송 실패"
+
+
+class OutboundMessage(models.Model):
+    """
+    외부 발송(이메일 / 문자) 대기열
+    - API에서는 저장만 하고 send_outbound_messages 커맨드(worker)에서 발송
+    """
+
+    channel = models.CharField(
+        verbose_name="발송 채널",
+        max_length=10,
+        choices=OutboundMessageChannel.choices,
+    )
+    recipient = models.CharField(verbose_name="수신자", max_length=255)
+    subject = models.CharField(verbose_name="제목", max_length=255, blank=True)
+    body = models.TextField(verbose_name="내용")
+    status = models.CharField(
+        verbose_name="발송 상태",
+        max_length=10,
+        choices=OutboundMessageStatus.choices,
+        default=OutboundMessageStatus.PENDING,
+    )
+    attempts = models.PositiveSmallIntegerField(verbose_name="발송 시도 횟수", default=0)
+    # 발송 중(SENDING)인 메시지는 worker가 발송을 끝내야 하는 시간 (지나면 다른 worker가 다시 발송)
+    next_attempt_at = models.DateTimeField(
+        verbose_name="다음 발송 시도 시간", default=timezone.now
+    )
+    last_error = models.TextField(verbose_name="마지막 에러", blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True)
+
+    class Meta:
+        # worker에서 발송할 메시지를 조회하기 위한 인덱스
+        indexes = [
+            models.Index(
+                fields=["status", "next_attempt_at"],
+                name="outbound_message_queue_idx",
+            ),
+        ]
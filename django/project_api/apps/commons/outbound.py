@@ -0,0 +1,223 @@
+# commons/outbound.py
+"""outbound 모듈 설명
+
+이메일(SES) / 문자(SNS) 외부 발송 대기열 모듈
+
+- API에서는 enqueue_email() / enqueue_sms()로 OutboundMessage만 저장하고 바로 응답
+- send_outbound_messages 커맨드(worker)가 batch 단위로 가져와서 발송
+- 발송할 메시지는 짧은 트랜잭션에서 발송 중(SENDING) 상태로 가져오고(claim), 외부 발송은 트랜잭션 밖에서 실행
+    - 발송하는 동안 DB 연결 / row lock을 잡고 있지 않음
+    - 발송 중에 worker가 죽으면 OUTBOUND_MESSAGE_LEASE_TIMEOUT 후에 다른 worker가 다시 발송 (최소 1회 발송)
+- 발송에 실패하면 지수적으로 늘어나는 간격(backoff)으로 재시도하고, 최대 횟수를 넘으면 실패 처리
+- 실제 발송은 settings.OUTBOUND_MESSAGE_TRANSPORT에 설정한 transport에서 처리
+    - AWSMessageTransport: SES / SNS로 발송 (production)
+    - LocalMessageTransport: 발송하지 않고 로그로 남기고 최근 메시지만 outbox에 저장 (로컬 / 테스트)
+"""
+import logging
+import random
+from collections import deque
+from datetime import timedelta
+from typing import Final
+
+from project_api.aws_clients import get_aws_client
+from project_api.utils import (
+    AWS_SES_REGION,
+    AWS_SNS_REGION,
+    get_ses_email_kwargs,
+    get_sns_sms_kwargs,
+)
+from commons.models import (
+    OutboundMessage,
+    OutboundMessageChannel,
+    OutboundMessageStatus,
+)
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+OUTBOUND_MESSAGE_BATCH_SIZE: Final = 50
+OUTBOUND_MESSAGE_MAX_ATTEMPTS: Final = 5
+# 재시도 간격(초) = min(BASE * 2 ** (시도 횟수 - 1), MAX) + jitter
+OUTBOUND_MESSAGE_BACKOFF_BASE: Final = 10
+OUTBOUND_MESSAGE_BACKOFF_MAX: Final = 60 * 30
+# 발송 중(SENDING) 상태를 유지하는 시간(초), 지나면 worker가 죽은 것으로 보고 다시 발송
+# - batch 하나를 발송하는 시간보다 충분히 길게 설정
+OUTBOUND_MESSAGE_LEASE_TIMEOUT: Final = 60 * 5
+
+
+class AWSMessageTransport:
+    """
+    SES / SNS 발송
+    - boto3 client는 project_api.aws_clients에서 프로세스마다 한번만 만들어서 재사용
+    """
+
+    @property
+    def ses_client(self):
+        return get_aws_client("ses", region_name=AWS_SES_REGION)
+
+    @property
+    def sns_client(self):
+        return get_aws_client("sns", region_name=AWS_SNS_REGION)
+
+    def send(self, message):
+        if message.channel == OutboundMessageChannel.EMAIL:
+            self.ses_client.send_email(
+                **get_ses_email_kwargs(message.recipient, message.subject, message.body)
+            )
+        elif message.channel == OutboundMessageChannel.SMS:
+            self.sns_client.publish(
+                **get_sns_sms_kwargs(message.recipient, message.body)
+            )
+        else:
+            raise ValueError(f"Unknown outbound message channel: {message.channel}")
+
+
+# LocalMessageTransport로 "발송"한 메시지를 저장하는 최대 개수
+LOCAL_OUTBOX_MAX_SIZE: Final = 100
+
+# LocalMessageTransport로 "발송"한 최근 메시지 (django.core.mail.outbox와 같은 용도)
+# - 로컬 서버를 오래 실행해도 메모리가 계속 늘어나지 않도록 최근 LOCAL_OUTBOX_MAX_SIZE개만 유지
+outbox = deque(maxlen=LOCAL_OUTBOX_MAX_SIZE)
+
+
+class LocalMessageTransport:
+    """실제로 발송하지 않고 로그로 남기고 outbox에 저장 (로컬 / 테스트용)"""
+
+    def send(self, message):
+        outbox.append(
+            {
+                "channel": message.channel,
+                "recipient": message.recipient,
+                "subject": message.subject,
+                "body": message.body,
+            }
+        )
+        logger.info(
+            "Outbound %s to %s: %s", message.channel, message.recipient, message.body
+        )
+
+
+def get_outbound_message_transport():
+    return import_string(settings.OUTBOUND_MESSAGE_TRANSPORT)()
+
+
+def enqueue_email(recipient, subject, body_html):
+    return OutboundMessage.objects.create(
+        channel=OutboundMessageChannel.EMAIL,
+        recipient=recipient,
+        subject=subject,
+        body=body_html,
+    )
+
+
+def enqueue_sms(phone_number, message):
+    return OutboundMessage.objects.create(
+        channel=OutboundMessageChannel.SMS,
+        recipient=phone_number,
+        body=message,
+    )
+
+
+def get_retry_delay(attempts):
+    delay = min(
+        OUTBOUND_MESSAGE_BACKOFF_BASE * 2 ** (attempts - 1),
+        OUTBOUND_MESSAGE_BACKOFF_MAX,
+    )
+    # 여러 메시지가 같은 시간에 다시 몰리지 않도록 최대 10% 랜덤하게 늘림
+    return timedelta(seconds=delay * (1 + random.random() * 0.1))
+
+
+def claim_outbound_messages(batch_size, max_attempts):
+    """
+    발송할 시간이 된 메시지를 batch_size개까지 발송 중(SENDING) 상태로 변경해서 반환
+    - select_for_update(skip_locked)로 가져오기 때문에 여러 worker를 동시에 실행해도 같은 메시지를 가져가지 않음
+    - 발송 중 상태에서 lease(next_attempt_at)가 만료된 메시지도 다시 가져옴
+    """
+    now = timezone.now()
+
+    with transaction.atomic():
+        # 발송 중에 worker가 죽은 메시지가 최대 횟수를 넘었으면 다시 발송하지 않음
+        OutboundMessage.objects.filter(
+            status=OutboundMessageStatus.SENDING,
+            next_attempt_at__lte=now,
+            attempts__gte=max_attempts,
+        ).update(status=OutboundMessageStatus.FAILED, last_error="Lease expired")
+
+        messages = list(
+            OutboundMessage.objects.select_for_update(skip_locked=True)
+            .filter(
+                status__in=[
+                    OutboundMessageStatus.PENDING,
+                    OutboundMessageStatus.SENDING,
+                ],
+                next_attempt_at__lte=now,
+            )
+            .order_by("next_attempt_at", "id")[:batch_size]
+        )
+
+        for message in messages:
+            message.status = OutboundMessageStatus.SENDING
+            message.attempts += 1
+            message.next_attempt_at = now + timedelta(
+                seconds=OUTBOUND_MESSAGE_LEASE_TIMEOUT
+            )
+
+        OutboundMessage.objects.bulk_update(
+            messages, ["status", "attempts", "next_attempt_at"]
+        )
+
+    return messages
+
+
+def send_outbound_messages(
+    transport,
+    batch_size=OUTBOUND_MESSAGE_BATCH_SIZE,
+    max_attempts=OUTBOUND_MESSAGE_MAX_ATTEMPTS,
+):
+    """
+    발송할 시간이 된 메시지를 batch_size개까지 가져와서 발송
+    - 가져온 뒤 트랜잭션 밖에서 발송하고, 메시지마다 결과를 저장
+    - lease가 만료되어 다른 worker가 다시 가져간 메시지는 결과를 저장하지 않음
+    - 처리한 메시지 개수를 반환
+    """
+    messages = claim_outbound_messages(batch_size, max_attempts)
+
+    for message in messages:
+        try:
+            transport.send(message)
+        except Exception as e:
+            logger.warning(
+                "Outbound message %s failed (attempt %s): %s",
+                message.id,
+                message.attempts,
+                e,
+            )
+            result = {"last_error": str(e)}
+            if message.attempts >= max_attempts:
+                result["status"] = OutboundMessageStatus.FAILED
+            else:
+                result["status"] = OutboundMessageStatus.PENDING
+                result["next_attempt_at"] = timezone.now() + get_retry_delay(
+                    message.attempts
+                )
+        else:
+            result = {
+                "status": OutboundMessageStatus.SENT,
+                "sent_at": timezone.now(),
+            }
+
+        is_updated = OutboundMessage.objects.filter(
+            pk=message.pk,
+            status=OutboundMessageStatus.SENDING,
+            attempts=message.attempts,
+        ).update(**result)
+        if not is_updated:
+            logger.warning(
+                "Outbound message %s was reclaimed after its lease expired", message.id
+            )
+
+    return len(messages)
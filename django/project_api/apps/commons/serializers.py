@@ -1,3 +1,4 @@
+from project_api.response_schema import ResponseSchema
 from rest_framework import serializers
 
 from .models import AppVersion, UploadedImage
@@ -43,3 +44,17 @@ class CountryCodeSerializer(serializers.Serializer):
     id = serializers.IntegerField(required=False)
     name = serializers.CharField(required=False)
     code = serializers.CharField(required=False)
+
+
+class AWSClientCountSerializer(serializers.Serializer):
+    created = serializers.IntegerField()
+    reused = serializers.IntegerField()
+    pool_size = serializers.IntegerField()
+
+
+class AWSClientMetricsSerializer(serializers.Serializer):
+    pid = serializers.IntegerField()
+    clients = serializers.DictField(child=AWSClientCountSerializer())
+
+
+country_code_schema = ResponseSchema(CountryCodeSerializer)
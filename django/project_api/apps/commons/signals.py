@@ -0,0 +1,13 @@
+# commons/signals.py
+from commons.models import AppVersion
+from commons.utils import invalidate_app_version_state
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+
+@receiver(post_save, sender=AppVersion)
+@receiver(post_delete, sender=AppVersion)
+def invalidate_app_version_state_on_change(sender, instance, **kwargs):
+    """관리자 페이지 등에서 버전 정보가 추가 / 수정 / 삭제된 경우"""
+    invalidate_app_version_state()
@@ -1,3 +1,635 @@
-from django.test import TestCase
+import datetime
+import decimal
+import json
+import os
+import tempfile
+import uuid
+from io import BytesIO, StringIO
 
-# Create your tests here.
+from conftest import unauthorized_after_login
+from project_api import aws_clients, firebase
+from project_api.custom_exception_handler import (
+    HTTP_STATUS_MESSAGES,
+    UNAUTHORIZED_MESSAGE,
+    custom_exception_handler,
+)
+from project_api.import_cost import (
+    get_package_costs,
+    get_total_import_time,
+    parse_import_time,
+)
+from project_api.parsers import ORJSONParser
+from project_api.renderers import ORJSONRenderer
+from project_api.response_schema import ResponseSchema
+from project_api.utils import StandardException
+from commons import outbound
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from commons.models import (
+    AppVersion,
+    CountryCode,
+    OutboundMessage,
+    OutboundMessageStatus,
+)
+from commons.serializers import CountryCodeSerializer, country_code_schema
+from commons.utils import APP_VERSION_STATE_CACHE_KEY
+from exercises.serializers import ExerciseRecordSerializer
+from rest_framework import serializers, status
+from rest_framework.exceptions import ParseError, Throttled, ValidationError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+from users.models import Gender, User
+
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import call_command
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import translation
+from django.utils.translation import ugettext_lazy
+
+
+class FailingMessageTransport:
+    def send(self, message):
+        raise ConnectionError("transport unavailable")
+
+
+class StatusRecordingMessageTransport:
+    """발송하는 시점에 DB에 저장된 메시지 상태를 기록"""
+
+    def __init__(self):
+        self.statuses = []
+
+    def send(self, message):
+        self.statuses.append(OutboundMessage.objects.get(pk=message.pk).status)
+
+
+class CommonsTest(APITestCase):
+    def setUp(self):
+        cache.clear()
+        outbound.outbox.clear()
+
+    def tearDown(self):
+        cache.clear()
+
+    @override_settings(AUTH_TOKEN_CACHE={"CACHE": "default"})
+    def test_country_code(self):
+        """국가 코드 조회 / 캐시 / 304 응답 테스트"""
+
+        country_code_url = reverse("countrycode")
+        response = self.client.get(country_code_url)
+        unauthorized_after_login(self, response)
+
+        response = self.client.get(country_code_url, HTTP_ACCEPT_LANGUAGE="ko")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        country_code = CountryCode.objects.order_by("id").first()
+        self.assertEqual(response.json()[0]["name"], country_code.country_ko_name)
+        self.assertIn("Accept-Language", response["Vary"])
+        etag = response["ETag"]
+
+        response = self.client.get(country_code_url, HTTP_ACCEPT_LANGUAGE="en")
+        self.assertEqual(response.json()[0]["name"], country_code.country_en_name)
+        self.assertNotEqual(response["ETag"], etag)
+
+        # 캐시된 응답은 DB 상태(개수 / 마지막 수정 시간)만 조회하고 304 응답
+        with self.assertNumQueries(1):
+            response = self.client.get(
+                country_code_url, HTTP_ACCEPT_LANGUAGE="ko", HTTP_IF_NONE_MATCH=etag
+            )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        last_modified = response["Last-Modified"]
+
+        # 국가 코드가 수정되면 캐시를 삭제하지 않아도 (다른 worker의 캐시) 새로운 응답
+        # - Last-Modified가 바뀌는지 확인하기 위해 수정 시간을 1초 뒤로 직접 지정
+        country_code.country_ko_name = "대한민국"
+        country_code.updated_at = datetime.datetime.now() + datetime.timedelta(
+            seconds=1
+        )
+        CountryCode.objects.bulk_update(
+            [country_code], ["country_ko_name", "updated_at"]
+        )
+        response = self.client.get(
+            country_code_url, HTTP_ACCEPT_LANGUAGE="ko", HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()[0]["name"], "대한민국")
+        self.assertNotEqual(response["Last-Modified"], last_modified)
+
+        # 국가 코드가 삭제된 경우 (수정 시간은 그대로, 개수만 바뀜)
+        etag = response["ETag"]
+        last_country_code = CountryCode.objects.order_by("id").last()
+        CountryCode.objects.filter(pk=last_country_code.pk).delete()
+        response = self.client.get(
+            country_code_url, HTTP_ACCEPT_LANGUAGE="ko", HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn(last_country_code.id, [item["id"] for item in response.json()])
+        self.client.credentials(HTTP_AUTHORIZATION=None)
+
+    def test_app_version(self):
+        """앱 버전 조회 / 필터별 캐시 / 304 응답 테스트"""
+
+        app_version = AppVersion.objects.create(
+            device_type=AppVersion.DeviceType.AOS,
+            server_type=AppVersion.ServerType.LIVE,
+            version="1.0.0",
+            msg="update",
+            store_url="market://details?id=com.popprika.project",
+        )
+        AppVersion.objects.create(
+            device_type=AppVersion.DeviceType.IOS,
+            server_type=AppVersion.ServerType.LIVE,
+            version="1.0.0",
+            msg="update",
+            store_url="itms-apps://itunes.apple.com/app/id1526117893",
+        )
+
+        app_version_url = reverse("app-version")
+        response = self.client.get(app_version_url, {"device_type": "aos"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.json()), 1)
+        etag = response["ETag"]
+
+        response = self.client.get(app_version_url)
+        self.assertEqual(len(response.json()), 2)
+        self.assertNotEqual(response["ETag"], etag)
+
+        # 캐시된 응답은 DB 조회 없이 304 응답
+        with self.assertNumQueries(0):
+            response = self.client.get(
+                app_version_url, {"device_type": "aos"}, HTTP_IF_NONE_MATCH=etag
+            )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        # 버전 정보가 수정되면 signal로 캐시된 DB 상태를 삭제해서 새로운 응답
+        app_version.version = "1.0.1"
+        app_version.force_update = True
+        app_version.save()
+        response = self.client.get(
+            app_version_url, {"device_type": "aos"}, HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()[0]["version"], "1.0.1")
+        self.assertTrue(response.json()[0]["force_update"])
+        etag = response["ETag"]
+
+        # signal이 발생하지 않는 수정은 캐시된 DB 상태가 만료된 뒤 반영
+        AppVersion.objects.filter(pk=app_version.pk).update(
+            version="1.0.2",
+            updated_at=datetime.datetime.now() + datetime.timedelta(seconds=1),
+        )
+        response = self.client.get(
+            app_version_url, {"device_type": "aos"}, HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        cache.delete(APP_VERSION_STATE_CACHE_KEY)
+        response = self.client.get(
+            app_version_url, {"device_type": "aos"}, HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()[0]["version"], "1.0.2")
+
+        # 버전 정보가 삭제된 경우
+        app_version.delete()
+        response = self.client.get(app_version_url, {"device_type": "aos"})
+        self.assertEqual(response.json(), [])
+
+        response = self.client.get(app_version_url, {"device_type": "windows"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @override_settings(
+        OUTBOUND_MESSAGE_TRANSPORT="commons.outbound.LocalMessageTransport"
+    )
+    def test_outbound_message_queue(self):
+        """이메일 / 문자 발송 대기열 / worker 발송 테스트"""
+
+        response = self.client.post(
+            reverse("email-verification-send"),
+            {"type": "sign_up", "email": "las@popprika.com"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        # API에서는 저장만 하고 발송하지 않음
+        message = OutboundMessage.objects.get()
+        self.assertEqual(message.status, OutboundMessageStatus.PENDING)
+        self.assertEqual(message.recipient, "las@popprika.com")
+        self.assertEqual(len(outbound.outbox), 0)
+
+        call_command("send_outbound_messages", "--once", stdout=StringIO())
+
+        message.refresh_from_db()
+        self.assertEqual(message.status, OutboundMessageStatus.SENT)
+        self.assertEqual(message.attempts, 1)
+        self.assertEqual(len(outbound.outbox), 1)
+        self.assertIn(response.data["code"], outbound.outbox[0]["body"])
+
+    def test_outbound_message_retry(self):
+        """발송 실패시 재시도 / 최대 횟수 초과시 실패 처리 테스트"""
+
+        message = outbound.enqueue_sms("+821012345678", "code")
+
+        outbound.send_outbound_messages(FailingMessageTransport(), max_attempts=2)
+        message.refresh_from_db()
+        self.assertEqual(message.status, OutboundMessageStatus.PENDING)
+        self.assertEqual(message.attempts, 1)
+        self.assertGreater(message.next_attempt_at, message.created_at)
+        self.assertIn("transport unavailable", message.last_error)
+
+        # backoff 시간 전에는 다시 발송하지 않음
+        self.assertEqual(
+            outbound.send_outbound_messages(FailingMessageTransport(), max_attempts=2),
+            0,
+        )
+
+        OutboundMessage.objects.filter(pk=message.pk).update(
+            next_attempt_at=message.created_at
+        )
+        outbound.send_outbound_messages(FailingMessageTransport(), max_attempts=2)
+        message.refresh_from_db()
+        self.assertEqual(message.status, OutboundMessageStatus.FAILED)
+        self.assertEqual(message.attempts, 2)
+
+    def test_outbound_message_lease(self):
+        """발송 중 상태로 가져와서 트랜잭션 밖에서 발송 / worker가 죽은 경우 다시 발송 테스트"""
+
+        message = outbound.enqueue_sms("+821012345678", "code")
+
+        # 발송하는 동안 메시지는 발송 중 상태로 저장되어 있음
+        transport = StatusRecordingMessageTransport()
+
+        # 가져간 뒤 발송하지 못하고 worker가 죽은 경우 lease가 만료되기 전에는 다시 발송하지 않음
+        outbound.claim_outbound_messages(batch_size=10, max_attempts=2)
+        self.assertEqual(outbound.send_outbound_messages(transport, max_attempts=2), 0)
+
+        OutboundMessage.objects.filter(pk=message.pk).update(
+            next_attempt_at=message.created_at
+        )
+        self.assertEqual(outbound.send_outbound_messages(transport, max_attempts=2), 1)
+        self.assertEqual(transport.statuses, [OutboundMessageStatus.SENDING])
+        message.refresh_from_db()
+        self.assertEqual(message.status, OutboundMessageStatus.SENT)
+        self.assertEqual(message.attempts, 2)
+
+        # 최대 횟수만큼 가져갔는데 lease가 만료된 메시지는 실패 처리
+        message = outbound.enqueue_sms("+821012345678", "code")
+        outbound.claim_outbound_messages(batch_size=10, max_attempts=1)
+        OutboundMessage.objects.filter(pk=message.pk).update(
+            next_attempt_at=message.created_at
+        )
+        self.assertEqual(outbound.send_outbound_messages(transport, max_attempts=1), 0)
+        message.refresh_from_db()
+        self.assertEqual(message.status, OutboundMessageStatus.FAILED)
+        self.assertEqual(transport.statuses, [OutboundMessageStatus.SENDING])
+
+    @override_settings(AWS_CLIENT_POOL_SIZES={"default": 4, "ses": 7})
+    def test_aws_client_registry(self):
+        """AWS client 재사용 / connection pool 크기 / fork 후 초기화 테스트"""
+
+        aws_clients.reset_aws_clients()
+        ses_client = aws_clients.get_aws_client("ses", region_name="ap-northeast-2")
+        self.assertIs(
+            aws_clients.get_aws_client("ses", region_name="ap-northeast-2"),
+            ses_client,
+        )
+        self.assertIs(outbound.AWSMessageTransport().ses_client, ses_client)
+        self.assertEqual(ses_client.meta.config.max_pool_connections, 7)
+        self.assertTrue(ses_client.meta.config.tcp_keepalive)
+
+        sns_client = aws_clients.get_aws_client("sns", region_name="ap-northeast-1")
+        self.assertIsNot(sns_client, ses_client)
+        self.assertEqual(sns_client.meta.config.max_pool_connections, 4)
+
+        metrics = aws_clients.get_aws_client_metrics()
+        self.assertEqual(
+            metrics["ses:ap-northeast-2"], {"created": 1, "reused": 2, "pool_size": 7}
+        )
+        self.assertEqual(
+            metrics["sns:ap-northeast-1"], {"created": 1, "reused": 0, "pool_size": 4}
+        )
+
+        # S3 storage connection도 같이 기록
+        storage = aws_clients.PooledS3Boto3Storage(region_name="ap-northeast-2")
+        self.assertIs(storage.connection, storage.connection)
+        self.assertEqual(
+            aws_clients.get_aws_client_metrics()["s3:ap-northeast-2"],
+            {"created": 1, "reused": 1, "pool_size": 4},
+        )
+
+        # 관리자 계정만 API로 조회 가능
+        aws_client_metrics_url = reverse("aws-client-metrics")
+        response = self.client.get(aws_client_metrics_url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.client.force_authenticate(user=User.objects.all().first())
+        response = self.client.get(aws_client_metrics_url)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.client.force_authenticate(
+            user=User.objects.create_superuser(
+                user_code="aws-client-metrics-admin", username="aws-metrics-admin"
+            )
+        )
+        response = self.client.get(aws_client_metrics_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["pid"], os.getpid())
+        self.assertEqual(
+            response.data["clients"]["ses:ap-northeast-2"],
+            {"created": 1, "reused": 2, "pool_size": 7},
+        )
+        self.client.force_authenticate(user=None)
+
+        # 다른 스레드에서 비운 직후에 재사용해도 오류 없이 넘어감
+        aws_clients._metrics.clear()
+        aws_clients.count_aws_client("ses:ap-northeast-2")
+        self.assertEqual(aws_clients.get_aws_client_metrics(), {})
+
+        # fork된 자식 프로세스에서는 부모가 만든 client를 사용하지 않음
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            child_client = aws_clients.get_aws_client(
+                "ses", region_name="ap-northeast-2"
+            )
+            child_metrics = aws_clients.get_aws_client_metrics()
+            is_new_client = (
+                child_client is not ses_client
+                and child_metrics["ses:ap-northeast-2"]["reused"] == 0
+            )
+            os.write(write_fd, b"1" if is_new_client else b"0")
+            os._exit(0)
+
+        os.close(write_fd)
+        child_result = os.read(read_fd, 1)
+        os.close(read_fd)
+        os.waitpid(pid, 0)
+        self.assertEqual(child_result, b"1")
+        self.assertIs(
+            aws_clients.get_aws_client("ses", region_name="ap-northeast-2"),
+            ses_client,
+        )
+        aws_clients.reset_aws_clients()
+
+    def test_firebase_app_registry(self):
+        """Firebase app을 처음 사용할 때만 초기화하고 재사용하는지 테스트"""
+
+        private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        service_account = {
+            "type": "service_account",
+            "project_id": "project-test",
+            "private_key_id": "test",
+            "private_key": private_key.private_bytes(
+                serialization.Encoding.PEM,
+                serialization.PrivateFormat.PKCS8,
+                serialization.NoEncryption(),
+            ).decode(),
+            "client_email": "test@project-test.iam.gserviceaccount.com",
+            "client_id": "1",
+            "token_uri": "https://oauth2.googleapis.com/token",
+        }
+
+        with tempfile.NamedTemporaryFile("w", suffix=".json") as credentials_file:
+            json.dump(service_account, credentials_file)
+            credentials_file.flush()
+
+            with override_settings(
+                FIREBASE_APPS={"test": {"CREDENTIALS": credentials_file.name}}
+            ):
+                self.assertFalse(firebase.is_firebase_app_initialized("test"))
+                app = firebase.get_firebase_app("test")
+                self.assertTrue(firebase.is_firebase_app_initialized("test"))
+                self.assertIs(firebase.get_firebase_app("test"), app)
+                self.assertEqual(app.name, "test")
+                self.assertEqual(app.project_id, "project-test")
+
+                with self.assertRaises(ImproperlyConfigured):
+                    firebase.get_firebase_app("unknown")
+
+                firebase.reset_firebase_apps()
+                self.assertFalse(firebase.is_firebase_app_initialized("test"))
+
+    def test_import_cost_report(self):
+        """-X importtime 출력 집계 테스트"""
+
+        costs = parse_import_time(
+            "import time: self [us] | cumulative | imported package\n"
+            "import time:       120 |        120 |     django.utils.version\n"
+            "import time:       300 |        420 |   django.utils\n"
+            "import time:       500 |        920 | django\n"
+            "import time:        80 |         80 | rest_framework\n"
+        )
+
+        self.assertEqual(
+            [(cost.module, cost.depth) for cost in costs],
+            [
+                ("django.utils.version", 2),
+                ("django.utils", 1),
+                ("django", 0),
+                ("rest_framework", 0),
+            ],
+        )
+        self.assertEqual(get_total_import_time(costs), 1000)
+        self.assertEqual(
+            get_package_costs(costs), [("django", 920), ("rest_framework", 80)]
+        )
+
+    def test_exception_handler_error_payload(self):
+        """에러 응답 형식 / JSONRenderer와 같은 bytes로 변환되는지 테스트"""
+
+        translation.activate("en")
+        self.addCleanup(translation.deactivate)
+        renderer = JSONRenderer()
+        cases = [
+            (
+                StandardException(422, ugettext_lazy("Incorrect Code")),
+                {"status_code": 422, "message": "Incorrect Code", "details": {}},
+            ),
+            (
+                StandardException(401, "invalid token"),
+                {
+                    "status_code": 401,
+                    "message": UNAUTHORIZED_MESSAGE,
+                    "details": {},
+                },
+            ),
+            (
+                ValidationError({"email": ["required"], "code": ["required"]}),
+                {
+                    "status_code": 400,
+                    "message": f"{HTTP_STATUS_MESSAGES[400]} [Parameter: email,code]",
+                    "details": {"email": ["required"], "code": ["required"]},
+                },
+            ),
+            (
+                ValidationError(["line separator"]),
+                {
+                    "status_code": 400,
+                    "message": f"{HTTP_STATUS_MESSAGES[400]} [Parameter: ]",
+                    "details": ["line separator"],
+                },
+            ),
+            (
+                Throttled(wait=10),
+                {
+                    "status_code": 429,
+                    "message": f"{HTTP_STATUS_MESSAGES[429]} [Parameter: detail]",
+                    "details": {
+                        "detail": "Request was throttled. Expected available in 10 seconds."
+                    },
+                },
+            ),
+        ]
+        for exc, payload in cases:
+            response = custom_exception_handler(exc, {})
+            self.assertEqual(response.status_code, payload["status_code"])
+            self.assertEqual(response.data, payload)
+            self.assertEqual(response.rendered_content, renderer.render(response.data))
+        self.assertEqual(response["Retry-After"], "10")
+        self.assertIsNone(custom_exception_handler(ValueError("not api"), {}))
+
+        response = self.client.post(
+            reverse("email-verification-send"), {"type": "x"}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response["Content-Type"], "application/json")
+        self.assertEqual(json.loads(response.content), response.data)
+
+    def test_orjson_renderer_parser(self):
+        """orjson renderer / parser가 DRF JSONRenderer / JSONParser와 같은 결과인지 테스트"""
+
+        data = {
+            "datetime": datetime.datetime(2022, 12, 19, 11, 27, 55),
+            "date": datetime.date(2022, 12, 19),
+            "time": datetime.time(10, 10),
+            "decimal": decimal.Decimal("1.5"),
+            "uuid": uuid.UUID("12345678123456781234567812345678"),
+            "lazy": ugettext_lazy("error"),
+            "timedelta": datetime.timedelta(minutes=1),
+            "separator": "line\u2028paragraph\u2029",
+            "korean": "국가 코드",
+            1: [None, True, 1.25],
+        }
+        self.assertEqual(ORJSONRenderer().render(data), JSONRenderer().render(data))
+        self.assertEqual(ORJSONRenderer().render(None), b"")
+        # serializer DateTimeField와 같은 형식 (microsecond 포함)
+        start_datetime = datetime.datetime(2022, 12, 19, 11, 27, 55, 351813)
+        self.assertEqual(
+            ORJSONRenderer().render({"start_datetime": start_datetime}),
+            JSONRenderer().render(
+                {
+                    "start_datetime": serializers.DateTimeField().to_representation(
+                        start_datetime
+                    )
+                }
+            ),
+        )
+        # indent를 요청하면 JSONRenderer로 처리
+        self.assertEqual(
+            ORJSONRenderer().render({"a": 1}, "application/json; indent=2"),
+            JSONRenderer().render({"a": 1}, "application/json; indent=2"),
+        )
+
+        body = JSONRenderer().render(data)
+        self.assertEqual(
+            ORJSONParser().parse(BytesIO(body)),
+            JSONParser().parse(BytesIO(body)),
+        )
+        self.assertEqual(
+            ORJSONParser().parse(
+                BytesIO('{"name": "국가"}'.encode("utf-16")),
+                parser_context={"encoding": "utf-16"},
+            ),
+            {"name": "국가"},
+        )
+        for invalid_body in [b"{", b'{"a": NaN}']:
+            with self.assertRaises(ParseError):
+                ORJSONParser().parse(BytesIO(invalid_body))
+
+        # browsable API는 DEBUG에서만 사용
+        response = self.client.get(reverse("countrycode"), {"format": "api"})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_response_schema(self):
+        """ResponseSchema 출력이 serializer.data / 렌더링 결과와 같은지 테스트"""
+
+        class DefaultsSerializer(serializers.Serializer):
+            required_value = serializers.IntegerField()
+            default_value = serializers.CharField(default="default")
+            null_value = serializers.DateField(allow_null=True)
+            optional_value = serializers.FloatField(required=False)
+            source_value = serializers.CharField(source="other_key", required=False)
+            dotted_value = serializers.IntegerField(source="user.id", required=False)
+            flag = serializers.BooleanField(required=False)
+            gender = serializers.ChoiceField(choices=Gender, allow_null=True)
+            write_only_value = serializers.CharField(write_only=True, required=False)
+
+        start_datetime = datetime.datetime(2022, 12, 19, 11, 27, 55, 351813)
+        cases = [
+            (
+                ExerciseRecordSerializer,
+                {
+                    "id": 1,
+                    "start_datetime": start_datetime,
+                    "total_distance": decimal.Decimal("10.5"),
+                    "total_time": datetime.time(1, 2, 3),
+                    "average_speed": 10,
+                    "total_calories": 100.0,
+                    "user": {"id": 1, "nickname": "runner"},
+                    "detail": [
+                        {
+                            "start_time": start_datetime,
+                            "duration": 0,
+                            "distance": 0,
+                            "heart_rate": 120,
+                            "altitude": None,
+                            "latitude": 37.5,
+                            "longitude": 127.0,
+                            "speed": 1.5,
+                        }
+                    ],
+                },
+            ),
+            (
+                ExerciseRecordSerializer,
+                {"id": 2, "start_datetime": "2022-12-19T11:27:55", "user": None},
+            ),
+            (
+                DefaultsSerializer,
+                {
+                    "required_value": "3",
+                    "null_value": datetime.date(2022, 12, 19),
+                    "other_key": 10,
+                    "user": {"id": "5"},
+                    "flag": 1,
+                    "gender": "M",
+                    "write_only_value": "secret",
+                },
+            ),
+            (DefaultsSerializer, {"required_value": 1, "gender": None}),
+        ]
+        for serializer_class, instance in cases:
+            schema = ResponseSchema(serializer_class)
+            expected = serializer_class(instance).data
+            self.assertEqual(schema.encode(instance), expected)
+            self.assertEqual(
+                ORJSONRenderer().render(schema.encode_many([instance, instance])),
+                ORJSONRenderer().render(
+                    serializer_class([instance, instance], many=True).data
+                ),
+            )
+            self.assertEqual(
+                JSONRenderer().render(schema.encode(instance)),
+                JSONRenderer().render(expected),
+            )
+
+        # 필수 필드가 없으면 serializer와 같이 실패
+        with self.assertRaises(KeyError):
+            ResponseSchema(DefaultsSerializer).encode({"gender": None})
+
+        # Mapping이 아닌 데이터는 serializer로 변환
+        country_code = CountryCode(id=1, country_en_name="Korea", code="+82")
+        country_code.name = "Korea"
+        self.assertEqual(
+            country_code_schema.encode(country_code),
+            CountryCodeSerializer(country_code).data,
+        )
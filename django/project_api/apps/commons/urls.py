@@ -2,6 +2,7 @@ from django.urls import path
 
 from .views import (
     AppVersionView,
+    AWSClientMetricsView,
     CommonImageUploadView,
     CountryCodeView,
     TermsOfService,
@@ -12,4 +13,9 @@ urlpatterns = [
     path("app-version/", AppVersionView.as_view(), name="app-version"),
     path("termsofservice/", TermsOfService.as_view(), name="termsofservice"),
     path("countrycode/", CountryCodeView.as_view(), name="countrycode"),
+    path(
+        "aws-client-metrics/",
+        AWSClientMetricsView.as_view(),
+        name="aws-client-metrics",
+    ),
 ]
@@ -0,0 +1,143 @@
+# commons/utils.py
+import hashlib
+from typing import Final
+
+from project_api.renderers import orjson_dumps
+from commons.models import AppVersion
+from rest_framework.response import Response
+
+from django.core.cache import cache
+from django.db.models import Count, Max
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date
+
+# 거의 바뀌지 않는 데이터라 길게 캐시하고, DB 상태(get_queryset_version)가 바뀌면 다시 생성
+CACHED_RESPONSE_TIMEOUT: Final = 60 * 60 * 24
+
+COUNTRY_CODE_LANGUAGES: Final = ("ko", "en")
+COUNTRY_CODE_DEFAULT_LANGUAGE: Final = "en"
+COUNTRY_CODE_CACHE_KEY: Final = "country_code_response"
+
+APP_VERSION_CACHE_KEY: Final = "app_version_response"
+APP_VERSION_STATE_CACHE_KEY: Final = "app_version_state"
+# AppVersion의 DB 상태를 캐시하는 시간
+# - 저장 / 삭제하면 signal로 바로 삭제하지만, 다른 worker의 캐시(LocMemCache)나
+#   signal이 발생하지 않는 queryset.update() 등으로 바뀐 경우에는 이 시간이 지난 뒤 반영
+APP_VERSION_STATE_TIMEOUT: Final = 60
+# AppVersionView에서 캐시하는 필터 (쿼리 파라미터 이름, 허용하는 값)
+APP_VERSION_CACHE_FILTERS: Final = (
+    ("device_type", AppVersion.DeviceType.values),
+    ("server_type", AppVersion.ServerType.values),
+)
+
+
+def get_queryset_version(queryset):
+    """
+    캐시한 응답이 최신인지 확인하기 위한 DB 상태 (개수, 마지막 수정 시간)
+    - 캐시(CACHES)를 설정하지 않으면 worker 프로세스마다 따로 캐시(LocMemCache)하므로,
+      signal로 캐시를 삭제하는 대신 매 요청마다 DB 상태와 비교해서 모든 worker에서 같은 응답을 내려줌
+    - queryset의 모델에는 updated_at(auto_now) 필드가 있어야 함
+    - 반환: (version, last_modified(unix time))
+    """
+    state = queryset.order_by().aggregate(
+        count=Count("pk"), updated_at=Max("updated_at")
+    )
+    updated_at = state["updated_at"]
+    if updated_at is None:
+        return (state["count"], None), 0
+
+    return (state["count"], updated_at.isoformat()), int(updated_at.timestamp())
+
+
+def get_app_version_state():
+    """AppVersionView 응답의 version / last_modified (요청마다 DB를 조회하지 않도록 캐시)"""
+    state = cache.get(APP_VERSION_STATE_CACHE_KEY)
+    if state is None:
+        state = get_queryset_version(AppVersion.objects.all())
+        cache.set(APP_VERSION_STATE_CACHE_KEY, state, APP_VERSION_STATE_TIMEOUT)
+
+    return state
+
+
+def invalidate_app_version_state():
+    cache.delete(APP_VERSION_STATE_CACHE_KEY)
+
+
+def build_cached_response_entry(data, version, last_modified):
+    """
+    응답 데이터를 미리 JSON bytes로 렌더링해서 ETag / Last-Modified와 같이 저장할 형태로 변환
+    - data는 JSON이 아닌 renderer(browsable API 등)로 요청한 경우에 사용
+    """
+    content = orjson_dumps(data)
+    return {
+        "data": data,
+        "content": content,
+        "etag": f'"{hashlib.sha1(content).hexdigest()}"',
+        "version": version,
+        "last_modified": last_modified,
+    }
+
+
+def get_cached_response_entry(
+    cache_key, get_data, version, last_modified, variant=None
+):
+    """
+    캐시된 응답을 조회하고, 없거나 version이 다르면 get_data()로 만들어서 캐시
+    - version / last_modified: 응답 데이터의 상태 (get_queryset_version)
+    - variant: 같은 데이터를 언어 / 필터 등에 따라 다르게 응답하는 경우 구분 값
+    """
+    entry_key = cache_key if variant is None else f"{cache_key}:{variant}"
+    entry = cache.get(entry_key)
+    if entry is None or entry["version"] != version:
+        entry = build_cached_response_entry(get_data(), version, last_modified)
+        cache.set(entry_key, entry, CACHED_RESPONSE_TIMEOUT)
+
+    return entry
+
+
+def get_cached_response(request, entry, vary_headers=()):
+    """
+    캐시된 응답을 조회
+    - If-None-Match / If-Modified-Since가 맞으면 304
+    - JSON으로 요청한 경우 미리 렌더링한 bytes를 그대로 응답 (serializer / renderer를 거치지 않음)
+    """
+    response = get_conditional_response(
+        request, etag=entry["etag"], last_modified=entry["last_modified"]
+    )
+    if response is None:
+        if request.accepted_renderer.format == "json":
+            response = HttpResponse(
+                entry["content"], content_type=request.accepted_renderer.media_type
+            )
+        else:
+            response = Response(entry["data"])
+
+    response["ETag"] = entry["etag"]
+    response["Last-Modified"] = http_date(entry["last_modified"])
+    if vary_headers:
+        patch_vary_headers(response, vary_headers)
+
+    return response
+
+
+def get_country_code_language(request):
+    accept_language = request.headers.get("Accept-Language", None)
+    if accept_language in COUNTRY_CODE_LANGUAGES:
+        return accept_language
+    return COUNTRY_CODE_DEFAULT_LANGUAGE
+
+
+def get_app_version_variant(request):
+    """
+    필터 조합별 캐시 구분 값 (예: `aos:live`, `aos:`, 필터가 없으면 `:`)
+    - 허용하지 않는 값이 들어온 경우 None (캐시하지 않고 DjangoFilterBackend에서 에러 처리)
+    """
+    values = []
+    for param, choices in APP_VERSION_CACHE_FILTERS:
+        value = request.query_params.get(param, "")
+        if value and value not in choices:
+            return None
+        values.append(value)
+
+    return ":".join(values)
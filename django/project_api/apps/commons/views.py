@@ -1,3 +1,6 @@
+import os
+
+from project_api.aws_clients import get_aws_client_metrics
 from project_api.utils import BadRequestError
 from commons.models import AppVersion, CountryCode
 from django_filters.rest_framework.backends import DjangoFilterBackend
@@ -14,13 +17,36 @@ from django.utils.decorators import method_decorator
 from django.utils.translation import ugettext_lazy
 
 from .serializers import (
+    AWSClientMetricsSerializer,
     AppVersionSerializer,
     CountryCodeSerializer,
     TermsOfServiceSerializer,
     UploadedImageSerializer,
+    country_code_schema,
+)
+from .utils import (
+    APP_VERSION_CACHE_KEY,
+    COUNTRY_CODE_CACHE_KEY,
+    get_cached_response,
+    get_app_version_state,
+    get_app_version_variant,
+    get_cached_response_entry,
+    get_country_code_language,
+    get_queryset_version,
 )
 
 
+def get_country_code_data(language):
+    name_field = "country_ko_name" if language == "ko" else "country_en_name"
+    country_codes = (
+        CountryCode.objects.all()
+        .values("id", "code")
+        .annotate(name=F(name_field))
+        .order_by("id")
+    )
+    return country_code_schema.encode_many(country_codes)
+
+
 class CommonImageUploadView(generics.CreateAPIView):
     """
     post: 각 이미지 업로드뷰에서 상속하여 사용할 이미지 업로드 클래스(뷰)
@@ -75,6 +101,8 @@ class AppVersionView(generics.ListAPIView):
         - dev는 개발환경 값
         - live는 라이브환경 값입니다.
     - 리스트 형태로 리턴되기 떄문에 필터링 없이 선택해서 사용해도 무관
+    - 필터 조합별로 캐시된 응답을 내려줍니다. (관리자 페이지 등에서 버전 정보가 수정되면 최대 1분 안에 다시 생성)
+        - 응답의 `ETag` 값을 `If-None-Match` Header로 보내면 바뀐 내용이 없는 경우 304 응답을 내려줍니다.
     """
 
     permission_classes = [permissions.AllowAny]
@@ -87,6 +115,23 @@ class AppVersionView(generics.ListAPIView):
     ]
     queryset = AppVersion.objects.all()
 
+    def list(self, request, *args, **kwargs):
+        variant = get_app_version_variant(request)
+        if variant is None:
+            return super().list(request, *args, **kwargs)
+
+        version, last_modified = get_app_version_state()
+        entry = get_cached_response_entry(
+            APP_VERSION_CACHE_KEY,
+            lambda: self.get_serializer(
+                self.filter_queryset(self.get_queryset()), many=True
+            ).data,
+            version,
+            last_modified,
+            variant=variant,
+        )
+        return get_cached_response(request, entry)
+
 
 class TermsOfService(APIView):
     """
@@ -155,6 +200,32 @@ class TermsOfService(APIView):
         return Response(status=status.HTTP_200_OK, data=terms_serializer)
 
 
+class AWSClientMetricsView(APIView):
+    """
+    get: AWS client 생성 / 재사용 횟수 조회 (관리자 전용)
+
+    - 요청을 처리한 프로세스(gunicorn worker)의 `서비스:리전`별 값이다.
+        - `pid`로 어느 worker의 값인지 구분
+        - `s3`는 파일 업로드에 사용하는 S3 storage의 connection 값
+    - `reused`에 비해 `created`가 계속 늘어나면 client / connection이 재사용되지 않는 것
+    """
+
+    permission_classes = [permissions.IsAdminUser]
+
+    @method_decorator(
+        name="get",
+        decorator=swagger_auto_schema(
+            request_body=None,
+            responses={200: AWSClientMetricsSerializer()},
+        ),
+    )
+    def get(self, request):
+        metrics_serializer = AWSClientMetricsSerializer(
+            {"pid": os.getpid(), "clients": get_aws_client_metrics()}
+        )
+        return Response(status=status.HTTP_200_OK, data=metrics_serializer.data)
+
+
 class CountryCodeView(APIView):
     """
     get: 국가별 번호 코드 조회
@@ -163,6 +234,9 @@ class CountryCodeView(APIView):
     - Header에 Accept-Language
         - `ko`, `en`의 종류에 따라 국가 이름 출력
         - Default = `en`
+    - 언어별로 미리 만들어둔 응답을 내려줍니다. (국가 코드가 수정되면 다음 요청에서 다시 생성)
+        - 응답의 `ETag` / `Last-Modified` 값을 `If-None-Match` / `If-Modified-Since` Header로 보내면
+          바뀐 내용이 없는 경우 304 응답을 내려줍니다.
     """
 
     permission_classes = [permissions.IsAuthenticated]
@@ -175,38 +249,14 @@ class CountryCodeView(APIView):
         ),
     )
     def get(self, request):
-        accept_language = request.headers.get("Accept-Language", None)
-
-        if accept_language == "ko":
-            country_codes = (
-                CountryCode.objects.all()
-                .values("id", "country_ko_name", "code")
-                .annotate(name=F("country_ko_name"))
-                .order_by("id")
-            )
-        elif accept_language == "en":
-            country_codes = (
-                CountryCode.objects.all()
-                .values("id", "country_en_name", "code")
-                .annotate(name=F("country_en_name"))
-                .order_by("id")
-            )
-        else:
-            country_codes = (
-                CountryCode.objects.all()
-                .values("id", "country_en_name", "code")
-                .annotate(name=F("country_en_name"))
-                .order_by("id")
-            )
+        language = get_country_code_language(request)
 
-        country_code_list = []
-        for country_code in country_codes:
-            country_code_list.append(
-                {
-                    "id": country_code["id"],
-                    "name": country_code["name"],
-                    "code": country_code["code"],
-                }
-            )
-        country_code_serializer = CountryCodeSerializer(country_code_list, many=True)
-        return Response(status=status.HTTP_200_OK, data=country_code_serializer.data)
+        version, last_modified = get_queryset_version(CountryCode.objects.all())
+        entry = get_cached_response_entry(
+            COUNTRY_CODE_CACHE_KEY,
+            lambda: get_country_code_data(language),
+            version,
+            last_modified,
+            variant=language,
+        )
+        return get_cached_response(request, entry, vary_headers=("Accept-Language",))
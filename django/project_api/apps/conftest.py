@@ -1,4 +1,7 @@
+import json
+import threading
 from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
 import pytest
 from commons.models import CountryCode
@@ -224,3 +227,51 @@ def login_process(api_client, user_data):
 def unauthorized_after_login(test_self, response):
     test_self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
     login_process(test_self.client, DEFAULT_EMAIL_LOGIN_DATA)
+
+
+class LocalKeyServer:
+    """
+    외부 인증서 / 공개키 서버(google certs, apple JWKS 등) 대신 사용하는 로컬 HTTP 서버
+
+    - with 블록 안에서 127.0.0.1의 임의 포트로 실행되고, 모든 GET 요청에 body(JSON)를 응답
+    - body / headers는 실행 중에도 바꿀 수 있음 (키 교체 테스트)
+    - request_count로 실제로 요청된 횟수 확인
+    """
+
+    def __init__(self, body, headers=None):
+        self.body = body
+        self.headers = headers or {}
+        self.request_count = 0
+
+    def __enter__(self):
+        key_server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                key_server.request_count += 1
+                content = json.dumps(key_server.body).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(content)))
+                for name, value in key_server.headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(content)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+
+    @property
+    def url(self):
+        host, port = self.server.server_address
+        return f"http://{host}:{port}/"
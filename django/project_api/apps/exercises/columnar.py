@@ -0,0 +1,153 @@
+# exercises/columnar.py
+"""columnar 모듈 설명
+
+운동 상세 기록을 필드별 배열(columnar) 형식으로 주고받기 위한 모듈
+
+- 요청: exercises/parsers.py의 columnar JSON / msgpack parser로 읽은 필드별 배열을 필드 단위로 변환 / 검증해서 저장
+- 응답: 저장된 상세 기록(row / detail_blob)을 같은 형식으로 변환
+- start_time은 start_datetime 기준 offset(초)으로 주고받음
+"""
+import math
+from datetime import timedelta
+from typing import Final
+
+from exercises.utils import (
+    DETAIL_FIELDS,
+    EXERCISE_DETAIL_BATCH_SIZE,
+    decode_exercise_detail_blob,
+    get_exercise_detail_writer,
+    iter_batches,
+)
+from rest_framework.exceptions import ValidationError
+
+from django.utils.translation import ugettext_lazy
+
+# columnar 형식에서는 start_time을 start_datetime 기준 offset(초)으로 주고받음
+COLUMNAR_DETAIL_FIELDS: Final = ("start_time_offset",) + DETAIL_FIELDS[1:]
+# columnar 필드별 (값 타입, null 허용 여부)
+COLUMNAR_DETAIL_TYPES: Final = {
+    "start_time_offset": ("float", False),
+    "duration": ("integer", False),
+    "distance": ("float", False),
+    "heart_rate": ("integer", False),
+    "altitude": ("float", True),
+    "latitude": ("float", True),
+    "longitude": ("float", True),
+    "speed": ("float", False),
+}
+HEART_RATE_MAX_VALUE: Final = 32767
+
+
+def _to_finite_float(value):
+    # NaN / inf는 DB / 통계 계산에서 사용할 수 없으므로 허용하지 않음
+    value = float(value)
+    if not math.isfinite(value):
+        raise ValueError(f"{value} is not a finite number")
+    return value
+
+
+def _to_integer(value):
+    # 소수점 이하가 있는 값은 int()로 버리지 않고 에러
+    if isinstance(value, int):
+        return value
+    value = _to_finite_float(value)
+    if not value.is_integer():
+        raise ValueError(f"{value} is not an integer")
+    return int(value)
+
+
+COLUMN_TYPE_CONVERTERS: Final = {
+    "float": (_to_finite_float, ugettext_lazy("A valid number is required.")),
+    "integer": (_to_integer, ugettext_lazy("A valid integer is required.")),
+}
+
+
+def _convert_detail_column(field_name, values):
+    column_type, allow_null = COLUMNAR_DETAIL_TYPES[field_name]
+    converter, error_message = COLUMN_TYPE_CONVERTERS[column_type]
+
+    try:
+        if allow_null:
+            return [None if value is None else converter(value) for value in values]
+        return list(map(converter, values))
+    except (TypeError, ValueError, OverflowError):
+        raise ValidationError({"detail": {field_name: [error_message]}})
+
+
+def decode_exercise_detail_columns(start_datetime, detail):
+    """
+    columnar 형식의 상세 기록을 필드 순서(DETAIL_FIELDS)대로 정렬된 컬럼 리스트로 변환
+    - 필드별로 한번에 변환 / 검증하기 때문에 serializer로 샘플마다 검증하는 것보다 훨씬 빠름
+    """
+    if not isinstance(detail, dict):
+        raise ValidationError({"detail": [ugettext_lazy("This field is required.")]})
+
+    columns = []
+    for field_name in COLUMNAR_DETAIL_FIELDS:
+        values = detail.get(field_name, None)
+        if not isinstance(values, list):
+            raise ValidationError(
+                {"detail": {field_name: [ugettext_lazy("This field is required.")]}}
+            )
+        columns.append(_convert_detail_column(field_name, values))
+
+    if len({len(column) for column in columns}) > 1:
+        raise ValidationError(
+            {"detail": [ugettext_lazy("All detail columns must have the same length.")]}
+        )
+
+    heart_rates = columns[DETAIL_FIELDS.index("heart_rate")]
+    if heart_rates and (
+        min(heart_rates) < 0 or max(heart_rates) > HEART_RATE_MAX_VALUE
+    ):
+        raise ValidationError(
+            {"detail": {"heart_rate": [ugettext_lazy("Invalid heart_rate value.")]}}
+        )
+
+    columns[0] = [start_datetime + timedelta(seconds=offset) for offset in columns[0]]
+
+    return columns
+
+
+def save_exercise_detail_columns(
+    exercise_record, detail, batch_size=EXERCISE_DETAIL_BATCH_SIZE, metrics=None
+):
+    """
+    columnar 형식의 상세 기록을 검증 후 batch_size 단위로 저장
+    - metrics(ExerciseMetricsAccumulator)를 넘기면 요약 지표도 같이 계산
+    - 호출하는 쪽에서 transaction.atomic()으로 감싸서 사용해야 함
+    """
+    columns = decode_exercise_detail_columns(exercise_record.start_datetime, detail)
+    writer = get_exercise_detail_writer(exercise_record)
+    count = 0
+
+    if metrics is not None:
+        metrics.add_columns(dict(zip(DETAIL_FIELDS, columns)))
+
+    for _, batch in iter_batches(zip(*columns), batch_size):
+        writer.write(list(map(list, zip(*batch))))
+        count += len(batch)
+
+    writer.close()
+    return count
+
+
+def get_exercise_detail_columns(exercise_record):
+    """
+    운동 상세 기록을 columnar 형식(필드별 배열)으로 조회
+    - detail_blob으로 저장된 기록은 디코딩해서 같은 형식으로 반환
+    """
+    if exercise_record.detail_blob is not None:
+        columns = decode_exercise_detail_blob(exercise_record)
+    else:
+        rows = exercise_record.exercise_detail_record.order_by("id").values_list(
+            *DETAIL_FIELDS
+        )
+        columns = [list(column) for column in zip(*rows)] or [[] for _ in DETAIL_FIELDS]
+
+    start_datetime = exercise_record.start_datetime
+    columns[0] = [
+        (start_time - start_datetime).total_seconds() for start_time in columns[0]
+    ]
+
+    return dict(zip(COLUMNAR_DETAIL_FIELDS, columns))
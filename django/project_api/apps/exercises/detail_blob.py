@@ -0,0 +1,191 @@
+# exercises/detail_blob.py
+"""detail_blob 모듈 설명
+
+운동 상세 기록 전체를 ExerciseRecord 하나의 컬럼(detail_blob)에 압축해서 저장하기 위한 인코딩 모듈
+
+- 샘플(row) 단위가 아닌 필드별 배열(column) 단위로 저장
+- 정수 컬럼은 delta + zigzag + varint로 인코딩
+- 실수 컬럼은 10의 거듭제곱을 곱해 정수로 바꾼 뒤 같은 방식으로 인코딩
+  (원래 값으로 정확히 복원되는 가장 작은 소수점 자리수를 사용하므로 손실 없음)
+- 정수로 바꿀 수 없는 실수 컬럼은 float64 그대로 저장
+- null 값은 컬럼별 bitmap으로 표시하고 값 배열에서는 제외
+- 전체를 zlib으로 한번 더 압축
+
+인코딩 / 디코딩하는 컬럼 리스트의 순서는 호출하는 쪽에서 정하며,
+시간 컬럼은 정수(예: 시작 시간 기준 microsecond offset)로 변환해서 넘겨야 함
+"""
+import struct
+import zlib
+from typing import Final
+
+DETAIL_BLOB_MAGIC: Final = b"EXD"
+DETAIL_BLOB_VERSION: Final = 1
+DETAIL_BLOB_COMPRESS_LEVEL: Final = 6
+# 정수 변환을 시도하는 최대 소수점 자리수 (위도 / 경도 1e-7도 = 약 1cm)
+MAX_DECIMAL_EXPONENT: Final = 9
+
+ENCODING_INTEGER: Final = 0
+ENCODING_DECIMAL: Final = 1
+ENCODING_FLOAT64: Final = 2
+
+
+def _zigzag_varint_deltas(values, out):
+    previous = 0
+    for value in values:
+        delta = value - previous
+        previous = value
+        delta = (delta << 1) if delta >= 0 else ((-delta << 1) - 1)
+        while delta > 0x7F:
+            out.append((delta & 0x7F) | 0x80)
+            delta >>= 7
+        out.append(delta)
+
+
+def _read_varint(data, position):
+    result = 0
+    shift = 0
+    while True:
+        byte = data[position]
+        position += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, position
+        shift += 7
+
+
+def _read_zigzag_varint_deltas(data, position, count):
+    values = []
+    append = values.append
+    previous = 0
+    for _ in range(count):
+        delta, position = _read_varint(data, position)
+        previous += (delta >> 1) if not delta & 1 else -((delta + 1) >> 1)
+        append(previous)
+
+    return values, position
+
+
+def _find_decimal_exponent(values):
+    """모든 값이 10 ** exponent를 곱한 정수로 정확히 복원되는 가장 작은 exponent"""
+    for exponent in range(MAX_DECIMAL_EXPONENT + 1):
+        scale = 10**exponent
+        try:
+            if all(round(value * scale) / scale == value for value in values):
+                return exponent
+        except (OverflowError, ValueError):
+            return None
+
+    return None
+
+
+def _encode_column(values, out):
+    present = [value is not None for value in values]
+    present_values = [value for value in values if value is not None]
+
+    if len(present_values) == len(values):
+        out.append(0)
+    else:
+        # bit i가 1이면 i번째 값이 존재
+        out.append(1)
+        bitmap = bytearray((len(values) + 7) // 8)
+        for index, is_present in enumerate(present):
+            if is_present:
+                bitmap[index >> 3] |= 1 << (index & 7)
+        out += bitmap
+
+    if all(type(value) is int for value in present_values):
+        out.append(ENCODING_INTEGER)
+        _zigzag_varint_deltas(present_values, out)
+        return
+
+    exponent = _find_decimal_exponent(present_values)
+    if exponent is None:
+        out.append(ENCODING_FLOAT64)
+        out += struct.pack(f"<{len(present_values)}d", *present_values)
+        return
+
+    out.append(ENCODING_DECIMAL)
+    out.append(exponent)
+    scale = 10**exponent
+    _zigzag_varint_deltas([round(value * scale) for value in present_values], out)
+
+
+def _decode_column(data, position, count):
+    has_nulls = data[position]
+    position += 1
+
+    present = None
+    present_count = count
+    if has_nulls:
+        bitmap_size = (count + 7) // 8
+        bitmap = data[position : position + bitmap_size]
+        position += bitmap_size
+        present = [
+            bool(bitmap[index >> 3] & (1 << (index & 7))) for index in range(count)
+        ]
+        present_count = sum(present)
+
+    encoding = data[position]
+    position += 1
+    if encoding == ENCODING_FLOAT64:
+        size = present_count * 8
+        values = list(struct.unpack_from(f"<{present_count}d", data, position))
+        position += size
+    elif encoding == ENCODING_INTEGER:
+        values, position = _read_zigzag_varint_deltas(data, position, present_count)
+    elif encoding == ENCODING_DECIMAL:
+        scale = 10 ** data[position]
+        position += 1
+        values, position = _read_zigzag_varint_deltas(data, position, present_count)
+        values = [value / scale for value in values]
+    else:
+        raise ValueError(f"Unknown detail blob column encoding: {encoding}")
+
+    if present is None:
+        return values, position
+
+    iterator = iter(values)
+    return [next(iterator) if is_present else None for is_present in present], position
+
+
+def encode_detail_blob(columns):
+    """
+    같은 길이의 컬럼 리스트를 압축된 bytes로 인코딩
+    """
+    count = len(columns[0]) if columns else 0
+
+    body = bytearray()
+    _zigzag_varint_deltas([count], body)
+    _zigzag_varint_deltas([len(columns)], body)
+    for values in columns:
+        _encode_column(values, body)
+
+    return (
+        DETAIL_BLOB_MAGIC
+        + bytes([DETAIL_BLOB_VERSION])
+        + zlib.compress(bytes(body), DETAIL_BLOB_COMPRESS_LEVEL)
+    )
+
+
+def decode_detail_blob(blob):
+    """
+    encode_detail_blob()으로 인코딩한 bytes를 컬럼 리스트로 디코딩
+    """
+    blob = bytes(blob)
+    if blob[: len(DETAIL_BLOB_MAGIC)] != DETAIL_BLOB_MAGIC:
+        raise ValueError("Invalid detail blob")
+
+    version = blob[len(DETAIL_BLOB_MAGIC)]
+    if version != DETAIL_BLOB_VERSION:
+        raise ValueError(f"Unsupported detail blob version: {version}")
+
+    data = zlib.decompress(blob[len(DETAIL_BLOB_MAGIC) + 1 :])
+    (count,), position = _read_zigzag_varint_deltas(data, 0, 1)
+    (column_count,), position = _read_zigzag_varint_deltas(data, position, 1)
+
+    columns = []
+    for _ in range(column_count):
+        values, position = _decode_column(data, position, count)
+        columns.append(values)
+
+    return columns
@@ -18,3 +18,28 @@ EXERCISE_RECORD_ID_QUERY_PARAMETER = openapi.Parameter(
     description="운동기록 아이디",
     type=openapi.TYPE_STRING,
 )
+
+# /exercises/record/ 리스트 조회 API에서 문서화를 위해 사용하는 cursor pagination 쿼리 파라미터
+EXERCISE_RECORD_CURSOR_QUERY_PARAMETER = openapi.Parameter(
+    "cursor",
+    openapi.IN_QUERY,
+    required=False,
+    description="이전 응답의 cursor 값 (다음 페이지 조회)",
+    type=openapi.TYPE_STRING,
+)
+EXERCISE_RECORD_PAGE_SIZE_QUERY_PARAMETER = openapi.Parameter(
+    "page_size",
+    openapi.IN_QUERY,
+    required=False,
+    description="한 페이지에 조회할 운동기록 개수 (기본 20, 최대 100)",
+    type=openapi.TYPE_INTEGER,
+)
+
+# /exercises/record/ 저장 API에서 문서화를 위해 사용하는 중복 저장 방지 헤더
+EXERCISE_RECORD_IDEMPOTENCY_KEY_HEADER_PARAMETER = openapi.Parameter(
+    "Idempotency-Key",
+    openapi.IN_HEADER,
+    required=False,
+    description="운동기록마다 앱에서 만든 고유한 값 (최대 64자, 다시 보내도 한번만 저장)",
+    type=openapi.TYPE_STRING,
+)
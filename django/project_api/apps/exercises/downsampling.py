@@ -0,0 +1,153 @@
+# exercises/downsampling.py
+"""downsampling 모듈 설명
+
+운동 상세 기록을 지도 / 차트에 그릴 수 있을 만큼의 포인트 개수로 줄이는 모듈
+
+- GPS 경로: Ramer-Douglas-Peucker (경로의 모양을 가장 많이 바꾸는 포인트부터 남김)
+- 심박수 / 속도 / 고도: Largest-Triangle-Three-Buckets (차트의 모양을 유지하면서 구간별로 한 포인트씩 남김)
+- 모두 원본 샘플의 index 리스트를 반환하므로 다른 필드도 같은 index로 함께 뽑아서 사용
+"""
+import heapq
+import math
+from itertools import compress
+from typing import Final
+
+# 상세 기록 downsampling 포인트 개수 (기본 / 최소 / 최대)
+EXERCISE_DETAIL_LOD_DEFAULT_POINTS: Final = 200
+EXERCISE_DETAIL_LOD_MIN_POINTS: Final = 2
+EXERCISE_DETAIL_LOD_MAX_POINTS: Final = 2000
+
+
+def _farthest_point(xs, ys, start, end):
+    """start ~ end 사이에서 두 끝점을 잇는 직선으로부터 가장 먼 포인트와 그 거리"""
+    ax, ay, bx, by = xs[start], ys[start], xs[end], ys[end]
+    dx = bx - ax
+    dy = by - ay
+    length = math.hypot(dx, dy)
+
+    # 두 끝점이 같은 경우(되돌아오는 경로)는 끝점과의 거리로 판단
+    if length == 0:
+        distances = [
+            math.hypot(x - ax, y - ay)
+            for x, y in zip(xs[start + 1 : end], ys[start + 1 : end])
+        ]
+        length = 1.0
+    else:
+        offset = bx * ay - by * ax
+        distances = [
+            abs(dy * x - dx * y + offset)
+            for x, y in zip(xs[start + 1 : end], ys[start + 1 : end])
+        ]
+
+    farthest_distance = max(distances)
+    return start + 1 + distances.index(farthest_distance), farthest_distance / length
+
+
+def rdp_indexes(xs, ys, max_points, epsilon=0.0):
+    """
+    Ramer-Douglas-Peucker로 남길 포인트의 index 리스트
+
+    - 재귀로 모든 구간을 나누는 대신, 직선에서 가장 먼 포인트를 가진 구간부터 나누어
+      max_points 개수에 도달하거나 남은 포인트가 모두 epsilon 이하가 되면 중단
+    """
+    count = len(xs)
+    if count <= max(max_points, 2):
+        return list(range(count))
+
+    kept = [0, count - 1]
+    segments = []
+
+    def push(start, end):
+        if end - start > 1:
+            index, distance = _farthest_point(xs, ys, start, end)
+            heapq.heappush(segments, (-distance, start, end, index))
+
+    push(0, count - 1)
+    while segments and len(kept) < max_points:
+        negative_distance, start, end, index = heapq.heappop(segments)
+        if -negative_distance <= epsilon:
+            break
+        kept.append(index)
+        push(start, index)
+        push(index, end)
+
+    return sorted(kept)
+
+
+def lttb_indexes(xs, ys, threshold):
+    """Largest-Triangle-Three-Buckets로 남길 포인트의 index 리스트"""
+    count = len(xs)
+    if threshold >= count or count <= 2:
+        return list(range(count))
+    if threshold <= 2:
+        return [0, count - 1][:threshold]
+
+    # 첫 / 마지막 포인트를 제외한 나머지를 (threshold - 2)개의 bucket으로 나눔
+    bucket_size = (count - 2) / (threshold - 2)
+    kept = [0]
+    previous = 0
+    for bucket in range(threshold - 2):
+        bucket_start = int(bucket * bucket_size) + 1
+        bucket_end = int((bucket + 1) * bucket_size) + 1
+
+        # 다음 bucket의 평균 포인트 (마지막 bucket은 마지막 포인트)
+        next_start = bucket_end
+        next_end = min(int((bucket + 2) * bucket_size) + 1, count)
+        next_length = next_end - next_start
+        average_x = math.fsum(xs[next_start:next_end]) / next_length
+        average_y = math.fsum(ys[next_start:next_end]) / next_length
+
+        # 이전에 남긴 포인트 / 다음 bucket 평균과 만드는 삼각형이 가장 큰 포인트를 남김
+        ax, ay = xs[previous], ys[previous]
+        largest_area, selected = -1.0, bucket_start
+        for index in range(bucket_start, bucket_end):
+            area = abs(
+                (ax - average_x) * (ys[index] - ay)
+                - (ax - xs[index]) * (average_y - ay)
+            )
+            if area > largest_area:
+                largest_area, selected = area, index
+
+        kept.append(selected)
+        previous = selected
+
+    kept.append(count - 1)
+    return kept
+
+
+def downsample_route(start_time_offset, latitude, longitude, max_points):
+    """좌표가 있는 샘플만 골라서 RDP로 줄인 GPS 경로"""
+    has_point = [
+        lat is not None and lon is not None for lat, lon in zip(latitude, longitude)
+    ]
+    offsets = list(compress(start_time_offset, has_point))
+    latitudes = list(compress(latitude, has_point))
+    longitudes = list(compress(longitude, has_point))
+
+    # 위도에 따라 경도 1도의 거리가 달라지므로 평균 위도 기준으로 보정한 평면 좌표에서 거리 계산
+    scale = (
+        math.cos(math.radians(math.fsum(latitudes) / len(latitudes)))
+        if latitudes
+        else 1.0
+    )
+    xs = [lon * scale for lon in longitudes]
+
+    indexes = rdp_indexes(xs, latitudes, max_points)
+    return {
+        "start_time_offset": [offsets[index] for index in indexes],
+        "latitude": [latitudes[index] for index in indexes],
+        "longitude": [longitudes[index] for index in indexes],
+    }
+
+
+def downsample_series(start_time_offset, values, max_points):
+    """값이 있는 샘플만 골라서 LTTB로 줄인 시계열"""
+    has_value = [value is not None for value in values]
+    offsets = list(compress(start_time_offset, has_value))
+    values = list(compress(values, has_value))
+
+    indexes = lttb_indexes(offsets, values, max_points)
+    return {
+        "start_time_offset": [offsets[index] for index in indexes],
+        "value": [values[index] for index in indexes],
+    }
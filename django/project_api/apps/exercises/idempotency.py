@@ -0,0 +1,82 @@
+# exercises/idempotency.py
+"""idempotency 모듈 설명
+
+운동기록 저장 요청을 다시 보내도(재시도) 같은 기록이 중복 저장되지 않도록 하기 위한 모듈
+
+- 앱은 Idempotency-Key 헤더(동기화 API는 기록마다 idempotency_key)를 보내고,
+  같은 유저가 같은 key로 이미 저장한 기록이 있으면 저장하지 않고 저장된 기록을 응답
+- key별로 저장한 운동기록 id를 캐시하고, 없으면 ExerciseRecord의 unique 인덱스로 조회
+"""
+import hashlib
+from typing import Final
+
+from exercises.models import ExerciseRecord
+from rest_framework.exceptions import ValidationError
+
+from django.core.cache import cache
+from django.db.models import Q
+from django.utils.translation import ugettext_lazy
+
+# Idempotency-Key 헤더 최대 길이 (ExerciseRecord.idempotency_key)
+IDEMPOTENCY_KEY_MAX_LENGTH: Final = 64
+# 이미 저장된 기록을 다시 보낸 경우 응답에 추가하는 헤더
+IDEMPOTENT_REPLAYED_HEADER: Final = "Idempotent-Replayed"
+# Idempotency-Key별로 저장한 운동기록 id를 캐시하는 시간(초)
+EXERCISE_RECORD_IDEMPOTENCY_CACHE_TIMEOUT: Final = 60 * 60 * 24
+
+
+def get_idempotency_key(request):
+    """
+    요청의 Idempotency-Key 헤더 값 (없으면 None)
+    """
+    idempotency_key = request.headers.get("Idempotency-Key", None)
+    if idempotency_key is None:
+        return None
+
+    idempotency_key = idempotency_key.strip()
+    if not idempotency_key or len(idempotency_key) > IDEMPOTENCY_KEY_MAX_LENGTH:
+        raise ValidationError(
+            {"Idempotency-Key": [ugettext_lazy("Invalid Idempotency-Key header.")]}
+        )
+
+    return idempotency_key
+
+
+def get_exercise_record_idempotency_cache_key(user_id, idempotency_key):
+    # 캐시 key로 사용할 수 없는 문자가 있을 수 있으므로 hash 사용
+    digest = hashlib.sha256(idempotency_key.encode()).hexdigest()
+    return f"exercise_record_idempotency:{user_id}:{digest}"
+
+
+def cache_exercise_record_idempotency(user_id, idempotency_key, exercise_record_id):
+    if idempotency_key is not None:
+        cache.set(
+            get_exercise_record_idempotency_cache_key(user_id, idempotency_key),
+            exercise_record_id,
+            EXERCISE_RECORD_IDEMPOTENCY_CACHE_TIMEOUT,
+        )
+
+
+def get_saved_exercise_record_id(user_id, idempotency_key=None, start_datetime=None):
+    """
+    같은 Idempotency-Key 또는 같은 시작 시간(삭제되지 않은 기록)으로 이미 저장된 운동기록 id (없으면 None)
+    - Idempotency-Key는 캐시를 먼저 확인하고, 없으면 unique 인덱스로 조회
+    """
+    conditions = Q()
+    if idempotency_key is not None:
+        exercise_record_id = cache.get(
+            get_exercise_record_idempotency_cache_key(user_id, idempotency_key)
+        )
+        if exercise_record_id is not None:
+            return exercise_record_id
+        conditions |= Q(idempotency_key=idempotency_key)
+    if start_datetime is not None:
+        conditions |= Q(start_datetime=start_datetime, deleted_at__isnull=True)
+    if not conditions:
+        return None
+
+    return (
+        ExerciseRecord.objects.filter(conditions, user_id=user_id)
+        .values_list("id", flat=True)
+        .first()
+    )
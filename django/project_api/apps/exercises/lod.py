@@ -0,0 +1,95 @@
+# exercises/lod.py
+"""lod 모듈 설명
+
+운동 상세 기록 downsampling 결과(level of detail)를 계산하고 저장하는 모듈
+
+- 줄이는 방법은 exercises/downsampling.py 참조
+- 결과는 ExerciseDetailLOD에 운동기록 / 포인트 개수별로 저장
+  (캐시와 달리 모든 서버 / 프로세스에서 같이 사용하고, precompute_exercise_detail_lod 커맨드로 미리 계산한 결과도 유지)
+- 저장된 상세 기록은 수정되지 않으므로 한번 저장한 결과는 다시 계산하지 않음
+"""
+from typing import Final
+
+from exercises.columnar import get_exercise_detail_columns
+from exercises.downsampling import downsample_route, downsample_series
+from exercises.models import ExerciseDetailLOD
+
+# LTTB로 줄이는 시계열 필드
+LOD_SERIES_FIELDS: Final = ("heart_rate", "speed", "altitude")
+
+
+def build_exercise_detail_lod(exercise_record, points):
+    """
+    운동 상세 기록을 points 개수 이하로 줄인 GPS 경로 / 시계열
+    """
+    columns = get_exercise_detail_columns(exercise_record)
+    offsets = columns["start_time_offset"]
+
+    lod = {
+        "points": points,
+        "sample_count": len(offsets),
+        "route": downsample_route(
+            offsets, columns["latitude"], columns["longitude"], points
+        ),
+    }
+    for field_name in LOD_SERIES_FIELDS:
+        lod[field_name] = downsample_series(offsets, columns[field_name], points)
+
+    return lod
+
+
+def save_exercise_detail_lods(exercise_record, points_list, force=False):
+    """
+    points_list의 포인트 개수별 downsampling 결과를 계산해서 저장
+    - force가 False면 이미 저장된 포인트 개수는 다시 계산하지 않음
+    - 저장한 결과 개수를 반환
+    """
+    points_list = set(points_list)
+    if force:
+        ExerciseDetailLOD.objects.filter(
+            exercise_record=exercise_record, points__in=points_list
+        ).delete()
+    else:
+        points_list -= set(
+            ExerciseDetailLOD.objects.filter(
+                exercise_record=exercise_record, points__in=points_list
+            ).values_list("points", flat=True)
+        )
+
+    # 동시에 같은 결과를 저장하는 요청이 있어도 하나만 저장
+    ExerciseDetailLOD.objects.bulk_create(
+        [
+            ExerciseDetailLOD(
+                exercise_record=exercise_record,
+                points=points,
+                data=build_exercise_detail_lod(exercise_record, points),
+            )
+            for points in sorted(points_list)
+        ],
+        ignore_conflicts=True,
+    )
+
+    return len(points_list)
+
+
+def get_exercise_detail_lod(exercise_record, points):
+    """
+    저장된 downsampling 결과를 조회하고, 없으면 계산해서 저장
+    """
+    lod = (
+        ExerciseDetailLOD.objects.filter(exercise_record=exercise_record, points=points)
+        .values_list("data", flat=True)
+        .first()
+    )
+    if lod is None:
+        lod = build_exercise_detail_lod(exercise_record, points)
+        ExerciseDetailLOD.objects.bulk_create(
+            [
+                ExerciseDetailLOD(
+                    exercise_record=exercise_record, points=points, data=lod
+                )
+            ],
+            ignore_conflicts=True,
+        )
+
+    return lod
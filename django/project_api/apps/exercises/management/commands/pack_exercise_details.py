@@ -0,0 +1,101 @@
+from itertools import groupby
+
+from exercises.models import ExerciseDetailRecord, ExerciseRecord
+from exercises.utils import DETAIL_FIELDS, encode_exercise_detail_blob
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+
+class Command(BaseCommand):
+    """
+    ExerciseDetailRecord row로 저장된 운동 상세 기록을 ExerciseRecord.detail_blob으로 옮기는 커맨드
+
+    - 운동기록 batch_size개 단위로 트랜잭션을 나누어 변환하고, 변환한 row는 삭제
+    - 중간에 멈춰도 이미 변환한 기록은 건너뛰므로 다시 실행하면 이어서 진행
+    - 예시: `python manage.py pack_exercise_details --batch-size 100 --user 1`
+    """
+
+    help = "Pack per-sample exercise detail rows into compressed ExerciseRecord blobs"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=100,
+            help="Number of exercise records converted per transaction",
+        )
+        parser.add_argument(
+            "--user",
+            type=int,
+            action="append",
+            dest="user_ids",
+            help="Convert only the given user id (can be repeated)",
+        )
+        parser.add_argument(
+            "--keep-rows",
+            action="store_true",
+            help="Keep ExerciseDetailRecord rows after writing the blob",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+
+        records = ExerciseRecord.objects.filter(
+            detail_blob__isnull=True, exercise_detail_record__isnull=False
+        ).distinct()
+        if options["user_ids"]:
+            records = records.filter(user_id__in=options["user_ids"])
+
+        last_id = 0
+        packed = 0
+        sample_count = 0
+        while True:
+            batch = list(
+                records.filter(id__gt=last_id)
+                .order_by("id")
+                .values_list("id", "start_datetime")[:batch_size]
+            )
+            if not batch:
+                break
+            last_id = batch[-1][0]
+            start_datetimes = dict(batch)
+
+            with transaction.atomic():
+                details = (
+                    ExerciseDetailRecord.objects.filter(
+                        exercise_recode_id__in=start_datetimes
+                    )
+                    .order_by("exercise_recode_id", "id")
+                    .values_list("exercise_recode_id", *DETAIL_FIELDS)
+                )
+
+                packed_records = []
+                for record_id, rows in groupby(
+                    details.iterator(), key=lambda row: row[0]
+                ):
+                    columns = [list(column) for column in zip(*rows)][1:]
+                    packed_records.append(
+                        ExerciseRecord(
+                            id=record_id,
+                            detail_blob=encode_exercise_detail_blob(
+                                start_datetimes[record_id], columns
+                            ),
+                        )
+                    )
+                    sample_count += len(columns[0])
+
+                ExerciseRecord.objects.bulk_update(packed_records, ["detail_blob"])
+                if not options["keep_rows"]:
+                    ExerciseDetailRecord.objects.filter(
+                        exercise_recode_id__in=start_datetimes
+                    ).delete()
+
+            packed += len(packed_records)
+            self.stdout.write(f"Packed {packed} exercise records (last id {last_id})")
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Packed {sample_count} detail samples into {packed} exercise records"
+            )
+        )
@@ -0,0 +1,57 @@
+from exercises.downsampling import EXERCISE_DETAIL_LOD_DEFAULT_POINTS
+from exercises.lod import save_exercise_detail_lods
+from exercises.models import ExerciseRecord
+
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    """
+    운동 상세 기록 downsampling 결과를 미리 계산해서 저장(ExerciseDetailLOD)하는 커맨드
+
+    - 앱에서 주로 사용하는 포인트 개수를 미리 계산해두면 첫 조회부터 저장된 결과를 사용
+    - 예시: `python manage.py precompute_exercise_detail_lod --points 100 --points 500 --user 1`
+    """
+
+    help = "Precompute and store downsampled exercise detail series"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--points",
+            type=int,
+            action="append",
+            dest="points",
+            help=f"Target point count (can be repeated, default {EXERCISE_DETAIL_LOD_DEFAULT_POINTS})",
+        )
+        parser.add_argument(
+            "--user",
+            type=int,
+            action="append",
+            dest="user_ids",
+            help="Precompute only the given user id (can be repeated)",
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Recompute even if a stored result exists",
+        )
+
+    def handle(self, *args, **options):
+        points_list = options["points"] or [EXERCISE_DETAIL_LOD_DEFAULT_POINTS]
+        user_ids = options["user_ids"]
+
+        records = ExerciseRecord.objects.filter(deleted_at__isnull=True).only(
+            "id", "start_datetime", "detail_blob"
+        )
+        if user_ids:
+            records = records.filter(user_id__in=user_ids)
+
+        computed = 0
+        for record in records.order_by("id").iterator():
+            computed += save_exercise_detail_lods(
+                record, points_list, force=options["force"]
+            )
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Stored {computed} downsampled exercise detail series")
+        )
@@ -0,0 +1,101 @@
+from exercises.models import (
+    ExerciseRecord,
+    ExerciseStatistics,
+    ExerciseStatisticsPeriodType,
+)
+from exercises.statistics import (
+    get_exercise_pace,
+    get_statistics_period_start,
+    time_to_seconds,
+)
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+
+class Command(BaseCommand):
+    """
+    운동기록으로부터 일간 / 주간 / 월간 운동 통계(ExerciseStatistics)를 다시 계산하는 커맨드
+
+    - 통계 테이블 도입 이전의 기록을 반영하거나, 통계 값이 어긋난 경우 사용
+    - 예시: `python manage.py rebuild_exercise_statistics --user 1`
+    """
+
+    help = "Rebuild per-user exercise statistics rollups from exercise records"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--user",
+            type=int,
+            action="append",
+            dest="user_ids",
+            help="Rebuild only the given user id (can be repeated)",
+        )
+
+    def handle(self, *args, **options):
+        user_ids = options["user_ids"]
+
+        records = ExerciseRecord.objects.filter(deleted_at__isnull=True)
+        if user_ids:
+            records = records.filter(user_id__in=user_ids)
+
+        rollups = {}
+        for user_id, start_datetime, total_distance, total_time, total_calories in (
+            records.order_by()
+            .values_list(
+                "user_id",
+                "start_datetime",
+                "total_distance",
+                "total_time",
+                "total_calories",
+            )
+            .iterator()
+        ):
+            seconds = time_to_seconds(total_time)
+            pace = get_exercise_pace(seconds, total_distance)
+
+            for period_type in ExerciseStatisticsPeriodType.values:
+                period_start = get_statistics_period_start(
+                    period_type, start_datetime.date()
+                )
+                rollup = rollups.setdefault(
+                    (user_id, period_type, period_start),
+                    {
+                        "total_distance": 0.0,
+                        "total_time": 0.0,
+                        "total_calories": 0.0,
+                        "session_count": 0,
+                        "best_pace": None,
+                    },
+                )
+                rollup["total_distance"] += total_distance
+                rollup["total_time"] += seconds
+                rollup["total_calories"] += total_calories
+                rollup["session_count"] += 1
+                if pace is not None and (
+                    rollup["best_pace"] is None or pace < rollup["best_pace"]
+                ):
+                    rollup["best_pace"] = pace
+
+        with transaction.atomic():
+            statistics = ExerciseStatistics.objects.all()
+            if user_ids:
+                statistics = statistics.filter(user_id__in=user_ids)
+            statistics.delete()
+
+            ExerciseStatistics.objects.bulk_create(
+                [
+                    ExerciseStatistics(
+                        user_id=user_id,
+                        period_type=period_type,
+                        period_start=period_start,
+                        **rollup,
+                    )
+                    for (user_id, period_type, period_start), rollup in rollups.items()
+                ],
+                batch_size=1000,
+            )
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Rebuilt {len(rollups)} exercise statistics rows")
+        )
@@ -0,0 +1,165 @@
+# exercises/metrics.py
+"""metrics 모듈 설명
+
+운동 상세 기록(ExerciseDetailRecord)으로부터 서버에서 직접 운동 요약 지표를 계산하는 모듈
+
+- 샘플 하나씩 처리하지 않고 필드별 배열(column) 단위로 한번에 계산
+- batch 단위로 나누어 add()를 호출해도 batch 경계의 구간까지 이어서 계산
+- 단위: 거리(m), 속도(m/s), 시간(초), 고도(m), 페이스(초/km)
+"""
+import math
+from bisect import bisect_right
+from datetime import date
+from itertools import compress, repeat
+from operator import ge, sub
+from typing import Final
+
+EARTH_RADIUS_M: Final = 6371008.8
+# 해당 속도(m/s) 이상인 구간만 움직인 시간으로 판단
+MOVING_SPEED_THRESHOLD: Final = 0.5
+# 생년월일이 없는 경우 사용하는 최대 심박수
+DEFAULT_MAX_HEART_RATE: Final = 190
+# 최대 심박수 대비 심박존 하한 비율 (zone1 ~ zone5)
+HEART_RATE_ZONE_RATIOS: Final = (0.5, 0.6, 0.7, 0.8, 0.9)
+
+
+def get_max_heart_rate(birthdate=None, today=None):
+    if birthdate is None:
+        return DEFAULT_MAX_HEART_RATE
+
+    today = today or date.today()
+    age = today.year - birthdate.year
+    if (today.month, today.day) < (birthdate.month, birthdate.day):
+        age -= 1
+
+    return 220 - age
+
+
+def haversine_distances(latitudes, longitudes):
+    """연속된 좌표 사이의 거리(m) 배열"""
+    lat = list(map(math.radians, latitudes))
+    lon = list(map(math.radians, longitudes))
+    cos_lat = list(map(math.cos, lat))
+
+    half_dlat_sin = [math.sin(d / 2) for d in map(sub, lat[1:], lat[:-1])]
+    half_dlon_sin = [math.sin(d / 2) for d in map(sub, lon[1:], lon[:-1])]
+
+    return [
+        2 * EARTH_RADIUS_M * math.asin(math.sqrt(min(1.0, a * a + c1 * c2 * b * b)))
+        for a, b, c1, c2 in zip(half_dlat_sin, half_dlon_sin, cos_lat[:-1], cos_lat[1:])
+    ]
+
+
+def positive_diffs_sum(values):
+    return math.fsum(d for d in map(sub, values[1:], values[:-1]) if d > 0)
+
+
+class ExerciseMetricsAccumulator:
+    """
+    운동 요약 지표 계산기
+
+    - add()에 필드별 배열(start_time, heart_rate, altitude, latitude, longitude, speed)을 넘겨서 누적
+    - result()로 계산된 요약 지표를 조회
+    """
+
+    def __init__(self, max_heart_rate=DEFAULT_MAX_HEART_RATE):
+        self.zone_bounds = [max_heart_rate * ratio for ratio in HEART_RATE_ZONE_RATIOS]
+        self.sample_count = 0
+        self.first_time = None
+        self.last_time = None
+        self.last_point = None
+        self.last_altitude = None
+        self.distance = 0.0
+        self.moving_time = 0.0
+        self.elevation_gain = 0.0
+        self.heart_rate_sum = 0
+        self.heart_rate_max = None
+        self.heart_rate_zones = [0.0] * len(HEART_RATE_ZONE_RATIOS)
+
+    def add(self, start_time, heart_rate, altitude, latitude, longitude, speed):
+        if not start_time:
+            return
+
+        if self.first_time is None:
+            self.first_time = start_time[0]
+        self.sample_count += len(start_time)
+
+        # 구간(이전 샘플 ~ 현재 샘플)별 시간 - 이전 batch의 마지막 샘플부터 이어서 계산
+        prev_times = [self.last_time or start_time[0]] + start_time[:-1]
+        intervals = [
+            max(0.0, (end - begin).total_seconds())
+            for begin, end in zip(prev_times, start_time)
+        ]
+        self.last_time = start_time[-1]
+
+        # 움직인 시간
+        moving = list(map(ge, speed, repeat(MOVING_SPEED_THRESHOLD)))
+        self.moving_time += math.fsum(compress(intervals, moving))
+
+        # GPS 거리 (좌표가 없는 샘플은 제외하고 이전 좌표와 연결)
+        has_point = [
+            lat is not None and lon is not None for lat, lon in zip(latitude, longitude)
+        ]
+        latitudes = list(compress(latitude, has_point))
+        longitudes = list(compress(longitude, has_point))
+        if self.last_point is not None:
+            latitudes.insert(0, self.last_point[0])
+            longitudes.insert(0, self.last_point[1])
+        if latitudes:
+            self.distance += math.fsum(haversine_distances(latitudes, longitudes))
+            self.last_point = (latitudes[-1], longitudes[-1])
+
+        # 누적 상승 고도
+        altitudes = [value for value in altitude if value is not None]
+        if self.last_altitude is not None:
+            altitudes.insert(0, self.last_altitude)
+        if altitudes:
+            self.elevation_gain += positive_diffs_sum(altitudes)
+            self.last_altitude = altitudes[-1]
+
+        # 심박수 / 심박존별 시간
+        self.heart_rate_sum += sum(heart_rate)
+        batch_max = max(heart_rate)
+        if self.heart_rate_max is None or batch_max > self.heart_rate_max:
+            self.heart_rate_max = batch_max
+
+        zone_indexes = [bisect_right(self.zone_bounds, rate) - 1 for rate in heart_rate]
+        for zone_index, interval in zip(zone_indexes, intervals):
+            if zone_index >= 0:
+                self.heart_rate_zones[zone_index] += interval
+
+    def add_columns(self, columns):
+        self.add(
+            columns["start_time"],
+            columns["heart_rate"],
+            columns["altitude"],
+            columns["latitude"],
+            columns["longitude"],
+            columns["speed"],
+        )
+
+    def result(self):
+        total_time = 0.0
+        if self.first_time is not None:
+            total_time = (self.last_time - self.first_time).total_seconds()
+
+        average_speed = self.distance / self.moving_time if self.moving_time else 0.0
+        average_pace = (
+            self.moving_time / (self.distance / 1000) if self.distance else None
+        )
+        average_heart_rate = (
+            self.heart_rate_sum / self.sample_count if self.sample_count else None
+        )
+
+        return {
+            "sample_count": self.sample_count,
+            "total_distance": self.distance,
+            "total_time": total_time,
+            "moving_time": self.moving_time,
+            "average_speed": average_speed,
+            "average_pace": average_pace,
+            "elevation_gain": self.elevation_gain,
+            "average_heart_rate": average_heart_rate,
+            "max_heart_rate": self.heart_rate_max,
+            "heart_rate_zones": self.heart_rate_zones,
+        }
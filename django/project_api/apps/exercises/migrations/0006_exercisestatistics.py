@@ -0,0 +1,65 @@
+# Generated by Django 3.2.12 on 2026-10-18 21:33
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("exercises", "0005_exerciserecord_deleted_at"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ExerciseStatistics",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "period_type",
+                    models.CharField(
+                        choices=[("day", "일간"), ("week", "주간"), ("month", "월간")],
+                        max_length=5,
+                        verbose_name="기간 타입",
+                    ),
+                ),
+                ("period_start", models.DateField(verbose_name="기간 시작일")),
+                ("total_distance", models.FloatField(default=0, verbose_name="운동 거리")),
+                ("total_time", models.FloatField(default=0, verbose_name="운동 시간(초)")),
+                ("total_calories", models.FloatField(default=0, verbose_name="운동 칼로리")),
+                (
+                    "session_count",
+                    models.PositiveIntegerField(default=0, verbose_name="운동 횟수"),
+                ),
+                (
+                    "best_pace",
+                    models.FloatField(null=True, verbose_name="최고 페이스(거리당 초)"),
+                ),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="exercise_statistics",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name="exercisestatistics",
+            constraint=models.UniqueConstraint(
+                fields=("user", "period_type", "period_start"),
+                name="unique_exercise_statistics_period",
+            ),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 3.2.12 on 2026-10-18 21:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("exercises", "0006_exercisestatistics"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="exerciserecord",
+            index=models.Index(
+                fields=["user", "deleted_at", "start_datetime"],
+                name="exercise_record_user_list_idx",
+            ),
+        ),
+    ]
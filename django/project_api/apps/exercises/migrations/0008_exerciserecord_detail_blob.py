@@ -0,0 +1,17 @@
+# Generated by Django 3.2.12 on 2026-10-18 21:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("exercises", "0007_exerciserecord_user_list_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="exerciserecord",
+            name="detail_blob",
+            field=models.BinaryField(null=True, verbose_name="압축된 운동 상세 기록"),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 3.2.12 on 2026-10-18 22:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("exercises", "0008_exerciserecord_detail_blob"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="exerciserecord",
+            name="idempotency_key",
+            field=models.CharField(
+                max_length=64, null=True, verbose_name="중복 저장 방지 key"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="exerciserecord",
+            constraint=models.UniqueConstraint(
+                fields=("user", "idempotency_key"),
+                name="unique_exercise_record_idempotency_key",
+            ),
+        ),
+    ]
@@ -0,0 +1,90 @@
+# Generated by Django 3.2.12 on 2026-10-18 22:21
+
+from datetime import datetime, timedelta
+
+from django.db import migrations, models
+from django.db.models import Count, F, Min
+
+
+def get_period_starts(day):
+    """운동 통계 기간(일간 / 주간 / 월간)별 기간 시작일"""
+    return {
+        "day": day,
+        "week": day - timedelta(days=day.weekday()),
+        "month": day.replace(day=1),
+    }
+
+
+def delete_duplicate_exercise_records(apps, schema_editor):
+    """
+    같은 유저 / 같은 시작 시간으로 중복 저장된 운동기록은 처음 저장된 기록만 남기고 삭제 처리
+    - 삭제 처리한 기록은 통계의 거리 / 시간 / 칼로리 / 횟수에서 제외
+      (재시도로 같은 값이 저장된 기록이므로 최고 페이스는 그대로 유지)
+    """
+    ExerciseRecord = apps.get_model("exercises", "ExerciseRecord")
+    ExerciseStatistics = apps.get_model("exercises", "ExerciseStatistics")
+
+    duplicates = (
+        ExerciseRecord.objects.filter(deleted_at__isnull=True)
+        .values("user_id", "start_datetime")
+        .annotate(first_id=Min("id"), record_count=Count("id"))
+        .filter(record_count__gt=1)
+    )
+    now = datetime.now()
+
+    for duplicate in duplicates.iterator():
+        records = ExerciseRecord.objects.filter(
+            user_id=duplicate["user_id"],
+            start_datetime=duplicate["start_datetime"],
+            deleted_at__isnull=True,
+        ).exclude(pk=duplicate["first_id"])
+
+        for record in records.only(
+            "user_id",
+            "start_datetime",
+            "total_distance",
+            "total_time",
+            "total_calories",
+        ):
+            total_time = (
+                record.total_time.hour * 3600
+                + record.total_time.minute * 60
+                + record.total_time.second
+                + record.total_time.microsecond / 1e6
+            )
+            for period_type, period_start in get_period_starts(
+                record.start_datetime.date()
+            ).items():
+                ExerciseStatistics.objects.filter(
+                    user_id=record.user_id,
+                    period_type=period_type,
+                    period_start=period_start,
+                ).update(
+                    total_distance=F("total_distance") - record.total_distance,
+                    total_time=F("total_time") - total_time,
+                    total_calories=F("total_calories") - record.total_calories,
+                    session_count=F("session_count") - 1,
+                    updated_at=now,
+                )
+
+        records.update(deleted_at=now)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("exercises", "0009_exerciserecord_idempotency_key"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            delete_duplicate_exercise_records, migrations.RunPython.noop
+        ),
+        migrations.AddConstraint(
+            model_name="exerciserecord",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=("user", "start_datetime"),
+                name="unique_exercise_record_user_start",
+            ),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 3.2.12 on 2026-10-19 10:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("exercises", "0010_exerciserecord_unique_user_start"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="exerciserecord",
+            name="exercise_record_user_list_idx",
+        ),
+        migrations.AddIndex(
+            model_name="exerciserecord",
+            index=models.Index(
+                fields=["user", "deleted_at", "start_datetime", "id"],
+                name="exercise_record_user_list_idx",
+            ),
+        ),
+    ]
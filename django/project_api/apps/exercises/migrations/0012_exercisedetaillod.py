@@ -0,0 +1,45 @@
+# Generated by Django 3.2.12 on 2026-10-19 11:20
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("exercises", "0011_exerciserecord_user_list_idx_id"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ExerciseDetailLOD",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("points", models.PositiveIntegerField(verbose_name="최대 포인트 개수")),
+                ("data", models.JSONField(verbose_name="downsampling 결과")),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "exercise_record",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="detail_lods",
+                        to="exercises.exerciserecord",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name="exercisedetaillod",
+            constraint=models.UniqueConstraint(
+                fields=("exercise_record", "points"),
+                name="unique_exercise_detail_lod_points",
+            ),
+        ),
+    ]
@@ -14,11 +14,43 @@ class ExerciseRecord(models.Model):
     total_calories = models.FloatField(verbose_name="운동 칼로리")
     created_at = models.DateTimeField(auto_now_add=True)
     deleted_at = models.DateTimeField(null=True)
+    # EXERCISE_DETAIL_STORAGE가 "blob"인 경우 상세 기록 전체를 압축해서 저장 (exercises/detail_blob.py)
+    detail_blob = models.BinaryField(
+        verbose_name="압축된 운동 상세 기록",
+        null=True,
+    )
+    # 앱에서 운동기록마다 만든 key (같은 기록을 다시 보내도 한번만 저장, exercises/sync.py)
+    idempotency_key = models.CharField(
+        verbose_name="중복 저장 방지 key",
+        max_length=64,
+        null=True,
+    )
     user = models.ForeignKey(
         "users.User",
         on_delete=models.CASCADE,
     )
 
+    class Meta:
+        # 유저별 운동기록 리스트 (keyset pagination) 조회용 인덱스
+        indexes = [
+            models.Index(
+                fields=["user", "deleted_at", "start_datetime", "id"],
+                name="exercise_record_user_list_idx",
+            ),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "idempotency_key"],
+                name="unique_exercise_record_idempotency_key",
+            ),
+            # 같은 운동기록을 다시 보낸 경우(Idempotency-Key 없이 재시도) 중복 저장 방지
+            models.UniqueConstraint(
+                fields=["user", "start_datetime"],
+                condition=models.Q(deleted_at__isnull=True),
+                name="unique_exercise_record_user_start",
+            ),
+        ]
+
 
 class ExerciseDetailRecord(models.Model):
     """
@@ -47,3 +79,72 @@ class ExerciseDetailRecord(models.Model):
         on_delete=models.CASCADE,
         related_name="exercise_detail_record",
     )
+
+
+class ExerciseDetailLOD(models.Model):
+    """
+    운동 상세 기록 downsampling 결과 (운동기록 / 포인트 개수별, exercises/lod.py)
+    - 저장된 상세 기록은 수정되지 않으므로 한번 계산한 결과를 계속 사용
+    """
+
+    points = models.PositiveIntegerField(verbose_name="최대 포인트 개수")
+    data = models.JSONField(verbose_name="downsampling 결과")
+    created_at = models.DateTimeField(auto_now_add=True)
+    exercise_record = models.ForeignKey(
+        ExerciseRecord,
+        on_delete=models.CASCADE,
+        related_name="detail_lods",
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["exercise_record", "points"],
+                name="unique_exercise_detail_lod_points",
+            ),
+        ]
+
+
+class ExerciseStatisticsPeriodType(models.TextChoices):
+    """운동 통계 기간 타입"""
+
+    DAY = "day", "일간"
+    WEEK = "week", "주간"
+    MONTH = "month", "월간"
+
+
+class ExerciseStatistics(models.Model):
+    """
+    유저별 기간(일간 / 주간 / 월간) 운동 통계
+    - 운동기록 저장 / 삭제시 해당 기간의 값을 증감하여 갱신
+    - 주간 통계의 기간 시작일은 월요일, 월간 통계의 기간 시작일은 1일
+    """
+
+    period_type = models.CharField(
+        verbose_name="기간 타입",
+        max_length=5,
+        choices=ExerciseStatisticsPeriodType.choices,
+    )
+    period_start = models.DateField(verbose_name="기간 시작일")
+    total_distance = models.FloatField(verbose_name="운동 거리", default=0)
+    total_time = models.FloatField(verbose_name="운동 시간(초)", default=0)
+    total_calories = models.FloatField(verbose_name="운동 칼로리", default=0)
+    session_count = models.PositiveIntegerField(verbose_name="운동 횟수", default=0)
+    best_pace = models.FloatField(
+        verbose_name="최고 페이스(거리당 초)",
+        null=True,
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+    user = models.ForeignKey(
+        "users.User",
+        on_delete=models.CASCADE,
+        related_name="exercise_statistics",
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "period_type", "period_start"],
+                name="unique_exercise_statistics_period",
+            ),
+        ]
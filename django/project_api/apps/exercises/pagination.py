@@ -0,0 +1,111 @@
+# exercises/pagination.py
+import base64
+from collections import OrderedDict
+from datetime import datetime
+
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+from django.db import connection
+
+
+class ExerciseRecordCursorPagination(BasePagination):
+    """
+    운동기록 리스트용 keyset(cursor) pagination
+
+    - (start_datetime, id) 내림차순으로 정렬하고, 마지막으로 내려준 기록의 (start_datetime, id)를
+      cursor로 사용하여 그 이후의 기록만 조회 (OFFSET을 사용하지 않기 때문에 페이지 깊이와 상관없이 일정한 비용)
+    - cursor 조건은 row 비교((start_datetime, id) < (%s, %s))로 조회해서 인덱스 범위 검색으로 처리
+      (OR 조건으로 나누면 DB가 인덱스 범위를 사용하지 못하고 필터로 처리할 수 있음)
+    - queryset은 start_datetime, id 필드를 포함한 values() queryset이어야 함
+    """
+
+    page_size = 20
+    max_page_size = 100
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    invalid_cursor_message = "Invalid cursor"
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+
+        if page_size <= 0:
+            return self.page_size
+
+        return min(page_size, self.max_page_size)
+
+    def encode_cursor(self, start_datetime, pk):
+        position = f"{start_datetime.isoformat()},{pk}"
+        return base64.urlsafe_b64encode(position.encode("ascii")).decode("ascii")
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param, None)
+        if not encoded:
+            return None
+
+        try:
+            position = base64.urlsafe_b64decode(encoded.encode("ascii")).decode("ascii")
+            start_datetime, pk = position.rsplit(",", 1)
+            return datetime.fromisoformat(start_datetime), int(pk)
+        except (TypeError, ValueError, UnicodeError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def get_cursor_condition(self, model):
+        """(start_datetime, id) < (%s, %s) row 비교 조건"""
+        quote_name = connection.ops.quote_name
+        table = quote_name(model._meta.db_table)
+        columns = [
+            f"{table}.{quote_name(model._meta.get_field(field_name).column)}"
+            for field_name in ("start_datetime", "id")
+        ]
+        return f"({', '.join(columns)}) < (%s, %s)"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+
+        cursor = self.decode_cursor(request)
+        if cursor is not None:
+            start_datetime, pk = cursor
+            queryset = queryset.extra(
+                where=[self.get_cursor_condition(queryset.model)],
+                params=[start_datetime, pk],
+            )
+
+        rows = list(queryset.order_by("-start_datetime", "-id")[: self.page_size + 1])
+        has_next = len(rows) > self.page_size
+        rows = rows[: self.page_size]
+
+        self.next_cursor = None
+        if has_next:
+            self.next_cursor = self.encode_cursor(
+                rows[-1]["start_datetime"], rows[-1]["id"]
+            )
+
+        return rows
+
+    def get_next_link(self):
+        if self.next_cursor is None:
+            return None
+
+        return replace_query_param(
+            self.request.build_absolute_uri(),
+            self.cursor_query_param,
+            self.next_cursor,
+        )
+
+    def get_paginated_response(self, data):
+        return Response(
+            OrderedDict(
+                [
+                    ("next", self.get_next_link()),
+                    ("cursor", self.next_cursor),
+                    ("results", data),
+                ]
+            )
+        )
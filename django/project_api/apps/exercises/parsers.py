@@ -0,0 +1,32 @@
+# exercises/parsers.py
+import msgpack
+from project_api.parsers import ORJSONParser
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+
+COLUMNAR_JSON_MEDIA_TYPE = "application/vnd.exercise.columnar+json"
+COLUMNAR_MSGPACK_MEDIA_TYPE = "application/vnd.exercise.columnar+msgpack"
+
+
+class ColumnarJSONParser(ORJSONParser):
+    """
+    운동 상세 기록을 필드별 배열(columnar) 형태로 보내는 JSON body parser
+    """
+
+    media_type = COLUMNAR_JSON_MEDIA_TYPE
+    columnar = True
+
+
+class ColumnarMsgPackParser(BaseParser):
+    """
+    운동 상세 기록을 필드별 배열(columnar) 형태로 보내는 msgpack body parser
+    """
+
+    media_type = COLUMNAR_MSGPACK_MEDIA_TYPE
+    columnar = True
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            return msgpack.unpackb(stream.read(), raw=False)
+        except (ValueError, TypeError) as exc:
+            raise ParseError(f"MessagePack parse error - {exc}")
@@ -0,0 +1,35 @@
+# exercises/renderers.py
+import msgpack
+from project_api.renderers import ORJSONRenderer
+from exercises.parsers import COLUMNAR_JSON_MEDIA_TYPE, COLUMNAR_MSGPACK_MEDIA_TYPE
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class ColumnarJSONRenderer(ORJSONRenderer):
+    """
+    운동 상세 기록을 필드별 배열(columnar) 형태로 내려주는 JSON renderer
+    """
+
+    media_type = COLUMNAR_JSON_MEDIA_TYPE
+    format = "columnar"
+    columnar = True
+
+
+class ColumnarMsgPackRenderer(BaseRenderer):
+    """
+    운동 상세 기록을 필드별 배열(columnar) 형태로 내려주는 msgpack renderer
+    - datetime / time / Decimal 등은 JSON과 동일한 문자열 형식으로 변환
+    """
+
+    media_type = COLUMNAR_MSGPACK_MEDIA_TYPE
+    format = "columnar-msgpack"
+    charset = None
+    render_style = "binary"
+    columnar = True
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        return msgpack.packb(data, default=JSONEncoder().default, use_bin_type=True)
@@ -1,7 +1,18 @@
-from exercises.models import ExerciseRecord
+from typing import Final
+
+from project_api.response_schema import ResponseSchema
+from exercises.downsampling import (
+    EXERCISE_DETAIL_LOD_DEFAULT_POINTS,
+    EXERCISE_DETAIL_LOD_MAX_POINTS,
+    EXERCISE_DETAIL_LOD_MIN_POINTS,
+)
+from exercises.models import ExerciseRecord, ExerciseStatisticsPeriodType
 from rest_framework import serializers
 from users.serializers import UserSimpleSerializer
 
+# 운동기록 동기화 API에서 한번에 보낼 수 있는 최대 운동기록 개수
+EXERCISE_SYNC_MAX_RECORDS: Final = 50
+
 
 class ExerciseDetailRecordSerializer(serializers.Serializer):
     start_time = serializers.DateTimeField()
@@ -14,15 +25,53 @@ class ExerciseDetailRecordSerializer(serializers.Serializer):
     speed = serializers.FloatField()
 
 
-class ExerciseRecordSaveSerializer(serializers.Serializer):
+exercise_detail_record_schema = ResponseSchema(ExerciseDetailRecordSerializer)
+
+
+class ExerciseRecordSummarySerializer(serializers.Serializer):
     start_datetime = serializers.DateTimeField()
     total_distance = serializers.FloatField()
     total_time = serializers.TimeField()
     average_speed = serializers.FloatField()
     total_calories = serializers.FloatField()
+
+
+class ExerciseRecordSaveSerializer(ExerciseRecordSummarySerializer):
     detail = ExerciseDetailRecordSerializer(many=True)
 
 
+class ExerciseRecordSyncItemSerializer(ExerciseRecordSummarySerializer):
+    idempotency_key = serializers.CharField(max_length=64)
+
+
+class ExerciseRecordSyncItemSaveSerializer(ExerciseRecordSyncItemSerializer):
+    detail = ExerciseDetailRecordSerializer(many=True)
+
+
+class ExerciseRecordSyncSerializer(serializers.Serializer):
+    # 운동기록별 검증은 exercises/sync.py에서 따로 처리 (잘못된 기록이 있어도 나머지는 저장)
+    records = serializers.ListField(
+        child=serializers.DictField(),
+        allow_empty=False,
+        max_length=EXERCISE_SYNC_MAX_RECORDS,
+    )
+
+
+class ExerciseRecordSyncSaveSerializer(serializers.Serializer):
+    records = ExerciseRecordSyncItemSaveSerializer(many=True)
+
+
+class ExerciseRecordSyncResultSerializer(serializers.Serializer):
+    idempotency_key = serializers.CharField(allow_null=True)
+    status = serializers.CharField()
+    id = serializers.IntegerField(allow_null=True)
+    errors = serializers.JSONField(required=False)
+
+
+class ExerciseRecordSyncResponseSerializer(serializers.Serializer):
+    results = ExerciseRecordSyncResultSerializer(many=True)
+
+
 class ExerciseRecordSerializer(serializers.Serializer):
     id = serializers.IntegerField(required=False)
     start_datetime = serializers.DateTimeField(required=False)
@@ -34,6 +83,9 @@ class ExerciseRecordSerializer(serializers.Serializer):
     detail = ExerciseDetailRecordSerializer(many=True, required=False)
 
 
+exercise_record_schema = ResponseSchema(ExerciseRecordSerializer)
+
+
 class ExerciseRecordListSerializer(serializers.Serializer):
     id = serializers.IntegerField(required=False)
     start_datetime = serializers.DateTimeField(required=False)
@@ -41,3 +93,65 @@ class ExerciseRecordListSerializer(serializers.Serializer):
     total_time = serializers.TimeField(required=False)
     average_speed = serializers.FloatField(required=False)
     total_calories = serializers.FloatField(required=False)
+
+
+class ExerciseRecordMetricsSerializer(serializers.Serializer):
+    sample_count = serializers.IntegerField(required=False)
+    total_distance = serializers.FloatField(required=False)
+    total_time = serializers.FloatField(required=False)
+    moving_time = serializers.FloatField(required=False)
+    average_speed = serializers.FloatField(required=False)
+    average_pace = serializers.FloatField(allow_null=True, required=False)
+    elevation_gain = serializers.FloatField(required=False)
+    average_heart_rate = serializers.FloatField(allow_null=True, required=False)
+    max_heart_rate = serializers.IntegerField(allow_null=True, required=False)
+    heart_rate_zones = serializers.ListField(
+        child=serializers.FloatField(), required=False
+    )
+
+
+class ExerciseDetailLODQuerySerializer(serializers.Serializer):
+    points = serializers.IntegerField(
+        min_value=EXERCISE_DETAIL_LOD_MIN_POINTS,
+        max_value=EXERCISE_DETAIL_LOD_MAX_POINTS,
+        default=EXERCISE_DETAIL_LOD_DEFAULT_POINTS,
+    )
+
+
+class ExerciseDetailLODRouteSerializer(serializers.Serializer):
+    start_time_offset = serializers.ListField(child=serializers.FloatField())
+    latitude = serializers.ListField(child=serializers.FloatField())
+    longitude = serializers.ListField(child=serializers.FloatField())
+
+
+class ExerciseDetailLODSeriesSerializer(serializers.Serializer):
+    start_time_offset = serializers.ListField(child=serializers.FloatField())
+    value = serializers.ListField(child=serializers.FloatField())
+
+
+class ExerciseDetailLODSerializer(serializers.Serializer):
+    points = serializers.IntegerField()
+    sample_count = serializers.IntegerField()
+    route = ExerciseDetailLODRouteSerializer()
+    heart_rate = ExerciseDetailLODSeriesSerializer()
+    speed = ExerciseDetailLODSeriesSerializer()
+    altitude = ExerciseDetailLODSeriesSerializer()
+
+
+class ExerciseStatisticsQuerySerializer(serializers.Serializer):
+    period_type = serializers.ChoiceField(
+        choices=ExerciseStatisticsPeriodType,
+        required=False,
+        default=ExerciseStatisticsPeriodType.WEEK.value,
+    )
+    date = serializers.DateField(required=False)
+
+
+class ExerciseStatisticsSerializer(serializers.Serializer):
+    period_type = serializers.CharField(required=False)
+    period_start = serializers.DateField(required=False)
+    total_distance = serializers.FloatField(required=False, default=0)
+    total_time = serializers.FloatField(required=False, default=0)
+    total_calories = serializers.FloatField(required=False, default=0)
+    session_count = serializers.IntegerField(required=False, default=0)
+    best_pace = serializers.FloatField(allow_null=True, required=False, default=None)
@@ -0,0 +1,167 @@
+# exercises/statistics.py
+"""statistics 모듈 설명
+
+유저별 일간 / 주간 / 월간 운동 통계(ExerciseStatistics)를 갱신하기 위한 모듈
+
+- 운동기록을 저장 / 삭제할 때마다 해당 기간의 통계 row를 증감해서 갱신 (조회할 때 운동기록을 집계하지 않음)
+- 여러 운동기록을 한번에 저장하는 경우(동기화) 기간별로 합쳐서 기간마다 한번씩 갱신
+- 통계 값이 어긋난 경우 rebuild_exercise_statistics 커맨드로 다시 계산
+"""
+from datetime import datetime, time, timedelta
+
+from exercises.models import (
+    ExerciseRecord,
+    ExerciseStatistics,
+    ExerciseStatisticsPeriodType,
+)
+
+from django.db.models import F, Value
+from django.db.models.functions import Coalesce, Least
+
+
+def time_to_seconds(value):
+    return (
+        value.hour * 3600 + value.minute * 60 + value.second + value.microsecond / 1e6
+    )
+
+
+def get_exercise_pace(total_time_seconds, total_distance):
+    if not total_distance or total_distance <= 0:
+        return None
+
+    return total_time_seconds / total_distance
+
+
+def get_statistics_period_start(period_type, day):
+    if period_type == ExerciseStatisticsPeriodType.WEEK:
+        return day - timedelta(days=day.weekday())
+    if period_type == ExerciseStatisticsPeriodType.MONTH:
+        return day.replace(day=1)
+    return day
+
+
+def get_statistics_period_end(period_type, period_start):
+    if period_type == ExerciseStatisticsPeriodType.WEEK:
+        return period_start + timedelta(days=7)
+    if period_type == ExerciseStatisticsPeriodType.MONTH:
+        return (period_start.replace(day=28) + timedelta(days=4)).replace(day=1)
+    return period_start + timedelta(days=1)
+
+
+def get_period_best_pace(user_id, period_type, period_start):
+    """
+    해당 기간의 삭제되지 않은 운동기록 중 최고 페이스
+    """
+    period_end = get_statistics_period_end(period_type, period_start)
+    records = ExerciseRecord.objects.filter(
+        user_id=user_id,
+        deleted_at__isnull=True,
+        start_datetime__gte=datetime.combine(period_start, time.min),
+        start_datetime__lt=datetime.combine(period_end, time.min),
+    ).values_list("total_time", "total_distance")
+
+    paces = [
+        get_exercise_pace(time_to_seconds(total_time), total_distance)
+        for total_time, total_distance in records
+    ]
+
+    return min((pace for pace in paces if pace is not None), default=None)
+
+
+def update_exercise_statistics(exercise_record, sign=1):
+    """
+    운동기록 저장(sign=1) / 삭제(sign=-1)시 일간 / 주간 / 월간 통계를 증감하여 갱신
+    - 최고 페이스는 삭제되는 기록이 최고 페이스였던 경우에만 해당 기간의 기록으로 다시 계산
+    - 호출하는 쪽에서 transaction.atomic()으로 감싸서 사용해야 함
+    """
+    total_time = time_to_seconds(exercise_record.total_time)
+    pace = get_exercise_pace(total_time, exercise_record.total_distance)
+    day = exercise_record.start_datetime.date()
+
+    for period_type in ExerciseStatisticsPeriodType.values:
+        period_start = get_statistics_period_start(period_type, day)
+        statistics, _ = ExerciseStatistics.objects.get_or_create(
+            user_id=exercise_record.user_id,
+            period_type=period_type,
+            period_start=period_start,
+        )
+
+        update_fields = {
+            "total_distance": F("total_distance")
+            + sign * exercise_record.total_distance,
+            "total_time": F("total_time") + sign * total_time,
+            "total_calories": F("total_calories")
+            + sign * exercise_record.total_calories,
+            "session_count": F("session_count") + sign,
+            "updated_at": datetime.now(),
+        }
+        if pace is not None:
+            if sign > 0:
+                update_fields["best_pace"] = Least(
+                    Coalesce("best_pace", Value(pace)), Value(pace)
+                )
+            elif statistics.best_pace is not None and pace <= statistics.best_pace:
+                update_fields["best_pace"] = get_period_best_pace(
+                    exercise_record.user_id, period_type, period_start
+                )
+
+        ExerciseStatistics.objects.filter(pk=statistics.pk).update(**update_fields)
+
+
+def add_exercise_statistics(exercise_records):
+    """
+    여러 운동기록을 한번에 저장할 때 일간 / 주간 / 월간 통계를 기간별로 합쳐서 갱신
+    - 같은 기간의 기록이 여러 개여도 기간마다 조회 / 갱신 쿼리는 한번씩만 실행
+    - 호출하는 쪽에서 transaction.atomic()으로 감싸서 사용해야 함
+    """
+    period_totals = {}
+    for exercise_record in exercise_records:
+        total_time = time_to_seconds(exercise_record.total_time)
+        pace = get_exercise_pace(total_time, exercise_record.total_distance)
+        day = exercise_record.start_datetime.date()
+
+        for period_type in ExerciseStatisticsPeriodType.values:
+            totals = period_totals.setdefault(
+                (
+                    exercise_record.user_id,
+                    period_type,
+                    get_statistics_period_start(period_type, day),
+                ),
+                {
+                    "total_distance": 0,
+                    "total_time": 0,
+                    "total_calories": 0,
+                    "session_count": 0,
+                    "best_pace": None,
+                },
+            )
+            totals["total_distance"] += exercise_record.total_distance
+            totals["total_time"] += total_time
+            totals["total_calories"] += exercise_record.total_calories
+            totals["session_count"] += 1
+            if pace is not None and (
+                totals["best_pace"] is None or pace < totals["best_pace"]
+            ):
+                totals["best_pace"] = pace
+
+    for (user_id, period_type, period_start), totals in period_totals.items():
+        statistics, _ = ExerciseStatistics.objects.get_or_create(
+            user_id=user_id,
+            period_type=period_type,
+            period_start=period_start,
+        )
+
+        update_fields = {
+            "total_distance": F("total_distance") + totals["total_distance"],
+            "total_time": F("total_time") + totals["total_time"],
+            "total_calories": F("total_calories") + totals["total_calories"],
+            "session_count": F("session_count") + totals["session_count"],
+            "updated_at": datetime.now(),
+        }
+        pace = totals["best_pace"]
+        if pace is not None:
+            update_fields["best_pace"] = Least(
+                Coalesce("best_pace", Value(pace)), Value(pace)
+            )
+
+        ExerciseStatistics.objects.filter(pk=statistics.pk).update(**update_fields)
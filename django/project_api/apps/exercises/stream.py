@@ -0,0 +1,218 @@
+# exercises/stream.py
+"""stream 모듈 설명
+
+운동기록 저장 요청(JSON body)을 request.stream에서 순차적으로 읽기 위한 모듈
+
+- 상세 기록이 많은 요청도 body 전체를 한번에 파싱하지 않고 chunk 단위로 읽어서 batch마다 저장
+- 사용법은 ExerciseRecordStreamReader 참조
+"""
+import codecs
+import json
+from typing import Final
+
+from project_api.utils import StandardException
+from rest_framework.exceptions import ParseError, ValidationError
+
+from django.utils.translation import ugettext_lazy
+
+# 요청 body를 한번에 읽어오는 크기 (bytes)
+STREAM_CHUNK_SIZE: Final = 64 * 1024
+JSON_WHITESPACE: Final = " \t\n\r"
+JSON_NUMBER_CHARS: Final = "0123456789+-.eE"
+
+
+class ExerciseRecordStreamReader:
+    """
+    운동기록 저장 요청(JSON body)을 한번에 메모리에 올리지 않고 순차적으로 읽어오는 reader
+
+    - read_summary()로 요약 필드를 먼저 읽고, iter_detail()로 `detail` 배열의 상세 기록을 하나씩 꺼내서 사용
+    - 필수 요약 필드(required_fields)가 모두 `detail` 보다 앞에 있으면 상세 기록을 순차적으로 읽음
+        - `detail` 이후에 요약 필드가 다시 나오면 에러 (저장 중인 기록의 요약 값이 바뀌므로)
+    - 필수 요약 필드가 `detail` 이후에 있으면 (JSON key 순서는 의미가 없으므로)
+      남은 body를 모두 읽어서 json.loads로 한번에 파싱한 뒤 요약 필드로 합쳐서 반환
+    - 읽은 body 크기가 max_bytes를 넘으면 413 에러
+      (request.stream을 직접 읽으므로 DATA_UPLOAD_MAX_MEMORY_SIZE로 제한되지 않음)
+    """
+
+    def __init__(self, stream, chunk_size=STREAM_CHUNK_SIZE, max_bytes=None):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.max_bytes = max_bytes
+        self.bytes_read = 0
+        self.buffer = ""
+        self.pos = 0
+        self.eof = stream is None
+        self.has_detail = False
+        self.summary_keys = ()
+        # `detail` 이후의 필드까지 읽은 경우 메모리에 올린 상세 기록
+        self.is_detail_loaded = False
+        self.detail = None
+        self.decoder = json.JSONDecoder()
+        self.text_decoder = codecs.getincrementaldecoder("utf-8")()
+
+    def _read_chunk(self):
+        """다음 chunk를 읽어서 문자열로 반환 (이미 끝까지 읽었으면 None)"""
+        if self.eof:
+            return None
+
+        chunk = self.stream.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            chunk = b""
+
+        self.bytes_read += len(chunk)
+        if self.max_bytes is not None and self.bytes_read > self.max_bytes:
+            raise StandardException(413, ugettext_lazy("Request body is too large"))
+
+        try:
+            return self.text_decoder.decode(chunk, final=self.eof)
+        except UnicodeDecodeError as e:
+            raise ParseError(f"JSON parse error - {e}")
+
+    def _fill(self):
+        text = self._read_chunk()
+        if text is None:
+            return False
+
+        # 이미 읽은 부분은 버퍼에서 제거
+        self.buffer = self.buffer[self.pos :] + text
+        self.pos = 0
+
+        return True
+
+    def _read_rest(self):
+        """아직 파싱하지 않은 나머지 body 전체"""
+        texts = [self.buffer[self.pos :]]
+        while True:
+            text = self._read_chunk()
+            if text is None:
+                break
+            texts.append(text)
+
+        self.buffer = ""
+        self.pos = 0
+        return "".join(texts)
+
+    def _peek(self):
+        while True:
+            while (
+                self.pos < len(self.buffer) and self.buffer[self.pos] in JSON_WHITESPACE
+            ):
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                raise ParseError("JSON parse error - unexpected end of data")
+
+    def _expect(self, char):
+        if self._peek() != char:
+            raise ParseError(f"JSON parse error - expecting '{char}'")
+        self.pos += 1
+
+    def _decode_value(self):
+        self._peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError as e:
+                if self._fill():
+                    continue
+                raise ParseError(f"JSON parse error - {e}")
+
+            # 숫자 값이 chunk 경계에서 잘렸을 수 있으므로 더 읽어서 다시 파싱
+            is_truncated = end == len(self.buffer) or (
+                isinstance(value, (int, float))
+                and self.buffer[end] in JSON_NUMBER_CHARS
+            )
+            if is_truncated and self._fill():
+                continue
+
+            self.pos = end
+            return value
+
+    def _read_members(self, summary):
+        """`,` 또는 `}` 다음부터 객체의 나머지 필드를 읽어서 summary에 추가"""
+        while self._peek() == ",":
+            self.pos += 1
+            key = self._decode_value()
+            if not isinstance(key, str):
+                raise ParseError("JSON parse error - expecting property name")
+            self._expect(":")
+            summary[key] = self._decode_value()
+        self._expect("}")
+
+    def read_summary(self, required_fields=()):
+        summary = {}
+
+        self._expect("{")
+        if self._peek() == "}":
+            self.pos += 1
+            return summary
+
+        while True:
+            key = self._decode_value()
+            if not isinstance(key, str):
+                raise ParseError("JSON parse error - expecting property name")
+            self._expect(":")
+
+            if key == "detail":
+                self.has_detail = True
+                if all(field_name in summary for field_name in required_fields):
+                    self.summary_keys = tuple(summary)
+                    return summary
+
+                # 필수 요약 필드가 뒤에 있는 경우
+                # - 큰 `detail` 값을 chunk마다 다시 파싱하지 않도록 남은 body를 한번에 파싱
+                try:
+                    members = json.loads('{"detail":' + self._read_rest())
+                except ValueError as e:
+                    raise ParseError(f"JSON parse error - {e}")
+                self.is_detail_loaded = True
+                self.detail = members.pop("detail")
+                summary.update(members)
+                return summary
+
+            summary[key] = self._decode_value()
+
+            if self._peek() == ",":
+                self.pos += 1
+                continue
+            self._expect("}")
+            return summary
+
+    def iter_detail(self):
+        if not self.has_detail:
+            raise ValidationError(
+                {"detail": [ugettext_lazy("This field is required.")]}
+            )
+
+        if self.is_detail_loaded:
+            if not isinstance(self.detail, list):
+                raise ValidationError(
+                    {"detail": [ugettext_lazy("Expected a list of items.")]}
+                )
+            yield from self.detail
+            return
+
+        self._expect("[")
+        if self._peek() == "]":
+            self.pos += 1
+        else:
+            while True:
+                yield self._decode_value()
+                if self._peek() == ",":
+                    self.pos += 1
+                    continue
+                self._expect("]")
+                break
+
+        # detail 이후의 필드는 이미 저장한 요약 필드와 겹치지 않는 경우만 허용
+        trailing = {}
+        self._read_members(trailing)
+        repeated = [
+            key for key in trailing if key in self.summary_keys or key == "detail"
+        ]
+        if repeated:
+            raise ParseError(
+                f"JSON parse error - duplicate keys: {', '.join(repeated)}"
+            )
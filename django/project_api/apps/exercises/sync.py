@@ -0,0 +1,281 @@
+# exercises/sync.py
+"""sync 모듈 설명
+
+오프라인에서 기록한 여러 운동기록을 한번의 요청으로 저장(동기화)하기 위한 모듈
+
+- 앱은 운동기록마다 idempotency_key(예: 기기에서 만든 UUID)를 붙여서 보내고,
+  같은 유저가 같은 idempotency_key로 이미 저장한 기록은 다시 저장하지 않음 (재시도해도 중복 저장 없음)
+    - 운동기록 저장 API와 같이 시작 시간(start_datetime)이 같은 기록(삭제되지 않은 기록)도 이미 저장된 기록으로 처리
+- 운동기록마다 따로 검증해서 결과(created / duplicate / invalid)를 내려주고,
+  잘못된 기록이 있어도 나머지 기록은 저장
+- 검증을 통과한 기록은 한 transaction에서 몇 번의 쿼리로 저장
+    - ExerciseRecord: bulk_create 한번
+      (bulk_create로 id를 받아오지 못하는 DB(sqlite 등)에서는 (user, idempotency_key)로 id를 한번 더 조회)
+    - ExerciseDetailRecord: 전체 기록의 상세 기록을 EXERCISE_DETAIL_BULK_CREATE_SIZE 단위로 bulk_create
+      (blob 저장 방식에서는 ExerciseRecord.detail_blob으로 같이 저장)
+    - 운동 통계: 기간별로 합쳐서 기간마다 한번씩 갱신
+- 다른 요청에서 같은 기록을 동시에 저장한 경우 unique 제약으로 실패하므로,
+  저장된 기록을 다시 조회해서 남은 기록만 한번 더 저장
+"""
+from typing import Final
+
+from exercises.columnar import decode_exercise_detail_columns
+from exercises.metrics import ExerciseMetricsAccumulator
+from exercises.models import ExerciseDetailRecord, ExerciseRecord
+from exercises.serializers import ExerciseRecordSyncItemSerializer
+from exercises.statistics import add_exercise_statistics
+from exercises.utils import (
+    DETAIL_FIELDS,
+    DETAIL_STORAGE_BLOB,
+    EXERCISE_DETAIL_BATCH_SIZE,
+    encode_exercise_detail_blob,
+    iter_batches,
+    set_exercise_summary,
+    validate_exercise_detail_batch,
+)
+from rest_framework.exceptions import ValidationError
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from django.utils.translation import ugettext_lazy
+
+# 운동기록별 동기화 결과
+EXERCISE_SYNC_CREATED: Final = "created"
+EXERCISE_SYNC_DUPLICATE: Final = "duplicate"
+EXERCISE_SYNC_INVALID: Final = "invalid"
+# 동시에 같은 기록을 저장해서 실패한 경우 다시 시도하는 횟수
+EXERCISE_SYNC_RETRIES: Final = 1
+# 상세 기록 bulk_create 단위 (INSERT 한번의 파라미터 개수가 postgres 제한(65535)보다 작도록)
+EXERCISE_DETAIL_BULK_CREATE_SIZE: Final = 5000
+
+
+class ExerciseSyncEntry:
+    """검증을 통과한 동기화 요청 운동기록"""
+
+    def __init__(self, index, idempotency_key, summary, columns):
+        self.index = index
+        self.idempotency_key = idempotency_key
+        self.summary = summary
+        self.columns = columns
+        # 같은 요청 안에서 idempotency_key 또는 시작 시간이 같은 첫번째 기록 (자기 자신 포함)
+        self.original = self
+
+
+def get_sync_detail_columns(start_datetime, detail):
+    """
+    동기화 요청 운동기록의 상세 기록을 DETAIL_FIELDS 순서의 컬럼 리스트로 검증 / 변환
+    - 샘플 리스트: 운동기록 저장 API와 같이 EXERCISE_DETAIL_BATCH_SIZE 단위로 serializer 검증
+    - 필드별 배열(dict): columnar 형식 (start_time_offset)
+    """
+    if isinstance(detail, dict):
+        return decode_exercise_detail_columns(start_datetime, detail)
+    if not isinstance(detail, list):
+        raise ValidationError({"detail": [ugettext_lazy("This field is required.")]})
+
+    columns = [[] for _ in DETAIL_FIELDS]
+    for offset, batch in iter_batches(detail, EXERCISE_DETAIL_BATCH_SIZE):
+        for column, values in zip(
+            columns, validate_exercise_detail_batch(batch, offset)
+        ):
+            column.extend(values)
+
+    return columns
+
+
+def validate_sync_item(index, item):
+    serializer = ExerciseRecordSyncItemSerializer(data=item)
+    serializer.is_valid(raise_exception=True)
+    summary = dict(serializer.validated_data)
+    idempotency_key = summary.pop("idempotency_key")
+
+    return ExerciseSyncEntry(
+        index,
+        idempotency_key,
+        summary,
+        get_sync_detail_columns(summary["start_datetime"], item.get("detail", None)),
+    )
+
+
+def get_saved_exercise_record_ids(user, entries):
+    """
+    idempotency_key 또는 시작 시간(삭제되지 않은 기록)이 같은 저장된 운동기록 id
+    - 반환: {entry.index: 운동기록 id} (저장된 기록이 없는 entry는 제외)
+    """
+    saved_records = ExerciseRecord.objects.filter(
+        Q(idempotency_key__in=[entry.idempotency_key for entry in entries])
+        | Q(
+            start_datetime__in=[entry.summary["start_datetime"] for entry in entries],
+            deleted_at__isnull=True,
+        ),
+        user=user,
+    ).values_list("id", "idempotency_key", "start_datetime", "deleted_at")
+
+    ids_by_key = {}
+    ids_by_start = {}
+    for (
+        exercise_record_id,
+        idempotency_key,
+        start_datetime,
+        deleted_at,
+    ) in saved_records:
+        ids_by_key[idempotency_key] = exercise_record_id
+        if deleted_at is None:
+            ids_by_start[start_datetime] = exercise_record_id
+
+    saved_ids = {}
+    for entry in entries:
+        exercise_record_id = ids_by_key.get(
+            entry.idempotency_key, ids_by_start.get(entry.summary["start_datetime"])
+        )
+        if exercise_record_id is not None:
+            saved_ids[entry.index] = exercise_record_id
+
+    return saved_ids
+
+
+def set_exercise_record_ids(user, exercise_records):
+    """
+    bulk_create 후 id가 없는 운동기록에 id 설정
+    - INSERT ... RETURNING을 사용하지 못하는 DB(django 3.2의 sqlite 등)는 bulk_create가 id를 설정하지 않으므로
+      unique 제약이 있는 (user, idempotency_key)로 저장한 기록의 id를 다시 조회
+    """
+    missing = [
+        exercise_record
+        for exercise_record in exercise_records
+        if exercise_record.pk is None
+    ]
+    if not missing:
+        return
+
+    ids_by_key = dict(
+        ExerciseRecord.objects.filter(
+            user=user,
+            idempotency_key__in=[
+                exercise_record.idempotency_key for exercise_record in missing
+            ],
+        ).values_list("idempotency_key", "id")
+    )
+    for exercise_record in missing:
+        exercise_record.pk = ids_by_key[exercise_record.idempotency_key]
+        exercise_record._state.adding = False
+
+
+def iter_exercise_detail_records(exercise_records, entries):
+    for exercise_record, entry in zip(exercise_records, entries):
+        for row in zip(*entry.columns):
+            yield ExerciseDetailRecord(
+                **dict(zip(DETAIL_FIELDS, row)),
+                exercise_recode=exercise_record,
+            )
+
+
+def create_exercise_records(user, entries, max_heart_rate=None):
+    """
+    검증한 운동기록을 상세 기록 / 통계와 함께 저장
+    - max_heart_rate를 넘기면 상세 기록으로 거리 / 시간 / 평균 속도를 서버에서 계산해서 저장
+    """
+    is_blob_storage = settings.EXERCISE_DETAIL_STORAGE == DETAIL_STORAGE_BLOB
+    exercise_records = []
+    for entry in entries:
+        exercise_record = ExerciseRecord(
+            **entry.summary,
+            idempotency_key=entry.idempotency_key,
+            user=user,
+        )
+        if max_heart_rate is not None:
+            metrics = ExerciseMetricsAccumulator(max_heart_rate=max_heart_rate)
+            metrics.add_columns(dict(zip(DETAIL_FIELDS, entry.columns)))
+            set_exercise_summary(exercise_record, metrics.result())
+        if is_blob_storage:
+            exercise_record.detail_blob = encode_exercise_detail_blob(
+                exercise_record.start_datetime, entry.columns
+            )
+        exercise_records.append(exercise_record)
+
+    with transaction.atomic():
+        ExerciseRecord.objects.bulk_create(exercise_records)
+        set_exercise_record_ids(user, exercise_records)
+
+        if not is_blob_storage:
+            for _, batch in iter_batches(
+                iter_exercise_detail_records(exercise_records, entries),
+                EXERCISE_DETAIL_BULK_CREATE_SIZE,
+            ):
+                ExerciseDetailRecord.objects.bulk_create(batch)
+
+        add_exercise_statistics(exercise_records)
+
+    return exercise_records
+
+
+def sync_exercise_records(user, items, max_heart_rate=None):
+    """
+    여러 운동기록을 idempotency_key 기준으로 중복 없이 저장
+    - items: 요청의 운동기록 리스트
+    - 반환: items 순서대로 {"idempotency_key", "status", "id"(, "errors")} 리스트
+    """
+    results = [None] * len(items)
+    entries = []
+    for index, item in enumerate(items):
+        try:
+            entries.append(validate_sync_item(index, item))
+        except ValidationError as e:
+            results[index] = {
+                "idempotency_key": item.get("idempotency_key", None),
+                "status": EXERCISE_SYNC_INVALID,
+                "id": None,
+                "errors": e.detail,
+            }
+
+    # 같은 요청 안에서 idempotency_key 또는 시작 시간이 같은 기록은 처음 기록만 저장
+    originals_by_key = {}
+    originals_by_start = {}
+    unique_entries = []
+    for entry in entries:
+        start_datetime = entry.summary["start_datetime"]
+        original = originals_by_key.get(
+            entry.idempotency_key, originals_by_start.get(start_datetime)
+        )
+        if original is None:
+            original = entry
+            unique_entries.append(entry)
+        entry.original = original
+        originals_by_key.setdefault(entry.idempotency_key, original)
+        originals_by_start.setdefault(start_datetime, original)
+
+    for retry in range(EXERCISE_SYNC_RETRIES + 1):
+        saved_ids = get_saved_exercise_record_ids(user, unique_entries)
+        new_entries = [
+            entry for entry in unique_entries if entry.index not in saved_ids
+        ]
+        if not new_entries:
+            break
+
+        try:
+            exercise_records = create_exercise_records(
+                user, new_entries, max_heart_rate=max_heart_rate
+            )
+        except IntegrityError:
+            if retry == EXERCISE_SYNC_RETRIES:
+                raise
+            continue
+
+        for entry, exercise_record in zip(new_entries, exercise_records):
+            saved_ids[entry.index] = exercise_record.id
+            results[entry.index] = {
+                "idempotency_key": entry.idempotency_key,
+                "status": EXERCISE_SYNC_CREATED,
+                "id": exercise_record.id,
+            }
+        break
+
+    for entry in entries:
+        if results[entry.index] is None:
+            results[entry.index] = {
+                "idempotency_key": entry.idempotency_key,
+                "status": EXERCISE_SYNC_DUPLICATE,
+                "id": saved_ids[entry.original.index],
+            }
+
+    return results
@@ -1,10 +1,35 @@
 import json
+from io import StringIO
 from pathlib import Path
+from unittest import mock
 
-from conftest import unauthorized_after_login
+import msgpack
+
+from conftest import DEFAULT_EMAIL_LOGIN_DATA, login_process, unauthorized_after_login
+from exercises.idempotency import (
+    IDEMPOTENCY_KEY_MAX_LENGTH,
+    IDEMPOTENT_REPLAYED_HEADER,
+    get_exercise_record_idempotency_cache_key,
+)
+from exercises.models import (
+    ExerciseDetailLOD,
+    ExerciseDetailRecord,
+    ExerciseRecord,
+    ExerciseStatistics,
+)
+from exercises.parsers import COLUMNAR_JSON_MEDIA_TYPE, COLUMNAR_MSGPACK_MEDIA_TYPE
+from exercises.serializers import EXERCISE_SYNC_MAX_RECORDS
+from exercises.sync import EXERCISE_SYNC_DUPLICATE
+from exercises.stream import STREAM_CHUNK_SIZE
+from exercises.utils import EXERCISE_DETAIL_BATCH_SIZE
 from rest_framework import status
 from rest_framework.test import APITestCase
 
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 
@@ -42,6 +67,778 @@ class UsersTest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.client.credentials(HTTP_AUTHORIZATION=None)
 
+    def test_exercise_recode_save_in_batches(self):
+        """운동기록 상세 기록 batch 단위 저장 테스트"""
+
+        exercise_recode_save_url = reverse("exercise-record")
+
+        file_path = (
+            Path(__file__).resolve().parent / "ex_exercise_recode_save_req_body.json"
+        )
+
+        with open(file_path, "r") as file:
+            exercise_recode_save_req_body = json.load(file)
+
+        sample = exercise_recode_save_req_body["detail"][0]
+        sample_count = EXERCISE_DETAIL_BATCH_SIZE * 2 + 1
+        exercise_recode_save_req_body["detail"] = [sample] * sample_count
+
+        login_process(self.client, DEFAULT_EMAIL_LOGIN_DATA)
+
+        response = self.client.post(
+            exercise_recode_save_url,
+            exercise_recode_save_req_body,
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        exercise_record = ExerciseRecord.objects.latest("id")
+        self.assertEqual(
+            exercise_record.exercise_detail_record.count(),
+            sample_count,
+        )
+
+        # 마지막 batch의 상세 기록이 잘못된 경우 전체 저장이 롤백되어야 함
+        record_count = ExerciseRecord.objects.count()
+        exercise_recode_save_req_body["start_datetime"] = "2022-12-20T11:27:55"
+        exercise_recode_save_req_body["detail"][-1] = {**sample, "heart_rate": "x"}
+        response = self.client.post(
+            exercise_recode_save_url,
+            exercise_recode_save_req_body,
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(ExerciseRecord.objects.count(), record_count)
+        self.assertEqual(
+            ExerciseDetailRecord.objects.filter(
+                exercise_recode__user__user_code="EMAIL_USERCODE"
+            ).count(),
+            sample_count,
+        )
+        self.client.credentials(HTTP_AUTHORIZATION=None)
+
+    def test_exercise_recode_save_summary_after_detail(self):
+        """운동기록 저장 요청의 필드 순서와 관계없이 같은 결과로 저장되는지 테스트"""
+
+        exercise_recode_save_url = reverse("exercise-record")
+
+        file_path = (
+            Path(__file__).resolve().parent / "ex_exercise_recode_save_req_body.json"
+        )
+
+        with open(file_path, "r") as file:
+            exercise_recode_save_req_body = json.load(file)
+
+        login_process(self.client, DEFAULT_EMAIL_LOGIN_DATA)
+
+        # 요약 필드가 detail 뒤에 있는 경우
+        detail = exercise_recode_save_req_body.pop("detail")
+        response = self.client.post(
+            exercise_recode_save_url,
+            json.dumps({"detail": detail, **exercise_recode_save_req_body}),
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        exercise_record = ExerciseRecord.objects.latest("id")
+        self.assertEqual(
+            exercise_record.total_distance,
+            exercise_recode_save_req_body["total_distance"],
+        )
+        self.assertEqual(exercise_record.exercise_detail_record.count(), len(detail))
+
+        # detail 앞뒤로 요약 필드가 나뉘어 있는 경우
+        exercise_recode_save_req_body.pop("start_datetime")
+        response = self.client.post(
+            exercise_recode_save_url,
+            json.dumps(
+                {
+                    **exercise_recode_save_req_body,
+                    "detail": detail,
+                    "start_datetime": "2022-12-20T11:27:55",
+                }
+            ),
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            ExerciseRecord.objects.latest("id").exercise_detail_record.count(),
+            len(detail),
+        )
+
+        # 순차적으로 저장한 뒤 요약 필드가 다시 나오면 저장하지 않음
+        record_count = ExerciseRecord.objects.count()
+        response = self.client.post(
+            exercise_recode_save_url,
+            json.dumps(
+                {
+                    **exercise_recode_save_req_body,
+                    "start_datetime": "2022-12-21T11:27:55",
+                    "detail": detail,
+                }
+            )[:-1]
+            + ', "total_distance": 1.0}',
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(ExerciseRecord.objects.count(), record_count)
+
+        # detail이 없으면 JSON / form 요청 모두 에러
+        body = {
+            **exercise_recode_save_req_body,
+            "start_datetime": "2022-12-22T11:27:55",
+        }
+        response = self.client.post(exercise_recode_save_url, body, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.post(exercise_recode_save_url, body)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(ExerciseRecord.objects.count(), record_count)
+        self.client.credentials(HTTP_AUTHORIZATION=None)
+
+    def test_exercise_recode_save_large_detail_first(self):
+        """여러 chunk에 걸친 detail이 요약 필드보다 앞에 있는 요청 / body 크기 제한 테스트"""
+
+        exercise_recode_save_url = reverse("exercise-record")
+
+        file_path = (
+            Path(__file__).resolve().parent / "ex_exercise_recode_save_req_body.json"
+        )
+
+        with open(file_path, "r") as file:
+            exercise_recode_save_req_body = json.load(file)
+
+        login_process(self.client, DEFAULT_EMAIL_LOGIN_DATA)
+
+        detail = exercise_recode_save_req_body.pop("detail") * 20
+        body = json.dumps({"detail": detail, **exercise_recode_save_req_body})
+        self.assertGreater(len(body), STREAM_CHUNK_SIZE * 2)
+        response = self.client.post(
+            exercise_recode_save_url, body, content_type="application/json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            ExerciseRecord.objects.get().exercise_detail_record.count(), len(detail)
+        )
+
+        # 최대 크기를 넘는 body는 저장하지 않음
+        exercise_recode_save_req_body["start_datetime"] = "2022-12-20T11:27:55"
+        body = json.dumps({"detail": detail, **exercise_recode_save_req_body})
+        with override_settings(EXERCISE_RECORD_MAX_BODY_SIZE=STREAM_CHUNK_SIZE):
+            response = self.client.post(
+                exercise_recode_save_url, body, content_type="application/json"
+            )
+        self.assertEqual(response.status_code, status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+        self.assertEqual(ExerciseRecord.objects.count(), 1)
+        self.client.credentials(HTTP_AUTHORIZATION=None)
+
+    def test_exercise_recode_columnar(self):
+        """운동기록 columnar 형식 저장 / 상세 조회 테스트"""
+
+        exercise_recode_save_url = reverse("exercise-record")
+
+        file_path = (
+            Path(__file__).resolve().parent / "ex_exercise_recode_save_req_body.json"
+        )
+
+        with open(file_path, "r") as file:
+            exercise_recode_save_req_body = json.load(file)
+
+        detail = exercise_recode_save_req_body["detail"][:3]
+        exercise_recode_save_req_body["detail"] = {
+            "start_time_offset": [0, 1.0, 2.0],
+            "duration": [item["duration"] for item in detail],
+            "distance": [item["distance"] for item in detail],
+            "heart_rate": [item["heart_rate"] for item in detail],
+            "altitude": [item["altitude"] for item in detail],
+            "latitude": [item["latitude"] for item in detail],
+            "longitude": [None, None, None],
+            "speed": [item["speed"] for item in detail],
+        }
+
+        login_process(self.client, DEFAULT_EMAIL_LOGIN_DATA)
+
+        response = self.client.post(
+            exercise_recode_save_url,
+            msgpack.packb(exercise_recode_save_req_body),
+            content_type=COLUMNAR_MSGPACK_MEDIA_TYPE,
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        exercise_record = ExerciseRecord.objects.latest("id")
+        exercise_record_url = reverse(
+            "exercise-record-view",
+            kwargs={"exercise_record_id": exercise_record.id},
+        )
+        response = self.client.get(
+            exercise_record_url, HTTP_ACCEPT=COLUMNAR_MSGPACK_MEDIA_TYPE
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            msgpack.unpackb(response.content)["detail"],
+            exercise_recode_save_req_body["detail"],
+        )
+
+        response = self.client.get(exercise_record_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["detail"]), 3)
+
+        # 컬럼 길이가 다른 경우
+        exercise_recode_save_req_body["start_datetime"] = "2022-12-20T11:27:55"
+        exercise_recode_save_req_body["detail"]["speed"].append(1.0)
+        response = self.client.post(
+            exercise_recode_save_url,
+            msgpack.packb(exercise_recode_save_req_body),
+            content_type=COLUMNAR_MSGPACK_MEDIA_TYPE,
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        exercise_recode_save_req_body["detail"]["speed"].pop()
+
+        # NaN / inf, 소수점이 있는 정수 필드 값은 저장하지 않음
+        for field_name, value in [
+            ("speed", float("nan")),
+            ("altitude", float("inf")),
+            ("heart_rate", 120.5),
+            ("duration", float("-inf")),
+        ]:
+            column = exercise_recode_save_req_body["detail"][field_name]
+            original = column[0]
+            column[0] = value
+            response = self.client.post(
+                exercise_recode_save_url,
+                msgpack.packb(exercise_recode_save_req_body),
+                content_type=COLUMNAR_MSGPACK_MEDIA_TYPE,
+            )
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertIn(field_name, response.data["details"]["detail"])
+            column[0] = original
+
+        # 정수 값으로 표현되는 실수는 정수 필드에 저장 가능
+        exercise_recode_save_req_body["detail"]["heart_rate"][0] = 120.0
+        response = self.client.post(
+            exercise_recode_save_url,
+            msgpack.packb(exercise_recode_save_req_body),
+            content_type=COLUMNAR_MSGPACK_MEDIA_TYPE,
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        # body가 객체가 아니면 400
+        for body, content_type in [
+            (
+                msgpack.packb([exercise_recode_save_req_body]),
+                COLUMNAR_MSGPACK_MEDIA_TYPE,
+            ),
+            (json.dumps([exercise_recode_save_req_body]), COLUMNAR_JSON_MEDIA_TYPE),
+        ]:
+            response = self.client.post(
+                exercise_recode_save_url, body, content_type=content_type
+            )
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.client.credentials(HTTP_AUTHORIZATION=None)
+
+    def test_exercise_recode_server_summary(self):
+        """운동기록 서버 요약 계산 / 요약 지표 조회 테스트"""
+
+        exercise_recode_save_url = reverse("exercise-record")
+
+        file_path = (
+            Path(__file__).resolve().parent / "ex_exercise_recode_save_req_body.json"
+        )
+
+        with open(file_path, "r") as file:
+            exercise_recode_save_req_body = json.load(file)
+
+        login_process(self.client, DEFAULT_EMAIL_LOGIN_DATA)
+
+        response = self.client.post(
+            f"{exercise_recode_save_url}?summary=server",
+            exercise_recode_save_req_body,
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        exercise_record = ExerciseRecord.objects.latest("id")
+        self.assertNotEqual(
+            exercise_record.total_distance,
+            exercise_recode_save_req_body["total_distance"],
+        )
+
+        exercise_record_metrics_url = reverse(
+            "exercise-record-metrics",
+            kwargs={"exercise_record_id": exercise_record.id},
+        )
+        response = self.client.get(exercise_record_metrics_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data["sample_count"],
+            len(exercise_recode_save_req_body["detail"]),
+        )
+        self.assertAlmostEqual(
+            response.data["total_distance"], exercise_record.total_distance
+        )
+        self.client.credentials(HTTP_AUTHORIZATION=None)
+
+    def test_exercise_recode_idempotency(self):
+        """운동기록 저장 재시도시 중복 저장 방지 (Idempotency-Key / 시작 시간) 테스트"""
+
+        exercise_recode_save_url = reverse("exercise-record")
+
+        file_path = (
+            Path(__file__).resolve().parent / "ex_exercise_recode_save_req_body.json"
+        )
+
+        with open(file_path, "r") as file:
+            exercise_recode_save_req_body = json.load(file)
+
+        login_process(self.client, DEFAULT_EMAIL_LOGIN_DATA)
+
+        response = self.client.post(
+            exercise_recode_save_url,
+            exercise_recode_save_req_body,
+            format="json",
+            HTTP_IDEMPOTENCY_KEY="session-1",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(response.has_header(IDEMPOTENT_REPLAYED_HEADER))
+        exercise_record = ExerciseRecord.objects.get(idempotency_key="session-1")
+        record_count = ExerciseRecord.objects.count()
+        detail_count = ExerciseDetailRecord.objects.count()
+
+        # 같은 Idempotency-Key는 body를 읽지 않고 처음 저장한 결과로 응답 (캐시 / DB)
+        for clear_cache in (False, True):
+            if clear_cache:
+                cache.delete(
+                    get_exercise_record_idempotency_cache_key(
+                        exercise_record.user_id, "session-1"
+                    )
+                )
+            response = self.client.post(
+                exercise_recode_save_url,
+                {"start_datetime": "invalid"},
+                format="json",
+                HTTP_IDEMPOTENCY_KEY="session-1",
+            )
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(response[IDEMPOTENT_REPLAYED_HEADER], "true")
+
+        # Idempotency-Key 없이 같은 시작 시간으로 다시 보낸 경우
+        response = self.client.post(
+            exercise_recode_save_url,
+            exercise_recode_save_req_body,
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response[IDEMPOTENT_REPLAYED_HEADER], "true")
+        self.assertEqual(ExerciseRecord.objects.count(), record_count)
+        self.assertEqual(ExerciseDetailRecord.objects.count(), detail_count)
+
+        # 동기화 API에서도 이미 저장된 기록으로 처리
+        response = self.client.post(
+            reverse("exercise-record-sync"),
+            {
+                "records": [
+                    {**exercise_recode_save_req_body, "idempotency_key": "session-2"}
+                ]
+            },
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["results"][0]["status"], EXERCISE_SYNC_DUPLICATE)
+        self.assertEqual(response.data["results"][0]["id"], exercise_record.id)
+
+        response = self.client.post(
+            exercise_recode_save_url,
+            exercise_recode_save_req_body,
+            format="json",
+            HTTP_IDEMPOTENCY_KEY="x" * (IDEMPOTENCY_KEY_MAX_LENGTH + 1),
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        # 삭제한 기록과 같은 시작 시간의 기록은 다시 저장
+        response = self.client.delete(
+            reverse(
+                "exercise-record-view",
+                kwargs={"exercise_record_id": exercise_record.id},
+            )
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response = self.client.post(
+            exercise_recode_save_url,
+            exercise_recode_save_req_body,
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(response.has_header(IDEMPOTENT_REPLAYED_HEADER))
+        self.assertEqual(ExerciseRecord.objects.count(), record_count + 1)
+        self.client.credentials(HTTP_AUTHORIZATION=None)
+
+    def test_exercise_recode_detail_blob(self):
+        """운동 상세 기록 blob 저장 / 조회 / 변환 커맨드 테스트"""
+
+        exercise_recode_save_url = reverse("exercise-record")
+
+        file_path = (
+            Path(__file__).resolve().parent / "ex_exercise_recode_save_req_body.json"
+        )
+
+        with open(file_path, "r") as file:
+            exercise_recode_save_req_body = json.load(file)
+
+        response = self.client.get(exercise_recode_save_url)
+        unauthorized_after_login(self, response)
+
+        def get_detail(exercise_record_id, **kwargs):
+            response = self.client.get(
+                reverse(
+                    "exercise-record-view",
+                    kwargs={"exercise_record_id": exercise_record_id},
+                ),
+                **kwargs,
+            )
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            return response.content
+
+        # row로 저장한 기록
+        response = self.client.post(
+            exercise_recode_save_url, exercise_recode_save_req_body, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        row_record = ExerciseRecord.objects.latest("id")
+        row_detail = get_detail(row_record.id)
+
+        # blob으로 저장한 기록은 row 없이 같은 응답으로 조회
+        exercise_recode_save_req_body["start_datetime"] = "2022-12-19T11:27:54.351813"
+        with override_settings(EXERCISE_DETAIL_STORAGE="blob"):
+            response = self.client.post(
+                exercise_recode_save_url, exercise_recode_save_req_body, format="json"
+            )
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        blob_record = ExerciseRecord.objects.latest("id")
+        self.assertIsNotNone(blob_record.detail_blob)
+        self.assertFalse(
+            ExerciseDetailRecord.objects.filter(exercise_recode=blob_record).exists()
+        )
+        self.assertEqual(
+            json.loads(get_detail(blob_record.id))["detail"],
+            json.loads(row_detail)["detail"],
+        )
+
+        # 기존 row를 blob으로 변환해도 응답이 같아야 함
+        columnar_detail = get_detail(
+            row_record.id, HTTP_ACCEPT=COLUMNAR_MSGPACK_MEDIA_TYPE
+        )
+        call_command("pack_exercise_details", "--batch-size", "1", stdout=StringIO())
+
+        row_record.refresh_from_db()
+        self.assertIsNotNone(row_record.detail_blob)
+        self.assertFalse(ExerciseDetailRecord.objects.exists())
+        self.assertEqual(get_detail(row_record.id), row_detail)
+        self.assertEqual(
+            get_detail(row_record.id, HTTP_ACCEPT=COLUMNAR_MSGPACK_MEDIA_TYPE),
+            columnar_detail,
+        )
+        self.client.credentials(HTTP_AUTHORIZATION=None)
+
+    def test_exercise_recode_detail_lod(self):
+        """운동 상세 기록 downsampling 조회 테스트"""
+
+        exercise_recode_save_url = reverse("exercise-record")
+
+        file_path = (
+            Path(__file__).resolve().parent / "ex_exercise_recode_save_req_body.json"
+        )
+
+        with open(file_path, "r") as file:
+            exercise_recode_save_req_body = json.load(file)
+
+        response = self.client.get(reverse("exercise-record"))
+        unauthorized_after_login(self, response)
+
+        response = self.client.post(
+            exercise_recode_save_url,
+            exercise_recode_save_req_body,
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        exercise_record = ExerciseRecord.objects.latest("id")
+        exercise_detail_lod_url = reverse(
+            "exercise-record-detail-lod",
+            kwargs={"exercise_record_id": exercise_record.id},
+        )
+
+        response = self.client.get(exercise_detail_lod_url, {"points": 3})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data["sample_count"], len(exercise_recode_save_req_body["detail"])
+        )
+        for series_name in ("route", "heart_rate", "speed", "altitude"):
+            self.assertLessEqual(
+                len(response.data[series_name]["start_time_offset"]), 3
+            )
+        self.assertEqual(
+            response.data["heart_rate"]["value"][0],
+            exercise_recode_save_req_body["detail"][0]["heart_rate"],
+        )
+        self.assertEqual(
+            ExerciseDetailLOD.objects.get(
+                exercise_record=exercise_record, points=3
+            ).data,
+            response.data,
+        )
+
+        # 커맨드로 미리 계산한 결과는 DB에 저장되어 다른 프로세스에서도 사용
+        output = StringIO()
+        call_command(
+            "precompute_exercise_detail_lod",
+            "--points",
+            "3",
+            "--points",
+            "5",
+            stdout=output,
+        )
+        self.assertIn("Stored 1 downsampled", output.getvalue())
+        self.assertEqual(
+            sorted(
+                ExerciseDetailLOD.objects.filter(
+                    exercise_record=exercise_record
+                ).values_list("points", flat=True)
+            ),
+            [3, 5],
+        )
+        response = self.client.get(exercise_detail_lod_url, {"points": 5})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["points"], 5)
+
+        response = self.client.get(exercise_detail_lod_url, {"points": 1})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.client.credentials(HTTP_AUTHORIZATION=None)
+
+    def test_exercise_statistics(self):
+        """운동 통계 갱신 / 조회 테스트"""
+
+        exercise_recode_save_url = reverse("exercise-record")
+        exercise_statistics_url = reverse("exercise-statistics")
+
+        file_path = (
+            Path(__file__).resolve().parent / "ex_exercise_recode_save_req_body.json"
+        )
+
+        with open(file_path, "r") as file:
+            exercise_recode_save_req_body = json.load(file)
+
+        response = self.client.get(exercise_statistics_url)
+        unauthorized_after_login(self, response)
+
+        for hour in range(11, 13):
+            response = self.client.post(
+                exercise_recode_save_url,
+                {
+                    **exercise_recode_save_req_body,
+                    "start_datetime": f"2022-12-19T{hour}:27:55",
+                },
+                format="json",
+            )
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        statistics_req_params = {
+            "period_type": "month",
+            "date": exercise_recode_save_req_body["start_datetime"][:10],
+        }
+        response = self.client.get(exercise_statistics_url, statistics_req_params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["session_count"], 2)
+        self.assertEqual(
+            response.data["total_distance"],
+            exercise_recode_save_req_body["total_distance"] * 2,
+        )
+        self.assertEqual(response.data["period_start"], "2022-12-01")
+
+        exercise_record = ExerciseRecord.objects.latest("id")
+        response = self.client.delete(
+            reverse(
+                "exercise-record-view",
+                kwargs={"exercise_record_id": exercise_record.id},
+            )
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        statistics_req_params["period_type"] = "week"
+        response = self.client.get(exercise_statistics_url, statistics_req_params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["session_count"], 1)
+        self.assertEqual(response.data["period_start"], "2022-12-19")
+
+        statistics_req_params["period_type"] = "year"
+        response = self.client.get(exercise_statistics_url, statistics_req_params)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.client.credentials(HTTP_AUTHORIZATION=None)
+
+    def test_exercise_recode_sync(self):
+        """운동기록 여러 개 저장(동기화) / idempotency_key 중복 저장 방지 테스트"""
+
+        exercise_recode_sync_url = reverse("exercise-record-sync")
+
+        file_path = (
+            Path(__file__).resolve().parent / "ex_exercise_recode_save_req_body.json"
+        )
+
+        with open(file_path, "r") as file:
+            exercise_recode_save_req_body = json.load(file)
+
+        detail = exercise_recode_save_req_body["detail"]
+        columnar_detail = {
+            "start_time_offset": list(range(len(detail))),
+            **{
+                field_name: [item[field_name] for item in detail]
+                for field_name in (
+                    "duration",
+                    "distance",
+                    "heart_rate",
+                    "altitude",
+                    "latitude",
+                    "longitude",
+                    "speed",
+                )
+            },
+        }
+        records = [
+            {**exercise_recode_save_req_body, "idempotency_key": "session-1"},
+            {
+                **exercise_recode_save_req_body,
+                "idempotency_key": "session-2",
+                "start_datetime": "2022-12-19T13:00:00",
+                "detail": columnar_detail,
+            },
+            {
+                **exercise_recode_save_req_body,
+                "idempotency_key": "session-3",
+                "start_datetime": "2022-12-19T14:00:00",
+                "detail": [{**detail[0], "heart_rate": "x"}],
+            },
+            {
+                **exercise_recode_save_req_body,
+                "idempotency_key": "session-1",
+                "start_datetime": "2022-12-19T15:00:00",
+            },
+        ]
+
+        response = self.client.post(
+            exercise_recode_sync_url, {"records": records}, format="json"
+        )
+        unauthorized_after_login(self, response)
+
+        response = self.client.post(
+            exercise_recode_sync_url, {"records": records}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.data["results"]
+        self.assertEqual(
+            [result["status"] for result in results],
+            ["created", "created", "invalid", "duplicate"],
+        )
+        self.assertEqual(results[3]["id"], results[0]["id"])
+        self.assertIsNone(results[2]["id"])
+        self.assertIn("detail", results[2]["errors"])
+        for result in results[:2]:
+            self.assertEqual(
+                ExerciseDetailRecord.objects.filter(
+                    exercise_recode_id=result["id"]
+                ).count(),
+                len(detail),
+            )
+
+        # 같은 요청을 다시 보내도 중복 저장되지 않아야 함
+        record_count = ExerciseRecord.objects.count()
+        response = self.client.post(
+            exercise_recode_sync_url, {"records": records}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [(result["status"], result["id"]) for result in response.data["results"]],
+            [
+                ("duplicate", results[0]["id"]),
+                ("duplicate", results[1]["id"]),
+                ("invalid", None),
+                ("duplicate", results[0]["id"]),
+            ],
+        )
+        self.assertEqual(ExerciseRecord.objects.count(), record_count)
+
+        statistics = ExerciseStatistics.objects.get(
+            user__user_code="EMAIL_USERCODE", period_type="day"
+        )
+        self.assertEqual(statistics.session_count, 2)
+        self.assertEqual(
+            statistics.total_distance,
+            exercise_recode_save_req_body["total_distance"] * 2,
+        )
+
+        # blob 저장 방식 / 서버 요약 계산
+        with override_settings(EXERCISE_DETAIL_STORAGE="blob"):
+            response = self.client.post(
+                f"{exercise_recode_sync_url}?summary=server",
+                {
+                    "records": [
+                        {
+                            **records[0],
+                            "idempotency_key": "session-4",
+                            "start_datetime": "2022-12-20T11:00:00",
+                        }
+                    ]
+                },
+                format="json",
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        exercise_record = ExerciseRecord.objects.get(
+            pk=response.data["results"][0]["id"]
+        )
+        self.assertIsNotNone(exercise_record.detail_blob)
+        self.assertNotEqual(
+            exercise_record.total_distance,
+            exercise_recode_save_req_body["total_distance"],
+        )
+
+        # bulk_create로 id를 받아오지 못하는 DB(sqlite 등)에서도 상세 기록 / 결과 id가 저장된 기록과 같음
+        with mock.patch.object(
+            connection.features, "can_return_rows_from_bulk_insert", False
+        ):
+            response = self.client.post(
+                exercise_recode_sync_url,
+                {
+                    "records": [
+                        {
+                            **records[0],
+                            "idempotency_key": "session-5",
+                            "start_datetime": "2022-12-21T11:00:00",
+                        },
+                        {
+                            **records[1],
+                            "idempotency_key": "session-6",
+                            "start_datetime": "2022-12-21T12:00:00",
+                        },
+                    ]
+                },
+                format="json",
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        for result, idempotency_key in zip(
+            response.data["results"], ("session-5", "session-6")
+        ):
+            self.assertEqual(result["status"], "created")
+            exercise_record = ExerciseRecord.objects.get(pk=result["id"])
+            self.assertEqual(exercise_record.idempotency_key, idempotency_key)
+            self.assertEqual(
+                exercise_record.exercise_detail_record.count(), len(detail)
+            )
+
+        response = self.client.post(
+            exercise_recode_sync_url,
+            {"records": records[:1] * (EXERCISE_SYNC_MAX_RECORDS + 1)},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.client.credentials(HTTP_AUTHORIZATION=None)
+
     def test_exercise_recode_list(self):
         """운동기록 리스트 조회 테스트"""
 
@@ -52,3 +849,74 @@ class UsersTest(APITestCase):
         response = self.client.get(exercise_recode_list_url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.client.credentials(HTTP_AUTHORIZATION=None)
+
+    def test_exercise_recode_list_cursor_pagination(self):
+        """운동기록 리스트 cursor 페이지 조회 테스트"""
+
+        exercise_recode_list_url = reverse("exercise-record")
+
+        file_path = (
+            Path(__file__).resolve().parent / "ex_exercise_recode_save_req_body.json"
+        )
+
+        with open(file_path, "r") as file:
+            exercise_recode_save_req_body = json.load(file)
+
+        response = self.client.get(exercise_recode_list_url, {"page_size": 2})
+        unauthorized_after_login(self, response)
+
+        # 시작 시간 순서와 저장 순서가 달라도 누락/중복 없이 조회되는지 확인
+        for day in (19, 17, 21, 18, 20):
+            response = self.client.post(
+                exercise_recode_list_url,
+                {
+                    **exercise_recode_save_req_body,
+                    "start_datetime": f"2022-12-{day}T11:27:55",
+                },
+                format="json",
+            )
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        record_ids = []
+        req_params = {"page_size": 2}
+        while True:
+            response = self.client.get(exercise_recode_list_url, req_params)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertLessEqual(len(response.data["results"]), 2)
+            record_ids += [record["id"] for record in response.data["results"]]
+            if response.data["next"] is None:
+                self.assertIsNone(response.data["cursor"])
+                break
+            req_params["cursor"] = response.data["cursor"]
+
+        self.assertEqual(
+            record_ids,
+            list(
+                ExerciseRecord.objects.order_by("-start_datetime", "-id").values_list(
+                    "id", flat=True
+                )
+            ),
+        )
+
+        # cursor 조건은 (start_datetime, id) row 비교로 조회
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(
+                exercise_recode_list_url,
+                {"page_size": 2, "cursor": req_params["cursor"]},
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(
+            any(
+                '"start_datetime", "exercises_exerciserecord"."id") < (' in query["sql"]
+                for query in context.captured_queries
+            )
+        )
+
+        response = self.client.get(exercise_recode_list_url, {"cursor": "invalid"})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        # 페이지 파라미터가 없으면 기존과 같이 전체 리스트 조회
+        response = self.client.get(exercise_recode_list_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 5)
+        self.client.credentials(HTTP_AUTHORIZATION=None)
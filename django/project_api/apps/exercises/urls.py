@@ -1,6 +1,13 @@
 from django.urls import path
 
-from .views import ExerciseRecordAPIView, ExerciseRecordView
+from .views import (
+    ExerciseRecordAPIView,
+    ExerciseRecordDetailLODView,
+    ExerciseRecordMetricsView,
+    ExerciseRecordSyncView,
+    ExerciseRecordView,
+    ExerciseStatisticsView,
+)
 
 urlpatterns = [
     path(
@@ -8,9 +15,29 @@ urlpatterns = [
         ExerciseRecordAPIView.as_view(),
         name="exercise-record",
     ),
+    path(
+        "record/sync/",
+        ExerciseRecordSyncView.as_view(),
+        name="exercise-record-sync",
+    ),
     path(
         "record/<int:exercise_record_id>/",
         ExerciseRecordView.as_view(),
         name="exercise-record-view",
     ),
+    path(
+        "record/<int:exercise_record_id>/metrics/",
+        ExerciseRecordMetricsView.as_view(),
+        name="exercise-record-metrics",
+    ),
+    path(
+        "record/<int:exercise_record_id>/detail/",
+        ExerciseRecordDetailLODView.as_view(),
+        name="exercise-record-detail-lod",
+    ),
+    path(
+        "statistics/",
+        ExerciseStatisticsView.as_view(),
+        name="exercise-statistics",
+    ),
 ]
@@ -0,0 +1,248 @@
+# exercises/utils.py
+from datetime import datetime, timedelta
+from itertools import islice
+from typing import Final
+
+from exercises.detail_blob import decode_detail_blob, encode_detail_blob
+from exercises.metrics import ExerciseMetricsAccumulator
+from exercises.models import ExerciseDetailRecord
+from exercises.parsers import COLUMNAR_JSON_MEDIA_TYPE, COLUMNAR_MSGPACK_MEDIA_TYPE
+from exercises.serializers import ExerciseDetailRecordSerializer
+from rest_framework.exceptions import ValidationError
+
+from django.conf import settings
+
+# 운동 상세 기록을 검증 / bulk_create 하는 단위
+EXERCISE_DETAIL_BATCH_SIZE: Final = 500
+
+DETAIL_FIELDS: Final = (
+    "start_time",
+    "duration",
+    "distance",
+    "heart_rate",
+    "altitude",
+    "latitude",
+    "longitude",
+    "speed",
+)
+# 운동 상세 기록 저장 방식 (settings.EXERCISE_DETAIL_STORAGE)
+DETAIL_STORAGE_ROWS: Final = "rows"
+DETAIL_STORAGE_BLOB: Final = "blob"
+# detail_blob에는 start_time을 start_datetime 기준 offset(microsecond)으로 저장
+DETAIL_BLOB_TIME_UNIT: Final = timedelta(microseconds=1)
+# 운동기록 저장 요청의 필수 요약 필드 (ExerciseRecordSummarySerializer)
+EXERCISE_RECORD_SUMMARY_FIELDS: Final = (
+    "start_datetime",
+    "total_distance",
+    "total_time",
+    "average_speed",
+    "total_calories",
+)
+
+
+def get_request_media_type(request):
+    content_type = request.content_type or ""
+    return content_type.split(";")[0].strip()
+
+
+def is_json_request(request):
+    return get_request_media_type(request) == "application/json"
+
+
+def is_columnar_request(request):
+    return get_request_media_type(request) in (
+        COLUMNAR_JSON_MEDIA_TYPE,
+        COLUMNAR_MSGPACK_MEDIA_TYPE,
+    )
+
+
+def iter_batches(iterable, batch_size):
+    iterator = iter(iterable)
+    offset = 0
+    while True:
+        batch = list(islice(iterator, batch_size))
+        if not batch:
+            return
+        yield offset, batch
+        offset += len(batch)
+
+
+class ExerciseDetailRowWriter:
+    """운동 상세 기록을 batch마다 ExerciseDetailRecord row로 bulk_create"""
+
+    def __init__(self, exercise_record):
+        self.exercise_record = exercise_record
+
+    def write(self, columns):
+        ExerciseDetailRecord.objects.bulk_create(
+            [
+                ExerciseDetailRecord(
+                    **dict(zip(DETAIL_FIELDS, row)),
+                    exercise_recode=self.exercise_record,
+                )
+                for row in zip(*columns)
+            ]
+        )
+
+    def close(self):
+        pass
+
+
+class ExerciseDetailBlobWriter:
+    """
+    운동 상세 기록을 모아서 close() 시점에 ExerciseRecord.detail_blob으로 한번에 저장
+    - 압축 전 컬럼을 메모리에 모아두지만 샘플마다 dict / model 객체를 만들지 않음
+    """
+
+    def __init__(self, exercise_record):
+        self.exercise_record = exercise_record
+        self.columns = [[] for _ in DETAIL_FIELDS]
+
+    def write(self, columns):
+        for stored, values in zip(self.columns, columns):
+            stored.extend(values)
+
+    def close(self):
+        self.exercise_record.detail_blob = encode_exercise_detail_blob(
+            self.exercise_record.start_datetime, self.columns
+        )
+        self.exercise_record.save(update_fields=["detail_blob"])
+
+
+def get_exercise_detail_writer(exercise_record):
+    if settings.EXERCISE_DETAIL_STORAGE == DETAIL_STORAGE_BLOB:
+        return ExerciseDetailBlobWriter(exercise_record)
+    return ExerciseDetailRowWriter(exercise_record)
+
+
+def encode_exercise_detail_blob(start_datetime, columns):
+    """DETAIL_FIELDS 순서의 컬럼 리스트를 detail_blob으로 인코딩"""
+    return encode_detail_blob(
+        [
+            [
+                (start_time - start_datetime) // DETAIL_BLOB_TIME_UNIT
+                for start_time in columns[0]
+            ]
+        ]
+        + list(columns[1:])
+    )
+
+
+def decode_exercise_detail_blob(exercise_record):
+    """detail_blob을 DETAIL_FIELDS 순서의 컬럼 리스트로 디코딩"""
+    columns = decode_detail_blob(exercise_record.detail_blob)
+    if not columns:
+        return [[] for _ in DETAIL_FIELDS]
+
+    start_datetime = exercise_record.start_datetime
+    columns[0] = [
+        start_datetime + offset * DETAIL_BLOB_TIME_UNIT for offset in columns[0]
+    ]
+    return columns
+
+
+def validate_exercise_detail_batch(batch, offset=0):
+    """
+    상세 기록 batch를 serializer로 검증하고 DETAIL_FIELDS 순서의 컬럼 리스트로 변환
+    - 에러는 전체 상세 기록 기준 index(offset + batch 내 index)로 표시
+    """
+    serializer = ExerciseDetailRecordSerializer(data=batch, many=True)
+    if not serializer.is_valid():
+        raise ValidationError(
+            {
+                "detail": {
+                    offset + index: error
+                    for index, error in enumerate(serializer.errors)
+                    if error
+                }
+            }
+        )
+
+    return [
+        [item[field_name] for item in serializer.validated_data]
+        for field_name in DETAIL_FIELDS
+    ]
+
+
+def save_exercise_detail_records(
+    exercise_record, samples, batch_size=EXERCISE_DETAIL_BATCH_SIZE, metrics=None
+):
+    """
+    운동 상세 기록을 batch_size 단위로 검증 후 저장
+    - 전체 상세 기록을 한번에 serializer로 검증하지 않기 때문에 메모리 사용량이 batch_size로 제한됨
+      (blob 저장 방식에서는 압축 전 컬럼만 메모리에 모아둠)
+    - metrics(ExerciseMetricsAccumulator)를 넘기면 batch 단위로 요약 지표도 같이 계산
+    - 호출하는 쪽에서 transaction.atomic()으로 감싸서 사용해야 함
+    """
+    writer = get_exercise_detail_writer(exercise_record)
+    count = 0
+
+    for offset, batch in iter_batches(samples, batch_size):
+        columns = validate_exercise_detail_batch(batch, offset)
+        writer.write(columns)
+        count += len(batch)
+
+        if metrics is not None:
+            metrics.add_columns(dict(zip(DETAIL_FIELDS, columns)))
+
+    writer.close()
+    return count
+
+
+def get_exercise_detail_rows(exercise_record):
+    """
+    운동 상세 기록을 샘플별 dict 리스트로 조회
+    - detail_blob으로 저장된 기록은 디코딩해서 같은 형식으로 반환
+    """
+    if exercise_record.detail_blob is not None:
+        columns = decode_exercise_detail_blob(exercise_record)
+        return [dict(zip(DETAIL_FIELDS, row)) for row in zip(*columns)]
+
+    return exercise_record.exercise_detail_record.order_by("id").values(*DETAIL_FIELDS)
+
+
+def get_exercise_record_metrics(
+    exercise_record, max_heart_rate, batch_size=EXERCISE_DETAIL_BATCH_SIZE
+):
+    """
+    저장된 운동 상세 기록으로부터 요약 지표를 batch_size 단위로 계산
+    """
+    metrics = ExerciseMetricsAccumulator(max_heart_rate=max_heart_rate)
+
+    if exercise_record.detail_blob is not None:
+        columns = decode_exercise_detail_blob(exercise_record)
+        metrics.add_columns(dict(zip(DETAIL_FIELDS, columns)))
+        return metrics.result()
+
+    rows = (
+        exercise_record.exercise_detail_record.order_by("id")
+        .values_list(*DETAIL_FIELDS)
+        .iterator(chunk_size=batch_size)
+    )
+
+    for _, batch in iter_batches(rows, batch_size):
+        metrics.add_columns(dict(zip(DETAIL_FIELDS, map(list, zip(*batch)))))
+
+    return metrics.result()
+
+
+def set_exercise_summary(exercise_record, summary):
+    """
+    서버에서 계산한 요약 지표를 운동 기록 객체에 설정 (저장하지 않음)
+    """
+    exercise_record.total_distance = summary["total_distance"]
+    exercise_record.total_time = (
+        datetime.min + timedelta(seconds=summary["total_time"])
+    ).time()
+    exercise_record.average_speed = summary["average_speed"]
+
+
+def apply_exercise_summary(exercise_record, summary):
+    """
+    서버에서 계산한 요약 지표로 운동 기록의 거리 / 시간 / 평균 속도를 갱신
+    """
+    set_exercise_summary(exercise_record, summary)
+
+    exercise_record.save(
+        update_fields=["total_distance", "total_time", "average_speed"]
+    )
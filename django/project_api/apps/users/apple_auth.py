@@ -0,0 +1,150 @@
+# users/apple_auth.py
+"""apple_auth 모듈 설명
+
+애플 로그인 identity token(id_token) 검증 모듈
+
+- 애플 공개키 목록(JWKS)을 조회해서 메모리에 캐시하고, 서명은 pyjwt로 로컬에서 검사
+  (캐시된 키로 검증하는 동안에는 네트워크 요청 없음)
+- 캐시 시간(KEYS_TIMEOUT)이 지나거나, 캐시에 없는 kid(애플이 키를 교체한 경우)로 서명된 토큰이 오면 다시 조회
+  (모르는 kid로 반복 요청하는 경우에도 REFRESH_INTERVAL초에 한번만 조회)
+- 다시 조회하다 실패하면 캐시에 남아있는 키로 계속 검증
+- 키 목록을 가져오는 방법은 APPLE_AUTH["KEY_SOURCE"]로 교체 가능 (fetch()에서 JWKS dict를 반환하는 클래스)
+- APPLE_AUTH["CLIENT_IDS"](환경변수 APPLE_CLIENT_IDS)가 비어있으면 모든 토큰이 거부되므로 ImproperlyConfigured
+"""
+import functools
+import threading
+import time
+
+import jwt
+import requests
+from project_api.utils import StandardException
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.utils.module_loading import import_string
+from django.utils.translation import ugettext_lazy
+
+APPLE_AUTH_DEFAULTS = {
+    # id_token의 aud로 허용하는 값 (앱 bundle id / 서비스 id)
+    "CLIENT_IDS": [],
+    "ISSUER": "https://appleid.apple.com",
+    "KEY_SOURCE": "users.apple_auth.AppleJWKSURLKeySource",
+    "JWKS_URL": "https://appleid.apple.com/auth/keys",
+    # 키 목록 캐시 유지 시간(초)
+    "KEYS_TIMEOUT": 60 * 60 * 24,
+    # 모르는 kid가 들어왔을 때 키 목록을 다시 조회하는 최소 간격(초)
+    "REFRESH_INTERVAL": 60,
+    # exp / iat 검사시 허용하는 시간 오차(초)
+    "LEEWAY": 0,
+}
+
+
+def get_apple_auth_setting(name):
+    return getattr(settings, "APPLE_AUTH", {}).get(name, APPLE_AUTH_DEFAULTS[name])
+
+
+def get_apple_client_ids():
+    client_ids = get_apple_auth_setting("CLIENT_IDS")
+    if not client_ids:
+        raise ImproperlyConfigured(
+            "APPLE_AUTH['CLIENT_IDS'] is empty (set the APPLE_CLIENT_IDS environment variable)"
+        )
+    return client_ids
+
+
+class AppleJWKSURLKeySource:
+    """APPLE_AUTH["JWKS_URL"]에서 JWKS 조회 (keep-alive 연결을 재사용하는 세션 사용)"""
+
+    def __init__(self):
+        self.session = requests.Session()
+
+    def fetch(self):
+        response = self.session.get(get_apple_auth_setting("JWKS_URL"), timeout=5)
+        response.raise_for_status()
+        return response.json()
+
+
+class AppleKeyCache:
+    """kid별 애플 공개키 캐시 (여러 스레드에서 같이 사용)"""
+
+    def __init__(self, key_source):
+        self.key_source = key_source
+        self._keys = {}
+        self._expires_at = 0.0
+        self._fetched_at = None
+        self._lock = threading.Lock()
+
+    def _is_refresh_needed(self, key_id):
+        now = time.monotonic()
+        if now >= self._expires_at:
+            return True
+        return key_id not in self._keys and (
+            self._fetched_at is None
+            or now - self._fetched_at >= get_apple_auth_setting("REFRESH_INTERVAL")
+        )
+
+    def refresh(self):
+        self._fetched_at = time.monotonic()
+        try:
+            jwk_set = jwt.PyJWKSet.from_dict(self.key_source.fetch())
+        except Exception:
+            if not self._keys:
+                raise
+            # 조회에 실패해도 가지고 있는 키로 계속 검증하고, REFRESH_INTERVAL 후에 다시 시도
+            self._expires_at = self._fetched_at + get_apple_auth_setting(
+                "REFRESH_INTERVAL"
+            )
+            return
+
+        self._keys = {key.key_id: key for key in jwk_set.keys}
+        self._expires_at = self._fetched_at + get_apple_auth_setting("KEYS_TIMEOUT")
+
+    def get_key(self, key_id):
+        if self._is_refresh_needed(key_id):
+            with self._lock:
+                if self._is_refresh_needed(key_id):
+                    self.refresh()
+
+        try:
+            return self._keys[key_id]
+        except KeyError:
+            raise jwt.InvalidTokenError(f"Unknown key id: {key_id}")
+
+
+@functools.lru_cache(maxsize=None)
+def get_apple_key_cache():
+    return AppleKeyCache(import_string(get_apple_auth_setting("KEY_SOURCE"))())
+
+
+def apple_auth(id_token, apple_id):
+    """
+    애플 로그인 id_token을 검증하고, 토큰의 sub가 apple_id와 같은지 확인
+    """
+    client_ids = get_apple_client_ids()
+
+    try:
+        key = get_apple_key_cache().get_key(
+            jwt.get_unverified_header(id_token).get("kid")
+        )
+        apple_id_info = jwt.decode(
+            id_token,
+            key.key,
+            algorithms=["RS256"],
+            audience=client_ids,
+            issuer=get_apple_auth_setting("ISSUER"),
+            leeway=get_apple_auth_setting("LEEWAY"),
+            options={"require": ["iss", "aud", "exp", "iat", "sub"]},
+        )
+    except (jwt.PyJWTError, requests.RequestException, ValueError):
+        raise StandardException(
+            422,
+            ugettext_lazy("id_token is invalid"),
+        )
+
+    if apple_id_info["sub"] != apple_id:
+        raise StandardException(
+            422,
+            ugettext_lazy("apple_id does not match"),
+        )
+
+    return apple_id_info
@@ -0,0 +1,77 @@
+# users/authentication.py
+import copy
+
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.authtoken.models import Token
+
+from django.conf import settings
+from django.core.cache import caches
+
+AUTH_TOKEN_CACHE_KEY_PREFIX = "auth_token"
+
+AUTH_TOKEN_CACHE_DEFAULTS = {
+    # 토큰 캐시로 사용하는 settings.CACHES의 alias (None이면 토큰 캐시를 사용하지 않음)
+    # - 토큰 삭제를 모든 서버 / 프로세스에 반영해야 하므로 같이 사용하는 캐시(redis, memcached 등)만 설정
+    "CACHE": None,
+    # 캐시 유지 시간(초)
+    "TIMEOUT": 300,
+}
+
+
+def get_auth_token_cache_setting(name):
+    return getattr(settings, "AUTH_TOKEN_CACHE", {}).get(
+        name, AUTH_TOKEN_CACHE_DEFAULTS[name]
+    )
+
+
+def get_token_cache():
+    alias = get_auth_token_cache_setting("CACHE")
+    if alias is None:
+        return None
+    return caches[alias]
+
+
+def get_auth_token_cache_key(key):
+    return f"{AUTH_TOKEN_CACHE_KEY_PREFIX}:{key}"
+
+
+def invalidate_auth_token_cache(key):
+    """토큰이 삭제 / 변경되거나 유저 정보가 바뀌었을 때 캐시된 인증 정보 삭제"""
+    token_cache = get_token_cache()
+    if token_cache is not None:
+        token_cache.delete(get_auth_token_cache_key(key))
+
+
+def invalidate_user_auth_token_cache(user_id):
+    for key in Token.objects.filter(user_id=user_id).values_list("key", flat=True):
+        invalidate_auth_token_cache(key)
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    TokenAuthentication에 토큰 캐시를 추가한 인증 클래스
+
+    - AUTH_TOKEN_CACHE["CACHE"]를 설정한 경우만 토큰 key로 (user, token)을 캐시해서
+      요청마다 Token + User를 조회하지 않음 (설정하지 않으면 TokenAuthentication과 같이 매번 DB 조회)
+    - 토큰 / 유저가 저장, 삭제되면 users.signals에서 캐시를 삭제
+        - 캐시 삭제와 동시에 진행 중이던 요청이 삭제 전에 조회한 값을 저장할 수 있으므로
+          캐시된 값은 최대 TIMEOUT 동안만 유지
+    - view에서 request.user를 수정해도 캐시된 값이 바뀌지 않도록 복사본을 넘겨줌
+    """
+
+    def authenticate_credentials(self, key):
+        token_cache = get_token_cache()
+        if token_cache is None:
+            return super().authenticate_credentials(key)
+
+        cache_key = get_auth_token_cache_key(key)
+        cached = token_cache.get(cache_key)
+        if cached is None:
+            user, token = super().authenticate_credentials(key)
+            token_cache.set(
+                cache_key, (user, token), get_auth_token_cache_setting("TIMEOUT")
+            )
+        else:
+            user, token = cached
+
+        return copy.copy(user), copy.copy(token)
@@ -0,0 +1,91 @@
+import timeit
+
+from project_api.custom_password_validation import validate_password
+from project_api.utils import StandardException
+from users.utils import validate_password_format
+
+from django.contrib.auth.password_validation import (
+    CommonPasswordValidator,
+    MinimumLengthValidator,
+    NumericPasswordValidator,
+)
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand
+
+BENCHMARK_PASSWORDS = ("qwerty12!", "password", "1234", "correcthorse42battery")
+
+
+def validate_password_format_per_call_validators(password):
+    """이전 validate_password_format (호출할 때마다 validator를 만들어서 목록을 다시 읽음)"""
+    validate_error_strs = []
+    for validator in (
+        MinimumLengthValidator(),
+        CommonPasswordValidator(),
+        NumericPasswordValidator(),
+    ):
+        try:
+            validator.validate(password)
+        except ValidationError as e:
+            validate_error_strs.append(e.messages[0])
+
+    return validate_error_strs
+
+
+def validate_serializer_password(password):
+    try:
+        validate_password(password)
+    except (StandardException, ValidationError):
+        pass
+
+
+class Command(BaseCommand):
+    """
+    비밀번호 검사 microbenchmark
+
+    - 이전 방식(호출마다 django validator 생성)과 비밀번호 정책(project_api.password_policy)의 호출당 시간 비교
+    - 예시: `python manage.py benchmark_password_policy --number 1000`
+    """
+
+    help = "Compare password validation latency before and after the shared policy"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--number",
+            type=int,
+            default=1000,
+            help="Calls per password (the per-call validator case runs number // 100)",
+        )
+
+    def measure(self, name, function, number):
+        # 첫 호출(목록 읽기)은 프로세스마다 한번만 일어나므로 측정에서 제외
+        for password in BENCHMARK_PASSWORDS:
+            function(password)
+
+        seconds = timeit.timeit(
+            lambda: [function(password) for password in BENCHMARK_PASSWORDS],
+            number=number,
+        )
+        per_call_us = seconds / (number * len(BENCHMARK_PASSWORDS)) * 1e6
+        self.stdout.write(f"{name:<40} {per_call_us:12.1f} us/call")
+        return per_call_us
+
+    def handle(self, *args, **options):
+        number = options["number"]
+
+        before = self.measure(
+            "per-call django validators",
+            validate_password_format_per_call_validators,
+            max(number // 100, 1),
+        )
+        after = self.measure(
+            "validate_password_format", validate_password_format, number
+        )
+        self.measure(
+            "serializer validate_password", validate_serializer_password, number
+        )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"validate_password_format: {before / after:.0f}x faster"
+            )
+        )
@@ -0,0 +1,47 @@
+from datetime import timedelta
+
+from users.utils import (
+    VERIFICATION_PURGE_BATCH_SIZE,
+    VERIFICATION_RETENTION,
+    purge_expired_verifications,
+)
+
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    """
+    보관 기간이 지난 이메일 / 핸드폰 인증번호(EmailVerification, PhoneVerification)를 삭제하는 커맨드
+
+    - 인증 테이블이 계속 커지지 않도록 cron 등으로 주기적으로 실행
+    - 예시: `python manage.py purge_verifications --hours 24 --batch-size 1000`
+    """
+
+    help = "Delete email and phone verification codes past their retention period"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--hours",
+            type=float,
+            default=VERIFICATION_RETENTION.total_seconds() / 3600,
+            help="Delete verification codes created more than this many hours ago",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=VERIFICATION_PURGE_BATCH_SIZE,
+            help="Number of rows deleted per query",
+        )
+
+    def handle(self, *args, **options):
+        deleted_counts = purge_expired_verifications(
+            retention=timedelta(hours=options["hours"]),
+            batch_size=options["batch_size"],
+        )
+        for model_name, deleted_count in deleted_counts.items():
+            self.stdout.write(f"{model_name}: {deleted_count} deleted")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Purged {sum(deleted_counts.values())} verification codes"
+            )
+        )
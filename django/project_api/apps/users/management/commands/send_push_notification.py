@@ -0,0 +1,82 @@
+import json
+
+from project_api.firebase_notification import (
+    FIREBASE_FAN_OUT_CHUNK_SIZE,
+    FIREBASE_FAN_OUT_MAX_WORKERS,
+    FIREBASE_MULTICAST_MAX_TOKENS,
+    FirebasePushFanOut,
+)
+from users.models import DeviceType
+from users.utils import get_push_notification_audience
+
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    """
+    앱푸시를 켠 유저 전체(또는 특정 device_type)에게 같은 푸시를 발송하는 커맨드
+
+    - FirebasePushFanOut으로 batch_size개씩 multicast 발송하고 batch별 결과를 출력
+    - 예시: `python manage.py send_push_notification --title 공지 --body 점검 안내 --device-type aos`
+    """
+
+    help = "Send a push notification to every user with push notifications enabled"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--title", required=True)
+        parser.add_argument("--body", required=True)
+        parser.add_argument(
+            "--data",
+            type=json.loads,
+            default=None,
+            help='Data payload as a JSON object of strings (e.g. \'{"type": "notice"}\')',
+        )
+        parser.add_argument(
+            "--device-type",
+            choices=DeviceType.values,
+            default=None,
+            help="Send only to users on this device type",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=FIREBASE_MULTICAST_MAX_TOKENS,
+            help="Tokens per multicast call (max 500)",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=FIREBASE_FAN_OUT_MAX_WORKERS,
+            help="Number of multicast calls sent concurrently",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=FIREBASE_FAN_OUT_CHUNK_SIZE,
+            help="Number of recipients fetched from the database at a time",
+        )
+
+    def handle(self, *args, **options):
+        fan_out = FirebasePushFanOut(
+            options["title"],
+            options["body"],
+            data=options["data"],
+            batch_size=options["batch_size"],
+            max_workers=options["workers"],
+            chunk_size=options["chunk_size"],
+        )
+        report = fan_out.send(get_push_notification_audience(options["device_type"]))
+
+        for result in report["batches"]:
+            self.stdout.write(
+                f"batch {result['batch']}: {result['success_count']}/{result['size']} sent, "
+                f"{result['pruned_count']} pruned, {result['elapsed']:.3f}s "
+                f"({result['throughput']:.1f}/s)"
+            )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Sent {report['success_count']}/{report['size']} push notifications, "
+                f"pruned {report['pruned_count']} tokens in {report['elapsed']:.3f}s "
+                f"({report['throughput']:.1f}/s)"
+            )
+        )
@@ -0,0 +1,22 @@
+# Generated by Django 3.2.12 on 2026-10-18 21:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("users", "0017_user_deleted_at"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="user",
+            name="push_token",
+            field=models.CharField(
+                blank=True,
+                max_length=255,
+                null=True,
+                verbose_name="앱푸시 토큰(FCM registration token)",
+            ),
+        ),
+    ]
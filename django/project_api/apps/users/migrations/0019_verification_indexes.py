@@ -0,0 +1,38 @@
+# Generated by Django 3.2.12 on 2026-10-18 22:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("users", "0018_user_push_token"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="emailverification",
+            index=models.Index(
+                fields=["email", "type", "auth_check", "created_at"],
+                name="email_verification_confirm_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="emailverification",
+            index=models.Index(
+                fields=["created_at"], name="email_verification_created_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="phoneverification",
+            index=models.Index(
+                fields=["phone_number", "country_code", "auth_check", "created_at"],
+                name="phone_verification_confirm_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="phoneverification",
+            index=models.Index(
+                fields=["created_at"], name="phone_verification_created_idx"
+            ),
+        ),
+    ]
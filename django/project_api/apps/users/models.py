@@ -148,6 +148,12 @@ class User(AbstractUser):
         verbose_name="앱푸시 온오프",
         default=True,
     )
+    push_token = models.CharField(
+        verbose_name="앱푸시 토큰(FCM registration token)",
+        max_length=255,
+        null=True,
+        blank=True,
+    )
     profile_image_url = models.URLField(
         verbose_name="프로필 이미지",
         max_length=255,
@@ -234,6 +240,17 @@ class EmailVerification(models.Model):
     )
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            # 인증번호 확인시 오늘 발송한 가장 최근 인증번호를 조회하기 위한 인덱스
+            models.Index(
+                fields=["email", "type", "auth_check", "created_at"],
+                name="email_verification_confirm_idx",
+            ),
+            # 만료된 인증번호 삭제(purge_verifications)를 위한 인덱스
+            models.Index(fields=["created_at"], name="email_verification_created_idx"),
+        ]
+
 
 class UserProfileUploadedImage(models.Model):
     """
@@ -291,3 +308,14 @@ class PhoneVerification(models.Model):
         default=False,
     )
     created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            # 인증번호 확인시 오늘 발송한 가장 최근 인증번호를 조회하기 위한 인덱스
+            models.Index(
+                fields=["phone_number", "country_code", "auth_check", "created_at"],
+                name="phone_verification_confirm_idx",
+            ),
+            # 만료된 인증번호 삭제(purge_verifications)를 위한 인덱스
+            models.Index(fields=["created_at"], name="phone_verification_created_idx"),
+        ]
@@ -4,6 +4,7 @@ from datetime import datetime
 from project_api.custom_password_validation import (
     validate_password as custom_validate_password,
 )
+from project_api.response_schema import ResponseSchema
 from project_api.utils import StandardException
 from commons.models import CountryCode
 from emoji import core
@@ -209,6 +210,9 @@ class LoginUserDataResponseSerializer(serializers.Serializer):
     profile_image_url = serializers.URLField(allow_null=True, required=False)
 
 
+login_user_data_schema = ResponseSchema(LoginUserDataResponseSerializer)
+
+
 class SocialRegistrationSerializer(serializers.Serializer):
     social_type = serializers.ChoiceField(choices=LoginType, required=True)
     social_id = serializers.CharField(required=True)
@@ -248,6 +252,13 @@ class SettingDataResponseSerializer(serializers.Serializer):
     receive_promotional_email = serializers.BooleanField(required=False)
 
 
+setting_data_schema = ResponseSchema(SettingDataResponseSerializer)
+
+
+class PushTokenSerializer(serializers.Serializer):
+    push_token = serializers.CharField(allow_null=True, max_length=255, required=True)
+
+
 class UserSimpleSerializer(serializers.Serializer):
     id = serializers.IntegerField()
     nickname = serializers.CharField()
@@ -0,0 +1,25 @@
+# users/signals.py
+from rest_framework.authtoken.models import Token
+from users.authentication import (
+    invalidate_auth_token_cache,
+    invalidate_user_auth_token_cache,
+)
+from users.models import User
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+
+@receiver(post_save, sender=Token)
+@receiver(post_delete, sender=Token)
+def invalidate_token_cache_on_token_change(sender, instance, created=False, **kwargs):
+    """로그아웃 / 회원탈퇴로 토큰이 변경되거나 삭제된 경우 (새로 만든 토큰은 캐시된 적이 없음)"""
+    if not created:
+        invalidate_auth_token_cache(instance.key)
+
+
+@receiver(post_save, sender=User)
+def invalidate_token_cache_on_user_change(sender, instance, created, **kwargs):
+    """캐시된 request.user가 예전 유저 정보를 가지지 않도록 유저 정보가 바뀌면 삭제"""
+    if not created:
+        invalidate_user_auth_token_cache(instance.pk)
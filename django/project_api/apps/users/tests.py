@@ -1,16 +1,182 @@
+import datetime
+import io
+import json
+import multiprocessing
+import shutil
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import jwt
+from asgiref.sync import async_to_sync
 from conftest import (
+    DEFAULT_APPLE_LINK_DATA,
+    DEFAULT_GOOGLE_LINK_DATA,
     DEFAULT_EMAIL_LINK_DATA,
     DEFAULT_EMAIL_LOGIN_DATA,
     DEFAULT_EMAIL_USER_DATA,
+    LocalKeyServer,
+    login_process,
     unauthorized_after_login,
 )
+from project_api.custom_password_validation import validate_password
+from project_api.firebase_notification import FirebaseAppPush, FirebasePushFanOut
+from project_api.password_policy import (
+    PASSWORD_RULE_COMMON,
+    PASSWORD_RULE_MIN_LENGTH,
+    PASSWORD_RULE_NUMBER_ENGLISH_MIX,
+    PASSWORD_RULE_NUMERIC,
+    CommonPasswordList,
+    PasswordPolicy,
+)
+from project_api.utils import StandardException
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from cryptography.x509.oid import NameOID
+from firebase_admin import messaging
+from google.auth import crypt as google_auth_crypt
+from google.auth import jwt as google_auth_jwt
 from rest_framework import status
+from rest_framework.authtoken.models import Token
 from rest_framework.test import APITestCase
-from users.models import EmailVerification, LoginLink, PhoneVerification, User
+from users.apple_auth import apple_auth, get_apple_key_cache
+from users.authentication import (
+    get_auth_token_cache_key,
+    invalidate_auth_token_cache,
+)
+from users.models import (
+    DeviceType,
+    EmailVerification,
+    LoginLink,
+    PhoneVerification,
+    User,
+)
+from users.utils import (
+    ValidationErrorStrs,
+    get_push_notification_audience,
+    validate_password_format,
+)
+from users.verification_store import (
+    VERIFICATION_CONFIRMED,
+    VERIFICATION_EMAIL,
+    VERIFICATION_EXPIRED,
+    VERIFICATION_INCORRECT,
+    CacheVerificationCodeStore,
+    get_verification_code_store,
+)
 
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured, ValidationError
+from django.core.management import call_command
+from django.db import connection
+from django.test import AsyncClient, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 
+class FakeMulticastSender:
+    """실제로 발송하지 않고 토큰별 결과를 만들어주는 send_multicast"""
+
+    def __init__(self, unregistered_tokens=()):
+        self.unregistered_tokens = set(unregistered_tokens)
+        self.messages = []
+
+    def __call__(self, message):
+        self.messages.append(message)
+        return messaging.BatchResponse(
+            [
+                messaging.SendResponse(
+                    None, messaging.UnregisteredError("Requested entity was not found.")
+                )
+                if token in self.unregistered_tokens
+                else messaging.SendResponse({"name": f"messages/{token}"}, None)
+                for token in message.tokens
+            ]
+        )
+
+
+def create_google_certificate(key_id):
+    """google 인증서 서버 형식({kid: x509 인증서})의 인증서와 id_token 서명에 사용할 signer"""
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "test")])
+    now = datetime.datetime.utcnow()
+    certificate = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(private_key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(days=1))
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .sign(private_key, hashes.SHA256())
+    )
+    signer = google_auth_crypt.RSASigner.from_string(
+        private_key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        ),
+        key_id=key_id,
+    )
+    return (
+        {key_id: certificate.public_bytes(serialization.Encoding.PEM).decode()},
+        signer,
+    )
+
+
+def create_apple_key(key_id):
+    """애플 JWKS 형식의 공개키와 id_token 서명에 사용할 비밀키"""
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    jwk = json.loads(jwt.algorithms.RSAAlgorithm.to_jwk(private_key.public_key()))
+    return {**jwk, "kid": key_id, "use": "sig", "alg": "RS256"}, private_key
+
+
+def create_apple_id_token(private_key, key_id, sub, aud="test.bundle.id", **claims):
+    now = int(time.time())
+    return jwt.encode(
+        {
+            "iss": "https://appleid.apple.com",
+            "aud": aud,
+            "sub": sub,
+            "iat": now,
+            "exp": now + 600,
+            **claims,
+        },
+        private_key,
+        algorithm="RS256",
+        headers={"kid": key_id},
+    )
+
+
+class LocalAppleKeySource:
+    """네트워크 요청 없이 jwks를 반환하는 APPLE_AUTH["KEY_SOURCE"]"""
+
+    jwks = {"keys": []}
+    fetch_count = 0
+
+    def fetch(self):
+        LocalAppleKeySource.fetch_count += 1
+        return self.jwks
+
+
+class BarrierCache:
+    """get() 이후 모든 스레드가 모일 때까지 기다리는 캐시 (같은 값을 동시에 조회한 상황 재현)"""
+
+    def __init__(self, cache, parties):
+        self.cache = cache
+        self.barrier = threading.Barrier(parties)
+
+    def get(self, key, default=None):
+        value = self.cache.get(key, default)
+        self.barrier.wait(timeout=5)
+        return value
+
+    def __getattr__(self, name):
+        return getattr(self.cache, name)
+
+
 class UsersTest(APITestCase):
     def setUp(self):
         pass
@@ -124,6 +290,95 @@ class UsersTest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.client.credentials(HTTP_AUTHORIZATION=None)
 
+    @override_settings(AUTH_TOKEN_CACHE={"CACHE": "default"})
+    def test_token_cache(self):
+        """토큰 캐시 / 로그인, 로그아웃시 캐시 삭제 테스트"""
+
+        self.addCleanup(cache.clear)
+        user_data_url = reverse("login-user-data")
+        response = self.client.get(user_data_url)
+        unauthorized_after_login(self, response)
+
+        token_key = self.client._credentials["HTTP_AUTHORIZATION"].split()[1]
+
+        response = self.client.get(user_data_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["token"], token_key)
+        self.assertIsNotNone(cache.get(get_auth_token_cache_key(token_key)))
+
+        # 캐시된 토큰은 Token / User 조회 없이 인증 (LoginLink 조회만 실행)
+        with self.assertNumQueries(1):
+            response = self.client.get(user_data_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        # 다시 로그인하면 이전 토큰은 캐시에서 삭제되어 사용할 수 없음
+        response = self.client.post(
+            reverse("email-login"), DEFAULT_EMAIL_LOGIN_DATA, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response = self.client.get(user_data_url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+        # 로그아웃한 토큰도 사용할 수 없음
+        self.client.credentials()
+        login_process(self.client, DEFAULT_EMAIL_LOGIN_DATA)
+        response = self.client.get(user_data_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response = self.client.post(reverse("email-logout"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response = self.client.get(user_data_url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.client.credentials(HTTP_AUTHORIZATION=None)
+
+    def test_token_cache_multi_process(self):
+        """다른 프로세스에서 삭제한 토큰이 캐시에 남아있지 않은지 테스트"""
+
+        user_data_url = reverse("login-user-data")
+        login_process(self.client, DEFAULT_EMAIL_LOGIN_DATA)
+        token_key = self.client._credentials["HTTP_AUTHORIZATION"].split()[1]
+
+        # 캐시를 설정하지 않으면 토큰 캐시를 사용하지 않음
+        cache.clear()
+        response = self.client.get(user_data_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIsNone(cache.get(get_auth_token_cache_key(token_key)))
+
+        # 여러 프로세스가 같이 사용하는 파일 캐시를 토큰 캐시로 사용
+        location = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, location, ignore_errors=True)
+        shared_cache_settings = override_settings(
+            CACHES={
+                "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+                "auth_token": {
+                    "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+                    "LOCATION": location,
+                },
+            },
+            AUTH_TOKEN_CACHE={"CACHE": "auth_token"},
+        )
+        with shared_cache_settings:
+            response = self.client.get(user_data_url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            with self.assertNumQueries(1):
+                response = self.client.get(user_data_url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+            # 다른 프로세스(워커)에서 토큰을 삭제한 경우
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "DELETE FROM authtoken_token WHERE key = %s", [token_key]
+                )
+            process = multiprocessing.get_context("fork").Process(
+                target=invalidate_auth_token_cache, args=(token_key,)
+            )
+            process.start()
+            process.join()
+            self.assertEqual(process.exitcode, 0)
+
+            response = self.client.get(user_data_url)
+            self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.client.credentials(HTTP_AUTHORIZATION=None)
+
     def test_profile_edit(self):
         """프로필 수정 테스트"""
 
@@ -279,3 +534,563 @@ class UsersTest(APITestCase):
             format="json",
         )
         self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_verification_confirm(self):
+        """인증번호 확인(가장 최근 인증번호만 사용 / 유효 시간) 및 만료된 인증번호 삭제 테스트"""
+
+        email = "verification@popprika.com"
+        email_confirm_url = reverse("email-verification-confirm")
+        now = datetime.datetime.now()
+        old_verification = EmailVerification.objects.create(
+            type="sign_up", code="111111", email=email
+        )
+        verification = EmailVerification.objects.create(
+            type="sign_up", code="222222", email=email
+        )
+        EmailVerification.objects.filter(pk=old_verification.pk).update(
+            created_at=now - datetime.timedelta(minutes=12)
+        )
+        EmailVerification.objects.create(
+            type="password_change", code="333333", email=email
+        )
+
+        # 인덱스를 사용할 수 있도록 날짜 함수 없이 범위로 한번만 조회
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(
+                email_confirm_url,
+                {"type": "sign_up", "email": email, "code": "111111"},
+                format="json",
+            )
+        self.assertEqual(response.status_code, status.HTTP_422_UNPROCESSABLE_ENTITY)
+        verification_queries = [
+            query["sql"]
+            for query in queries.captured_queries
+            if "users_emailverification" in query["sql"]
+        ]
+        self.assertEqual(len(verification_queries), 1)
+        self.assertNotIn("EXTRACT", verification_queries[0])
+
+        response = self.client.post(
+            email_confirm_url,
+            {"type": "sign_up", "email": email, "code": "333333"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_422_UNPROCESSABLE_ENTITY)
+
+        # 유효 시간이 지난 인증번호
+        EmailVerification.objects.filter(pk=verification.pk).update(
+            created_at=now - datetime.timedelta(minutes=11)
+        )
+        response = self.client.post(
+            email_confirm_url,
+            {"type": "sign_up", "email": email, "code": "222222"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_422_UNPROCESSABLE_ENTITY)
+
+        EmailVerification.objects.filter(pk=verification.pk).update(created_at=now)
+        response = self.client.post(
+            email_confirm_url,
+            {"type": "sign_up", "email": email, "code": "222222"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        verification.refresh_from_db()
+        self.assertTrue(verification.auth_check)
+
+        # 이미 확인한 인증번호는 다시 사용할 수 없음
+        response = self.client.post(
+            email_confirm_url,
+            {"type": "sign_up", "email": email, "code": "222222"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_422_UNPROCESSABLE_ENTITY)
+
+        # 보관 기간이 지난 인증번호만 삭제
+        EmailVerification.objects.filter(pk=old_verification.pk).update(
+            created_at=now - datetime.timedelta(days=2)
+        )
+        output = io.StringIO()
+        call_command("purge_verifications", "--batch-size", "1", stdout=output)
+        self.assertIn("Purged 1 verification codes", output.getvalue())
+        self.assertFalse(
+            EmailVerification.objects.filter(pk=old_verification.pk).exists()
+        )
+        self.assertTrue(EmailVerification.objects.filter(pk=verification.pk).exists())
+
+    @override_settings(
+        VERIFICATION_CODE_STORE={
+            "BACKEND": "users.verification_store.CacheVerificationCodeStore"
+        }
+    )
+    def test_verification_code_cache_store(self):
+        """캐시 인증번호 저장소로 발송 / 확인 / 회원가입 테스트 (DB에 저장하지 않음)"""
+
+        get_verification_code_store.cache_clear()
+        self.addCleanup(get_verification_code_store.cache_clear)
+        self.addCleanup(cache.clear)
+        email = "cache-store@popprika.com"
+
+        response = self.client.post(
+            reverse("email-verification-send"),
+            {"type": "sign_up", "email": email},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        code = response.data["code"]
+        self.assertFalse(EmailVerification.objects.filter(email=email).exists())
+
+        email_confirm_url = reverse("email-verification-confirm")
+        response = self.client.post(
+            email_confirm_url,
+            {"type": "sign_up", "email": email, "code": "wrong-code"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_422_UNPROCESSABLE_ENTITY)
+        # 다른 인증 타입의 인증번호로는 확인할 수 없음
+        response = self.client.post(
+            email_confirm_url,
+            {"type": "password_change", "email": email, "code": code},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_422_UNPROCESSABLE_ENTITY)
+
+        response = self.client.post(
+            email_confirm_url,
+            {"type": "sign_up", "email": email, "code": code},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        # 사용한 인증번호는 다시 사용할 수 없음
+        response = self.client.post(
+            email_confirm_url,
+            {"type": "sign_up", "email": email, "code": code},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_422_UNPROCESSABLE_ENTITY)
+
+        response = self.client.post(
+            reverse("email-registration"),
+            {
+                "email": email,
+                "password1": "qwerty12!",
+                "password2": "qwerty12!",
+                "device_type": "ios",
+                "agree_to_ad": True,
+            },
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        # 유효 시간이 지난 인증번호 / 같은 인증번호를 동시에 확인하는 경우 한번만 성공
+        store = get_verification_code_store()
+        identity = {"email": email, "type": "password_change"}
+        store.issue(VERIFICATION_EMAIL, identity, "123456")
+        key = store.get_cache_key(VERIFICATION_EMAIL, identity)
+        cache.set(key, {"code": "123456", "issued_at": time.time() - 60 * 11})
+        self.assertEqual(
+            store.consume(VERIFICATION_EMAIL, identity, "123456"),
+            VERIFICATION_EXPIRED,
+        )
+        store.issue(VERIFICATION_EMAIL, identity, "123456")
+        cache.delete(key)
+        self.assertEqual(
+            store.consume(VERIFICATION_EMAIL, identity, "123456"),
+            VERIFICATION_INCORRECT,
+        )
+        self.assertFalse(store.has_confirmed(VERIFICATION_EMAIL, identity))
+
+        # AUDIT를 켜면 발송한 인증번호를 모델에도 기록
+        store.audit = True
+        store.issue(VERIFICATION_EMAIL, identity, "654321")
+        self.assertEqual(
+            store.consume(VERIFICATION_EMAIL, identity, "654321"),
+            VERIFICATION_CONFIRMED,
+        )
+        self.assertTrue(store.has_confirmed(VERIFICATION_EMAIL, identity))
+        self.assertTrue(
+            EmailVerification.objects.filter(code="654321", **identity).exists()
+        )
+
+    @override_settings(
+        VERIFICATION_CODE_STORE={
+            "BACKEND": "users.verification_store.CacheVerificationCodeStore"
+        }
+    )
+    def test_verification_code_cache_store_concurrent_consume(self):
+        """같은 인증번호를 여러 요청에서 동시에 확인해도 한번만 성공하는지 테스트"""
+
+        self.addCleanup(cache.clear)
+        store = CacheVerificationCodeStore()
+        identity = {"email": "concurrent@popprika.com", "type": "sign_up"}
+        store.issue(VERIFICATION_EMAIL, identity, "123456")
+
+        # 모든 요청이 인증번호를 조회한 뒤에 사용 처리
+        store.cache = BarrierCache(store.cache, parties=4)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(
+                executor.map(
+                    lambda _: store.consume(VERIFICATION_EMAIL, identity, "123456"),
+                    range(4),
+                )
+            )
+        self.assertEqual(results.count(VERIFICATION_CONFIRMED), 1)
+        self.assertEqual(results.count(VERIFICATION_INCORRECT), 3)
+        store.cache = store.cache.cache
+        self.assertTrue(store.has_confirmed(VERIFICATION_EMAIL, identity))
+
+        # 새로 발송한 인증번호는 이전 인증번호 사용 처리와 상관없이 사용 가능
+        store.issue(VERIFICATION_EMAIL, identity, "654321")
+        self.assertEqual(
+            store.consume(VERIFICATION_EMAIL, identity, "654321"),
+            VERIFICATION_CONFIRMED,
+        )
+
+    def test_push_notification_fan_out(self):
+        """푸시 토큰 등록 / fan-out 발송 / 사용할 수 없는 토큰 삭제 테스트"""
+
+        push_token_url = reverse("push-token-change")
+        response = self.client.patch(
+            push_token_url, {"push_token": "token-email"}, format="json"
+        )
+        unauthorized_after_login(self, response)
+
+        response = self.client.patch(
+            push_token_url, {"push_token": "token-email"}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        email_user = User.objects.get(push_token="token-email")
+        self.assertFalse(email_user.push_notification)
+
+        User.objects.bulk_create(
+            [
+                User(
+                    user_code=f"PUSH_USERCODE_{index}",
+                    device_type=DeviceType.AOS.value,
+                    push_notification=True,
+                    push_token=f"token-{index}",
+                )
+                for index in range(6)
+            ]
+            + [
+                User(
+                    user_code="PUSH_USERCODE_NO_TOKEN",
+                    device_type=DeviceType.AOS.value,
+                    push_notification=True,
+                )
+            ]
+        )
+
+        multicast_message = FirebaseAppPush(
+            ["token-0", "token-1"], "title", "body"
+        ).get_multicast_message()
+        self.assertEqual(multicast_message.tokens, ["token-0", "token-1"])
+
+        with self.assertRaises(ValueError):
+            FirebasePushFanOut("title", "body", batch_size=501)
+
+        # 푸시를 끈 유저(email_user)와 토큰이 없는 유저는 제외하고 4개씩 나누어 발송
+        sender = FakeMulticastSender(unregistered_tokens=["token-3"])
+        report = FirebasePushFanOut(
+            "title", "body", batch_size=4, max_workers=2, send_multicast=sender
+        ).send(get_push_notification_audience(DeviceType.AOS.value))
+
+        sent_tokens = sorted(
+            token for message in sender.messages for token in message.tokens
+        )
+        self.assertEqual(sent_tokens, [f"token-{index}" for index in range(6)])
+        self.assertEqual(
+            sorted(len(message.tokens) for message in sender.messages), [2, 4]
+        )
+        self.assertEqual(report["size"], 6)
+        self.assertEqual(report["success_count"], 5)
+        self.assertEqual(report["failure_count"], 1)
+        self.assertEqual(report["pruned_count"], 1)
+        self.assertEqual([result["batch"] for result in report["batches"]], [1, 2])
+        self.assertTrue(all(result["throughput"] > 0 for result in report["batches"]))
+
+        # 사용할 수 없는 토큰은 삭제되어 다음 발송에서 제외
+        self.assertFalse(User.objects.filter(push_token="token-3").exists())
+        sender = FakeMulticastSender()
+        report = FirebasePushFanOut("title", "body", send_multicast=sender).send(
+            get_push_notification_audience(DeviceType.AOS.value)
+        )
+        self.assertEqual(report["success_count"], 5)
+        self.assertEqual(len(sender.messages), 1)
+
+        # 같은 토큰을 다른 유저가 등록하면 이전 유저에서는 삭제
+        self.client.credentials()
+        login_process(self.client, DEFAULT_EMAIL_LOGIN_DATA)
+        User.objects.filter(push_token="token-0").update(push_token=None)
+        response = self.client.patch(
+            push_token_url, {"push_token": "token-1"}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            list(
+                User.objects.filter(push_token="token-1").values_list("id", flat=True)
+            ),
+            [email_user.id],
+        )
+
+        response = self.client.patch(
+            push_token_url, {"push_token": None}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        email_user.refresh_from_db()
+        self.assertIsNone(email_user.push_token)
+
+    def test_password_policy(self):
+        """비밀번호 정책 / 흔한 비밀번호 목록 검사 테스트"""
+
+        common_passwords = CommonPasswordList(["password", "qwerty", " 123456 "])
+        self.assertEqual(len(common_passwords), 3)
+        self.assertIn("PassWord ", common_passwords)
+        self.assertIn("123456", common_passwords)
+        self.assertNotIn("passwor", common_passwords)
+        self.assertNotIn("qwerty1", common_passwords)
+
+        policy = PasswordPolicy(common_passwords=common_passwords)
+        self.assertEqual(policy.check("qwerty12!"), [])
+        self.assertEqual(
+            policy.check("password"),
+            [PASSWORD_RULE_COMMON, PASSWORD_RULE_NUMBER_ENGLISH_MIX],
+        )
+        self.assertEqual(
+            policy.check("123456"),
+            [
+                PASSWORD_RULE_MIN_LENGTH,
+                PASSWORD_RULE_COMMON,
+                PASSWORD_RULE_NUMERIC,
+                PASSWORD_RULE_NUMBER_ENGLISH_MIX,
+            ],
+        )
+        self.assertEqual(
+            policy.check(""),
+            [PASSWORD_RULE_MIN_LENGTH, PASSWORD_RULE_NUMBER_ENGLISH_MIX],
+        )
+        self.assertEqual(
+            PasswordPolicy(
+                common_passwords=common_passwords, rules=[PASSWORD_RULE_NUMERIC]
+            ).check("１２３４"),
+            [PASSWORD_RULE_NUMERIC],
+        )
+
+        # 흔한 비밀번호 목록 전체를 읽는 validate_password_format / serializer validator
+        validation_error = validate_password_format("password")
+        self.assertEqual(
+            validation_error.data["message"], [ValidationErrorStrs.pw_common]
+        )
+        validation_error = validate_password_format("1234")
+        self.assertEqual(
+            validation_error.data["message"],
+            [
+                ValidationErrorStrs.pw_min_length,
+                ValidationErrorStrs.pw_common,
+                ValidationErrorStrs.pw_numeric,
+            ],
+        )
+        self.assertIsNone(validate_password_format("correcthorse42battery"))
+
+        self.assertIsNone(validate_password("qwerty12!"))
+        for password in ["qwer12", "password1", "qwertyuiop"]:
+            with self.assertRaises((StandardException, ValidationError)):
+                validate_password(password)
+
+    def test_social_login(self):
+        """소셜 로그인(async view) 테스트 - WSGI / ASGI 요청"""
+
+        apple_key, private_key = create_apple_key("test-key")
+        social_login_url = reverse("social-login")
+        social_login_req_body = {
+            "social_type": DEFAULT_APPLE_LINK_DATA["type"],
+            "id_token": create_apple_id_token(
+                private_key, "test-key", DEFAULT_APPLE_LINK_DATA["link_id"]
+            ),
+            "social_id": DEFAULT_APPLE_LINK_DATA["link_id"],
+            "social_email": DEFAULT_APPLE_LINK_DATA["link_email"],
+        }
+
+        # 기본 KEY_SOURCE(JWKS_URL 조회)로 로컬 서버의 키 목록 사용
+        key_server = LocalKeyServer({"keys": [apple_key]})
+        key_server.__enter__()
+        self.addCleanup(key_server.__exit__, None, None, None)
+        get_apple_key_cache.cache_clear()
+        self.addCleanup(get_apple_key_cache.cache_clear)
+        apple_auth_settings = override_settings(
+            APPLE_AUTH={"CLIENT_IDS": ["test.bundle.id"], "JWKS_URL": key_server.url}
+        )
+        apple_auth_settings.enable()
+        self.addCleanup(apple_auth_settings.disable)
+
+        response = self.client.post(
+            social_login_url, social_login_req_body, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        token = Token.objects.get(key=response.data["token"])
+        self.assertEqual(token.user_id, response.data["id"])
+
+        response = self.client.post(
+            social_login_url,
+            {
+                **social_login_req_body,
+                "id_token": create_apple_id_token(private_key, "test-key", "unknown"),
+                "social_id": "unknown",
+            },
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        # id_token이 없거나 다른 애플 계정의 토큰이면 실패
+        response = self.client.post(
+            social_login_url,
+            {
+                key: value
+                for key, value in social_login_req_body.items()
+                if key != "id_token"
+            },
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_422_UNPROCESSABLE_ENTITY)
+        response = self.client.post(
+            social_login_url,
+            {**social_login_req_body, "social_id": "unknown"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_422_UNPROCESSABLE_ENTITY)
+
+        response = self.client.post(
+            social_login_url, {"social_type": "A"}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.get(social_login_url)
+        self.assertEqual(response.status_code, status.HTTP_405_METHOD_NOT_ALLOWED)
+
+        # ASGI로 요청해도 같은 결과 (다시 로그인하면 토큰이 바뀜)
+        async def asgi_social_login():
+            return await AsyncClient().post(
+                social_login_url,
+                social_login_req_body,
+                content_type="application/json",
+            )
+
+        response = async_to_sync(asgi_social_login)()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response.json()["token"], token.key)
+        self.assertTrue(Token.objects.filter(key=response.json()["token"]).exists())
+        self.assertEqual(key_server.request_count, 1)
+
+    @override_settings(
+        APPLE_AUTH={
+            "CLIENT_IDS": ["test.bundle.id"],
+            "KEY_SOURCE": "users.tests.LocalAppleKeySource",
+            "REFRESH_INTERVAL": 0,
+        }
+    )
+    def test_apple_auth_key_cache(self):
+        """애플 키 목록을 캐시해서 로컬에서 검증하고, 키가 바뀌면 다시 조회하는지 테스트"""
+
+        get_apple_key_cache.cache_clear()
+        self.addCleanup(get_apple_key_cache.cache_clear)
+        apple_id = DEFAULT_APPLE_LINK_DATA["link_id"]
+        old_key, old_private_key = create_apple_key("old-key")
+        new_key, new_private_key = create_apple_key("new-key")
+        LocalAppleKeySource.jwks = {"keys": [old_key]}
+        LocalAppleKeySource.fetch_count = 0
+
+        id_token = create_apple_id_token(old_private_key, "old-key", apple_id)
+        for _ in range(3):
+            self.assertEqual(apple_auth(id_token, apple_id)["sub"], apple_id)
+        self.assertEqual(LocalAppleKeySource.fetch_count, 1)
+
+        # aud가 다르거나 만료됐거나 다른 키로 서명한 토큰은 실패 (캐시에 있는 kid면 다시 조회하지 않음)
+        for invalid_id_token in [
+            create_apple_id_token(
+                old_private_key, "old-key", apple_id, aud="other.bundle.id"
+            ),
+            create_apple_id_token(
+                old_private_key, "old-key", apple_id, exp=int(time.time()) - 60
+            ),
+            create_apple_id_token(new_private_key, "old-key", apple_id),
+        ]:
+            with self.assertRaises(StandardException):
+                apple_auth(invalid_id_token, apple_id)
+        self.assertEqual(LocalAppleKeySource.fetch_count, 1)
+
+        # 애플이 키를 교체하면 모르는 kid가 들어왔을 때 다시 조회
+        LocalAppleKeySource.jwks = {"keys": [new_key]}
+        id_token = create_apple_id_token(new_private_key, "new-key", apple_id)
+        self.assertEqual(apple_auth(id_token, apple_id)["sub"], apple_id)
+        self.assertEqual(LocalAppleKeySource.fetch_count, 2)
+        self.assertEqual(apple_auth(id_token, apple_id)["sub"], apple_id)
+        self.assertEqual(LocalAppleKeySource.fetch_count, 2)
+
+        # 목록에 없는 kid는 조회 후에도 실패
+        with self.assertRaises(StandardException):
+            apple_auth(
+                create_apple_id_token(new_private_key, "unknown-key", apple_id),
+                apple_id,
+            )
+        self.assertEqual(LocalAppleKeySource.fetch_count, 3)
+
+        # 허용하는 aud(CLIENT_IDS)가 설정되지 않으면 토큰 에러가 아닌 설정 에러
+        with override_settings(APPLE_AUTH={"CLIENT_IDS": []}):
+            with self.assertRaises(ImproperlyConfigured):
+                apple_auth(id_token, apple_id)
+
+    @override_settings(GOOGLE_WEB_CLIENT_ID="test-client-id")
+    def test_google_auth_certificate_cache(self):
+        """google 인증서를 Cache-Control max-age 동안 캐시해서 재사용하는지 테스트"""
+
+        certificates, signer = create_google_certificate("test-key")
+        now = int(time.time())
+        id_token = google_auth_jwt.encode(
+            signer,
+            {
+                "iss": "https://accounts.google.com",
+                "aud": "test-client-id",
+                "sub": DEFAULT_GOOGLE_LINK_DATA["link_id"],
+                "iat": now,
+                "exp": now + 3600,
+            },
+        ).decode()
+        social_login_req_body = {
+            "social_type": DEFAULT_GOOGLE_LINK_DATA["type"],
+            "id_token": id_token,
+            "social_id": DEFAULT_GOOGLE_LINK_DATA["link_id"],
+            "social_email": DEFAULT_GOOGLE_LINK_DATA["link_email"],
+        }
+
+        with LocalKeyServer(
+            certificates, headers={"Cache-Control": "public, max-age=3600"}
+        ) as key_server:
+            with override_settings(GOOGLE_OAUTH2_CERTS_URL=key_server.url):
+                for _ in range(3):
+                    response = self.client.post(
+                        reverse("social-login"), social_login_req_body, format="json"
+                    )
+                    self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(key_server.request_count, 1)
+
+                # 다른 google 계정의 토큰이면 실패
+                response = self.client.post(
+                    reverse("social-login"),
+                    {**social_login_req_body, "social_id": "other-google-id"},
+                    format="json",
+                )
+                self.assertEqual(
+                    response.status_code, status.HTTP_422_UNPROCESSABLE_ENTITY
+                )
+
+        # 캐시하지 말라는 응답은 매번 다시 조회
+        with LocalKeyServer(
+            certificates, headers={"Cache-Control": "no-store"}
+        ) as key_server:
+            with override_settings(GOOGLE_OAUTH2_CERTS_URL=key_server.url):
+                for _ in range(2):
+                    response = self.client.post(
+                        reverse("social-login"), social_login_req_body, format="json"
+                    )
+                    self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(key_server.request_count, 2)
@@ -16,6 +16,7 @@ from users.views import (
     ProfileimageChange,
     ProfileImageS3Upload,
     PushNotificationChange,
+    PushTokenChange,
     SettingData,
     SocialLogin,
     SocialRegistration,
@@ -95,6 +96,11 @@ urlpatterns = [
         PushNotificationChange.as_view(),
         name="push-notification-change",
     ),
+    path(
+        "push-token/",
+        PushTokenChange.as_view(),
+        name="push-token-change",
+    ),
     path(
         "ad/",
         AdChange.as_view(),
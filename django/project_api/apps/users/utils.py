@@ -1,21 +1,34 @@
 # users/utils.py
-import os
+import functools
 import uuid
+from datetime import datetime, timedelta
 from typing import Final, Optional
 
+import requests
+from project_api.async_views import run_in_thread
+from project_api.password_policy import (
+    PASSWORD_RULE_COMMON,
+    PASSWORD_RULE_MIN_LENGTH,
+    PASSWORD_RULE_NUMERIC,
+    PasswordPolicy,
+)
 from project_api.utils import StandardError, StandardException
+from cachecontrol import CacheControl
 from google.auth.transport import requests as google_auth_requests
 from google.oauth2 import id_token as google_auth_id_token
 from rest_framework import status
 from rest_framework.authtoken.models import Token
 from rest_framework.response import Response
-from users.models import LoginLink
-
-from django.contrib.auth.password_validation import (
-    CommonPasswordValidator,
-    MinimumLengthValidator,
-    NumericPasswordValidator,
+from users.apple_auth import apple_auth
+from users.models import EmailVerification, LoginLink, PhoneVerification, User
+from users.verification_store import (
+    VERIFICATION_CONFIRMED,
+    VERIFICATION_EXPIRED,
+    VERIFICATION_PHONE,
+    get_verification_code_store,
 )
+
+from django.conf import settings
 from django.core.validators import validate_email as django_validate_email
 from django.utils.translation import ugettext_lazy
 
@@ -40,6 +53,15 @@ class ValidationErrorStrs:
     user_auth_failed: Final = "이메일 또는 비밀번호가 일치하지 않습니다."
 
 
+# validate_password_format에서 검사하는 규칙과 에러 문구 (에러 문구 순서대로 검사)
+PASSWORD_FORMAT_ERROR_STRS: Final = {
+    PASSWORD_RULE_MIN_LENGTH: ValidationErrorStrs.pw_min_length,
+    PASSWORD_RULE_COMMON: ValidationErrorStrs.pw_common,
+    PASSWORD_RULE_NUMERIC: ValidationErrorStrs.pw_numeric,
+}
+password_format_policy = PasswordPolicy(rules=PASSWORD_FORMAT_ERROR_STRS)
+
+
 class RegistrationValidationValues:
     def __init__(self, request):
         self.email = request.data.get("email")
@@ -69,25 +91,13 @@ def validate_password_equality(
 def validate_password_format(password: str) -> Optional[StandardError]:
     """
     django validator들을 그대로 현상황에선 언어를 상황에 맞게 컨트롤 할 수가 없다고 판단하여
-    번거럽더라도 각각 try-except구문으로 구분하여 직접 정의 한 에러문구와 함께 처리
-    (한번에 처리하면 어떤 에러인지 알 수 없으므로)
-    추후, 더 좋은 방법이 생기면 그것으로 변경할 것
+    위반한 규칙별로 직접 정의 한 에러문구와 함께 처리
+    - 비밀번호 정책(project_api.password_policy)으로 모든 규칙을 한번에 검사
     """
-    validate_error_strs = []
-    try:
-        MinimumLengthValidator().validate(password)
-    except Exception:
-        validate_error_strs.append(ValidationErrorStrs.pw_min_length)
-
-    try:
-        CommonPasswordValidator().validate(password)
-    except Exception:
-        validate_error_strs.append(ValidationErrorStrs.pw_common)
-
-    try:
-        NumericPasswordValidator().validate(password)
-    except Exception:
-        validate_error_strs.append(ValidationErrorStrs.pw_numeric)
+    validate_error_strs = [
+        PASSWORD_FORMAT_ERROR_STRS[rule]
+        for rule in password_format_policy.check(password)
+    ]
 
     if len(validate_error_strs) > 0:
         return StandardError(
@@ -218,19 +228,38 @@ def generate_unique_user_code():
         return user_code
 
 
+# google id_token 발급자 (google_auth_id_token.verify_oauth2_token과 같음)
+GOOGLE_OAUTH2_ISSUERS: Final = ("accounts.google.com", "https://accounts.google.com")
+
+
+@functools.lru_cache(maxsize=None)
+def get_google_auth_request():
+    """
+    google 인증서 조회에 사용하는 transport (worker마다 하나를 만들어서 재사용)
+    - keep-alive 연결을 재사용하는 requests 세션
+    - 인증서 응답을 Cache-Control max-age 동안 메모리에 캐시 (이후 로그인은 네트워크 없이 서명만 검사)
+    """
+    return google_auth_requests.Request(session=CacheControl(requests.Session()))
+
+
 def google_auth(id_token, google_id):
     """
     google api 활용하여 받아온 token과 request_google_id를 비교하여 한번더 유효성 검사 진행
     """
 
-    GOOGLE_WEB_CLIENT_ID = os.environ.get("GOOGLE_WEB_CLIENT_ID")
-
     ## TODO id_token third_party 명 바꾸든 아니면 내 token값 변경하여 사용하기
     ## requests도 좀 더 명확하게 명명하기
     try:
-        google_id_info = google_auth_id_token.verify_oauth2_token(
-            id_token, google_auth_requests.Request(), GOOGLE_WEB_CLIENT_ID
+        google_id_info = google_auth_id_token.verify_token(
+            id_token,
+            get_google_auth_request(),
+            audience=settings.GOOGLE_WEB_CLIENT_ID,
+            certs_url=settings.GOOGLE_OAUTH2_CERTS_URL,
         )
+        if google_id_info["iss"] not in GOOGLE_OAUTH2_ISSUERS:
+            raise ValueError(
+                f"Wrong issuer. 'iss' should be one of {GOOGLE_OAUTH2_ISSUERS}"
+            )
 
         google_id_from_oauth = google_id_info["sub"]
     except Exception as e:
@@ -252,6 +281,11 @@ def google_auth(id_token, google_id):
         )
 
 
+# async view(SocialLogin)에서 사용
+async_google_auth = run_in_thread(google_auth)
+async_apple_auth = run_in_thread(apple_auth)
+
+
 def get_user_link_with_token(token):
     try:
         token = Token.objects.get(key=token)
@@ -286,31 +320,67 @@ def get_login_link_data(user):
     return login_link
 
 
-def verification_time_limit(
-    request,
-    intime_obj,
-    verification,
-    recent_verification,
-    verification_type=None,
-):
-    if intime_obj is not None and intime_obj.code == verification.code:
-        if recent_verification.exists():
-            if recent_verification[0] != verification:
-                raise StandardException(
-                    422,
-                    ugettext_lazy("Incorrect Code"),
-                )
-            else:
-                verification.auth_check = True
-                verification.save()
-        print(verification_type)
-        if verification_type == "phone":
-            print(verification.phone_number)
-            request.user.phone = verification.phone_number
-            request.user.save()
-        return Response(status=status.HTTP_200_OK)
-    else:
+# 만료된 인증번호 보관 기간 (인증번호는 발송한 날에만 확인할 수 있고, 회원가입은 인증 후 30분 이내)
+VERIFICATION_RETENTION: Final = timedelta(days=1)
+VERIFICATION_PURGE_BATCH_SIZE: Final = 1000
+
+
+def verification_time_limit(request, kind, identity, code):
+    """
+    인증번호 저장소(users.verification_store)에서 가장 최근 인증번호와 code를 비교해서 인증 처리
+    - 이전에 발송한 인증번호는 사용할 수 없음
+    - 핸드폰 인증이 완료되면 유저 핸드폰 번호 변경
+    """
+    result = get_verification_code_store().consume(kind, identity, code)
+    if result == VERIFICATION_EXPIRED:
         raise StandardException(
             422,
             message=ugettext_lazy("Time expried"),
         )
+    if result != VERIFICATION_CONFIRMED:
+        raise StandardException(
+            422,
+            ugettext_lazy("Incorrect Code"),
+        )
+
+    if kind == VERIFICATION_PHONE:
+        request.user.phone = identity["phone_number"]
+        request.user.save()
+    return Response(status=status.HTTP_200_OK)
+
+
+def purge_expired_verifications(
+    retention=VERIFICATION_RETENTION,
+    batch_size=VERIFICATION_PURGE_BATCH_SIZE,
+    now=None,
+):
+    """
+    보관 기간이 지난 이메일 / 핸드폰 인증번호 삭제 (모델별 삭제한 개수 반환)
+    - 테이블 잠금이 길어지지 않도록 batch_size개씩 나눠서 삭제
+    """
+    expired_before = (now or datetime.now()) - retention
+    deleted_counts = {}
+    for model in (EmailVerification, PhoneVerification):
+        deleted_counts[model.__name__] = 0
+        while True:
+            pks = list(
+                model.objects.filter(created_at__lt=expired_before).values_list(
+                    "pk", flat=True
+                )[:batch_size]
+            )
+            if not pks:
+                break
+            deleted_count, _ = model.objects.filter(pk__in=pks).delete()
+            deleted_counts[model.__name__] += deleted_count
+
+    return deleted_counts
+
+
+def get_push_notification_audience(device_type=None):
+    """앱푸시를 받을 유저 (탈퇴하지 않고 푸시를 켠 유저, device_type을 주면 해당 기기만)"""
+    queryset = User.objects.filter(
+        push_notification=True, is_active=True, deleted_at__isnull=True
+    )
+    if device_type is not None:
+        queryset = queryset.filter(device_type=device_type)
+    return queryset
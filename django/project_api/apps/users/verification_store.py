@@ -0,0 +1,185 @@
+# users/verification_store.py
+"""verification_store 모듈 설명
+
+이메일 / 핸드폰 인증번호 저장소
+
+- 인증번호는 발송 후 10분 동안만 사용하므로 DB 대신 캐시에 저장할 수 있도록 저장소를 교체 가능하게 분리
+- ModelVerificationCodeStore: 기존처럼 EmailVerification / PhoneVerification 모델에 저장 (기본값)
+- CacheVerificationCodeStore: django 캐시(CACHES)에 TTL과 함께 저장
+    - 여러 서버 / 프로세스가 같이 사용하는 캐시(redis, memcached 등)를 설정한 경우에만 사용
+      (기본 LocMemCache는 프로세스마다 따로 저장되므로 발송 / 확인 요청이 다른 프로세스로 가면 실패)
+    - 확인에 성공하면 발송한 인증번호마다 사용 처리 key를 cache.add()로 저장하고, 저장한 요청만 성공 처리
+      (add()는 key가 없을 때만 저장하므로 같은 인증번호로 동시에 확인해도 한번만 성공)
+    - AUDIT를 켜면 발송한 인증번호를 모델에도 기록
+- 저장소는 VERIFICATION_CODE_STORE["BACKEND"]로 설정
+"""
+import functools
+import hashlib
+import time
+from datetime import datetime, timedelta
+from typing import Final
+
+from users.models import EmailVerification, PhoneVerification
+
+from django.conf import settings
+from django.core.cache import caches
+from django.utils.module_loading import import_string
+
+# 인증 종류 (identity는 모델 필드 이름 = 값)
+# - email: {"email": ..., "type": EmailVerificationType}
+# - phone: {"country_code_id": ..., "phone_number": ...}
+VERIFICATION_EMAIL: Final = "email"
+VERIFICATION_PHONE: Final = "phone"
+VERIFICATION_MODELS: Final = {
+    VERIFICATION_EMAIL: EmailVerification,
+    VERIFICATION_PHONE: PhoneVerification,
+}
+
+# 인증번호 확인 결과
+VERIFICATION_CONFIRMED: Final = "confirmed"
+VERIFICATION_INCORRECT: Final = "incorrect"
+VERIFICATION_EXPIRED: Final = "expired"
+
+# 인증번호 유효 시간
+VERIFICATION_TIME_LIMIT: Final = timedelta(minutes=10)
+# 인증 완료 후 회원가입 등 다음 단계까지 유효 시간
+VERIFICATION_CONFIRMED_TIME_LIMIT: Final = timedelta(minutes=30)
+
+VERIFICATION_CODE_STORE_DEFAULTS = {
+    "BACKEND": "users.verification_store.ModelVerificationCodeStore",
+    # CacheVerificationCodeStore에서 사용하는 settings.CACHES의 alias
+    "CACHE": "default",
+    # 캐시에 인증번호를 유지하는 시간(초)
+    # - 유효 시간(10분)이 지난 뒤에도 이 시간 동안은 "Time expried"로 응답
+    "TIMEOUT": 60 * 60,
+    # CacheVerificationCodeStore에서 발송한 인증번호를 모델에도 기록할지 여부
+    "AUDIT": False,
+}
+
+
+def get_verification_code_store_setting(name):
+    return getattr(settings, "VERIFICATION_CODE_STORE", {}).get(
+        name, VERIFICATION_CODE_STORE_DEFAULTS[name]
+    )
+
+
+def get_latest_verification(queryset, now=None):
+    """
+    오늘 발송하고 아직 확인하지 않은 가장 최근 인증번호 (없으면 None)
+    - queryset: 이메일(email, type) / 핸드폰(phone_number, country_code)으로 거른 인증 queryset
+    - created_at__year / __month / __day는 컬럼에 함수를 적용해서 인덱스를 사용하지 못하므로 범위로 조회
+    """
+    now = now or datetime.now()
+    today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    return (
+        queryset.filter(
+            auth_check=False,
+            created_at__gte=today,
+            created_at__lt=today + timedelta(days=1),
+        )
+        .order_by("-created_at")
+        .first()
+    )
+
+
+class VerificationCodeStore:
+    """
+    인증번호 저장소 interface
+    - 가장 최근에 발송한 인증번호만 사용할 수 있음
+    """
+
+    def issue(self, kind, identity, code, **extra):
+        """인증번호 저장 (extra: 모델에 같이 저장할 값, 예: 핸드폰 인증의 user)"""
+        raise NotImplementedError
+
+    def consume(self, kind, identity, code):
+        """인증번호를 확인하고, 맞으면 사용 처리 (VERIFICATION_CONFIRMED / INCORRECT / EXPIRED 반환)"""
+        raise NotImplementedError
+
+    def has_confirmed(self, kind, identity):
+        """VERIFICATION_CONFIRMED_TIME_LIMIT 이내에 인증을 완료했는지 여부"""
+        raise NotImplementedError
+
+
+class ModelVerificationCodeStore(VerificationCodeStore):
+    def issue(self, kind, identity, code, **extra):
+        VERIFICATION_MODELS[kind].objects.create(code=code, **identity, **extra)
+
+    def consume(self, kind, identity, code):
+        model = VERIFICATION_MODELS[kind]
+        verification = get_latest_verification(model.objects.filter(**identity))
+        if verification is None or verification.code != code:
+            return VERIFICATION_INCORRECT
+        if verification.created_at < datetime.now() - VERIFICATION_TIME_LIMIT:
+            return VERIFICATION_EXPIRED
+
+        # 같은 인증번호로 동시에 확인하는 경우 먼저 변경한 요청만 성공
+        if not model.objects.filter(pk=verification.pk, auth_check=False).update(
+            auth_check=True
+        ):
+            return VERIFICATION_INCORRECT
+        return VERIFICATION_CONFIRMED
+
+    def has_confirmed(self, kind, identity):
+        return (
+            VERIFICATION_MODELS[kind]
+            .objects.filter(
+                auth_check=True,
+                created_at__gte=datetime.now() - VERIFICATION_CONFIRMED_TIME_LIMIT,
+                **identity,
+            )
+            .exists()
+        )
+
+
+class CacheVerificationCodeStore(VerificationCodeStore):
+    def __init__(self):
+        self.cache = caches[get_verification_code_store_setting("CACHE")]
+        self.timeout = get_verification_code_store_setting("TIMEOUT")
+        self.audit = get_verification_code_store_setting("AUDIT")
+
+    def get_cache_key(self, kind, identity, suffix="code"):
+        # 이메일 등 캐시 key로 사용할 수 없는 문자가 있을 수 있으므로 hash 사용
+        identity_key = "&".join(f"{name}={identity[name]}" for name in sorted(identity))
+        digest = hashlib.sha256(identity_key.encode()).hexdigest()
+        return f"verification:{kind}:{digest}:{suffix}"
+
+    def issue(self, kind, identity, code, **extra):
+        self.cache.set(
+            self.get_cache_key(kind, identity),
+            {"code": code, "issued_at": time.time()},
+            self.timeout,
+        )
+        if self.audit:
+            VERIFICATION_MODELS[kind].objects.create(code=code, **identity, **extra)
+
+    def consume(self, kind, identity, code):
+        key = self.get_cache_key(kind, identity)
+        entry = self.cache.get(key)
+        if entry is None or entry["code"] != code:
+            return VERIFICATION_INCORRECT
+        if time.time() - entry["issued_at"] > VERIFICATION_TIME_LIMIT.total_seconds():
+            return VERIFICATION_EXPIRED
+
+        # 사용 처리 key를 먼저 저장한 요청만 인증 완료 (다른 요청에서 먼저 사용했으면 False)
+        # - 발송 시간으로 구분하므로 확인하는 동안 새로 발송한 인증번호는 사용 처리되지 않음
+        # - 사용 처리 key가 인증번호보다 나중에 만료되므로 인증번호는 삭제하지 않아도 다시 사용할 수 없음
+        used_key = self.get_cache_key(kind, identity, f"used:{entry['issued_at']!r}")
+        if not self.cache.add(used_key, True, self.timeout):
+            return VERIFICATION_INCORRECT
+        self.cache.set(
+            self.get_cache_key(kind, identity, "confirmed"),
+            time.time(),
+            VERIFICATION_CONFIRMED_TIME_LIMIT.total_seconds(),
+        )
+        return VERIFICATION_CONFIRMED
+
+    def has_confirmed(self, kind, identity):
+        return (
+            self.cache.get(self.get_cache_key(kind, identity, "confirmed")) is not None
+        )
+
+
+@functools.lru_cache(maxsize=None)
+def get_verification_code_store():
+    return import_string(get_verification_code_store_setting("BACKEND"))()
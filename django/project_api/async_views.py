@@ -0,0 +1,87 @@
+# project_api/async_views.py
+"""async_views 모듈 설명
+
+외부 API 응답을 기다리는 시간이 긴 endpoint를 async view로 처리하기 위한 모듈
+
+- DRF(3.12) APIView는 async handler를 지원하지 않으므로 AsyncAPIView에서 dispatch를 async로 처리
+- 인증 / 권한 / throttle 처리와 DB를 사용하는 코드는 database_sync_to_async로 실행
+  (django 3.2는 sync 코드를 프로세스마다 한 스레드에서 실행하므로 DB 연결 / 트랜잭션이 섞이지 않음)
+- 외부 API 호출처럼 DB를 사용하지 않고 기다리기만 하는 코드는 run_in_thread로 별도 스레드에서 실행해서
+  기다리는 동안 같은 worker가 다른 요청을 처리
+- ASGI(project_api.asgi)로 실행하면 요청마다 이벤트 루프에서 처리되고,
+  WSGI로 실행해도 django가 요청마다 async_to_sync로 실행하므로 같은 코드로 동작
+"""
+import asyncio
+import functools
+import inspect
+
+from asgiref.sync import sync_to_async
+from rest_framework.views import APIView
+
+
+def database_sync_to_async(function):
+    """DB를 사용하는 sync 함수를 async 함수로 변환"""
+    return sync_to_async(function, thread_sensitive=True)
+
+
+def run_in_thread(function):
+    """DB를 사용하지 않는 blocking I/O 함수를 별도 스레드에서 실행하는 async 함수로 변환"""
+    return sync_to_async(function, thread_sensitive=False)
+
+
+class AsyncAPIView(APIView):
+    """
+    async def get / post ... 로 handler를 작성하는 APIView
+    - sync handler도 같이 사용할 수 있음 (database_sync_to_async로 실행)
+    """
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        # APIView.as_view()의 queryset 검사 등은 그대로 사용하고, 실제 view 함수만 async로 교체
+        sync_view = super().as_view(**initkwargs)
+
+        async def view(request, *args, **kwargs):
+            self = cls(**initkwargs)
+            self.setup(request, *args, **kwargs)
+            if not hasattr(self, "request"):
+                raise AttributeError(
+                    f"{cls.__name__} instance has no 'request' attribute. Did you "
+                    "override setup() and forget to call super()?"
+                )
+            return await self.async_dispatch(request, *args, **kwargs)
+
+        functools.update_wrapper(view, sync_view)
+        # csrf_exempt()는 sync 함수로 감싸므로 속성만 설정 (DRF SessionAuthentication에서 CSRF 검사)
+        view.csrf_exempt = True
+        return view
+
+    async def async_dispatch(self, request, *args, **kwargs):
+        """APIView.dispatch()와 같은 순서로 처리하면서 handler만 await"""
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await database_sync_to_async(self.initial)(request, *args, **kwargs)
+
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(
+                    self, request.method.lower(), self.http_method_not_allowed
+                )
+            else:
+                handler = self.http_method_not_allowed
+
+            # method_decorator(swagger_auto_schema 등)로 감싼 async handler도 async로 판단
+            if asyncio.iscoroutinefunction(inspect.unwrap(handler)):
+                response = await handler(request, *args, **kwargs)
+            else:
+                response = await database_sync_to_async(handler)(
+                    request, *args, **kwargs
+                )
+        except Exception as exc:
+            response = await database_sync_to_async(self.handle_exception)(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
@@ -0,0 +1,138 @@
+# project_api/aws_clients.py
+"""aws_clients 모듈 설명
+
+프로세스(gunicorn worker)마다 AWS client를 한번만 만들어서 재사용하기 위한 registry 모듈
+
+- boto3.client()는 호출할 때마다 botocore 서비스 모델을 읽고 connection pool을 새로 만들기 때문에
+  요청마다 만들지 않고 (서비스, 리전)별로 한번만 만들어서 재사용
+- 처음 사용할 때 만들고(lazy), fork된 자식 프로세스에서는 부모가 만든 client / 소켓을 쓰지 않도록 비움
+- HTTP keep-alive connection pool 크기는 settings.AWS_CLIENT_POOL_SIZES에서 서비스별로 설정
+- get_aws_client_metrics()로 서비스별 client(S3 storage connection 포함) 생성 / 재사용 횟수 조회
+    - 운영중에는 관리자 계정으로 commons의 aws-client-metrics API에서 확인
+"""
+import os
+import threading
+import weakref
+from typing import Final
+
+import boto3
+from botocore.config import Config
+from storages.backends.s3boto3 import S3Boto3Storage
+
+from django.conf import settings
+
+# 서비스별 설정이 없을 때 사용하는 connection pool 크기 (botocore 기본값과 같음)
+AWS_CLIENT_DEFAULT_POOL_SIZE: Final = 10
+
+_lock = threading.Lock()
+_session = None
+_clients = {}
+_metrics = {}
+# fork 후 connection을 비워야 하는 S3 storage
+_storages = weakref.WeakSet()
+
+
+def get_aws_client_pool_size(service_name):
+    pool_sizes = getattr(settings, "AWS_CLIENT_POOL_SIZES", {})
+    return pool_sizes.get(
+        service_name, pool_sizes.get("default", AWS_CLIENT_DEFAULT_POOL_SIZE)
+    )
+
+
+def get_aws_client_config(service_name):
+    return Config(
+        max_pool_connections=get_aws_client_pool_size(service_name),
+        tcp_keepalive=True,
+    )
+
+
+def get_aws_client(service_name, region_name=None):
+    """
+    (서비스, 리전)별로 재사용하는 boto3 client
+    - boto3 client는 thread-safe 하므로 worker 안의 모든 스레드가 같이 사용
+    """
+    global _session
+
+    key = f"{service_name}:{region_name or ''}"
+    client = _clients.get(key)
+    if client is None:
+        with _lock:
+            client = _clients.get(key)
+            if client is None:
+                # boto3.Session은 thread-safe 하지 않으므로 lock 안에서만 사용
+                if _session is None:
+                    _session = boto3.session.Session()
+                client = _session.client(
+                    service_name,
+                    region_name=region_name,
+                    config=get_aws_client_config(service_name),
+                )
+                _clients[key] = client
+                _metrics[key] = {"created": 1, "reused": 0}
+                return client
+
+    count_aws_client(key)
+    return client
+
+
+def count_aws_client(key, created=False):
+    """client 생성 / 재사용 횟수 기록"""
+    if created:
+        with _lock:
+            metrics = _metrics.setdefault(key, {"created": 0, "reused": 0})
+            metrics["created"] += 1
+        return
+
+    # 정확한 값이 필요하지 않은 지표라서 lock 없이 증가
+    # - 다른 스레드에서 reset_aws_clients()로 비운 직후일 수 있으므로 없으면 기록하지 않음
+    metrics = _metrics.get(key)
+    if metrics is not None:
+        metrics["reused"] += 1
+
+
+def get_aws_client_metrics():
+    """
+    현재 프로세스의 `서비스:리전`별 client 생성 / 재사용 횟수
+    - 예: {"ses:ap-northeast-2": {"created": 1, "reused": 41, "pool_size": 10}}
+    """
+    return {
+        key: {**metrics, "pool_size": get_aws_client_pool_size(key.split(":")[0])}
+        for key, metrics in list(_metrics.items())
+    }
+
+
+def reset_aws_clients():
+    """만들어 둔 client / session을 모두 비움 (다음 사용할 때 다시 만듦)"""
+    global _session, _lock
+
+    # fork 시점에 다른 스레드가 잡고 있던 lock이 자식 프로세스에서 풀리지 않을 수 있으므로 새로 만듦
+    _lock = threading.Lock()
+    _session = None
+    _clients.clear()
+    _metrics.clear()
+    for storage in list(_storages):
+        storage._connections = threading.local()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=reset_aws_clients)
+
+
+class PooledS3Boto3Storage(S3Boto3Storage):
+    """
+    S3Boto3Storage에 AWS_CLIENT_POOL_SIZES["s3"] 크기의 keep-alive connection pool을 설정한 storage
+    - django-storages가 스레드마다 connection을 만들어 재사용하고, fork된 자식 프로세스에서는 비움
+    - connection 생성 / 재사용 횟수는 get_aws_client_metrics()의 `s3:리전`에 같이 기록
+    """
+
+    def __init__(self, **settings):
+        super().__init__(**settings)
+        self.config = self.config.merge(get_aws_client_config("s3"))
+        _storages.add(self)
+
+    @property
+    def connection(self):
+        created = getattr(self._connections, "connection", None) is None
+        connection = super().connection
+        count_aws_client(f"s3:{self.region_name or ''}", created=created)
+        return connection
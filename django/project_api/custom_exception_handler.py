@@ -1,47 +1,104 @@
+# project_api/custom_exception_handler.py
+"""custom_exception_handler 모듈 설명
+
+API 에러 응답 처리 모듈
+
+- 에러 응답은 항상 {"status_code": int, "message": str, "details": dict | list} 형식
+- HTTP 상태 코드별 메시지 / JSON prefix는 모듈 로드 시점에 한번만 만들어둠
+- StandardException은 DRF exception_handler를 거치지 않고 바로 응답 생성
+- ErrorResponse는 renderer(content negotiation) 없이 위 형식을 바로 JSON bytes로 변환
+  (ORJSONRenderer와 같은 bytes)
+"""
+from typing import Final
+
 from project_api.custom_http_status import HTTPStatus
-from project_api.utils import StandardError, StandardException
-from rest_framework.views import exception_handler
+from project_api.renderers import orjson_dumps
+from project_api.utils import StandardException
+from rest_framework.response import Response
+from rest_framework.views import exception_handler, set_rollback
 
 from django.utils.translation import ugettext_lazy
 
+# 상태 코드별 에러 메시지 (lazy 번역 문자열이라 응답할 때 요청 언어로 변환됨)
+HTTP_STATUS_MESSAGES: Final = {
+    status.value: status.description for status in HTTPStatus
+}
+# 상태 코드별 JSON 앞부분
+ERROR_PAYLOAD_PREFIXES: Final = {
+    status.value: b'{"status_code":%d,"message":' % status.value
+    for status in HTTPStatus
+}
+EMPTY_DETAILS_JSON: Final = b"{}"
+UNAUTHORIZED_MESSAGE: Final = "존재하지 않는 토큰입니다. 다시 로그인 해주십시오"
+# DRF exception_handler에서 추가하는 헤더 (인증 방법 / throttle 대기 시간)
+ERROR_RESPONSE_HEADERS: Final = ("WWW-Authenticate", "Retry-After")
+
+
+class ErrorResponse(Response):
+    """에러 응답 (data는 테스트 / 로그에서 그대로 사용할 수 있도록 유지)"""
+
+    def __init__(self, status_code, message, details=None, headers=None):
+        self.message = str(message)
+        self.details = {} if details is None else details
+        super().__init__(
+            data={
+                "status_code": status_code,
+                "message": self.message,
+                "details": self.details,
+            },
+            status=status_code,
+            headers=headers,
+            content_type="application/json",
+        )
+
+    @property
+    def rendered_content(self):
+        self["Content-Type"] = self.content_type
+        prefix = ERROR_PAYLOAD_PREFIXES.get(self.status_code)
+        if prefix is None:
+            prefix = b'{"status_code":%d,"message":' % self.status_code
+        return b"".join(
+            (
+                prefix,
+                orjson_dumps(self.message),
+                b',"details":',
+                orjson_dumps(self.details) if self.details else EMPTY_DETAILS_JSON,
+                b"}",
+            )
+        )
+
+
+def get_error_message(status_code, data):
+    if status_code == 401:
+        return UNAUTHORIZED_MESSAGE
+
+    description = HTTP_STATUS_MESSAGES.get(status_code)
+    if description is None:
+        return ugettext_lazy("error")
+
+    # 에러가 발생한 필드 이름 목록 (non_field_errors / detail 포함)
+    field_names = ",".join(data) if isinstance(data, dict) else ""
+    return f"{description} [Parameter: {field_names}]"
+
 
 def custom_exception_handler(exc, context):
     """Custom API exception handler."""
-    # print(exc, context)
-    # Call REST framework's default exception handler first,
-    # to get the standard error response.
+    if isinstance(exc, StandardException):
+        set_rollback()
+        message = UNAUTHORIZED_MESSAGE if exc.status_code == 401 else exc.detail
+        return ErrorResponse(exc.status_code, message)
+
+    # REST framework's default exception handler
+    # (Http404 / PermissionDenied 변환, 인증 / throttle 헤더, rollback)
     response = exception_handler(exc, context)
+    if response is None:
+        return None
 
-    if response is not None:
-        # Using the description's of the HTTPStatus class as error message.
-        http_code_to_message = {v.value: v.description for v in HTTPStatus}
-
-        error_payload = {
-            "status_code": 0,
-            "message": "",
-        }
-        error = error_payload
-        status_code = response.status_code
-
-        error["status_code"] = status_code
-
-        if type(exc) == StandardException or type(exc) == StandardError:
-            error["message"] = str(exc)
-            error["details"] = {}
-        else:
-            try:
-                error["message"] = f"{http_code_to_message[status_code]} [Parameter: "
-                field_name_list = []
-                for field_name, field_error in response.data.items():
-                    field_name_list.append(field_name)
-                error["message"] += ",".join(field_name_list)
-                error["message"] += "]"
-                error["details"] = response.data
-            except KeyError:
-                error["message"] = ugettext_lazy("error")
-
-        if error_payload["status_code"] == 401:
-            error_payload["message"] = "존재하지 않는 토큰입니다. 다시 로그인 해주십시오"
-
-        response.data = error_payload
-    return response
+    return ErrorResponse(
+        response.status_code,
+        get_error_message(response.status_code, response.data),
+        response.data,
+        headers={
+            name: response[name] for name in ERROR_RESPONSE_HEADERS if name in response
+        },
+    )
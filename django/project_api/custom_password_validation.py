@@ -1,9 +1,17 @@
 import functools
-import gzip
 import re
 from difflib import SequenceMatcher
-from pathlib import Path
 
+from project_api.password_policy import (
+    COMMON_PASSWORD_LIST_PATH,
+    PASSWORD_MIN_LENGTH,
+    PASSWORD_RULE_COMMON,
+    PASSWORD_RULE_MIN_LENGTH,
+    PASSWORD_RULE_NUMBER_ENGLISH_MIX,
+    PASSWORD_RULE_NUMERIC,
+    PasswordPolicy,
+    get_common_passwords,
+)
 from project_api.utils import StandardException
 
 from django.conf import settings
@@ -37,19 +45,49 @@ def get_password_validators(validator_config):
     return validators
 
 
+@functools.lru_cache(maxsize=None)
+def get_default_password_policy():
+    """AUTH_PASSWORD_VALIDATORS에 설정된 규칙만 검사하는 PasswordPolicy"""
+    validators = get_default_password_validators()
+    min_length = next(
+        (
+            validator.min_length
+            for validator in validators
+            if isinstance(validator, MinimumLengthValidator)
+        ),
+        PASSWORD_MIN_LENGTH,
+    )
+    return PasswordPolicy(
+        min_length=min_length,
+        rules=[
+            validator.rule for validator in validators if hasattr(validator, "rule")
+        ],
+    )
+
+
 def validate_password(password, user=None, password_validators=None):
     """
     Validate whether the password meets all validator requirements.
 
     If the password is valid, return ``None``.
     If the password is invalid, raise ValidationError with all error messages.
+
+    - PasswordPolicy로 검사하는 validator(rule 속성이 있는 validator)는
+      비밀번호를 한번만 검사한 결과(violations)로 처리
     """
     errors = []
     if password_validators is None:
         password_validators = get_default_password_validators()
+        violations = get_default_password_policy().check(password)
+    else:
+        violations = None
     for validator in password_validators:
         try:
-            validator.validate(password, user)
+            if violations is not None and hasattr(validator, "rule"):
+                if validator.rule in violations:
+                    validator.raise_error()
+            else:
+                validator.validate(password, user)
         except ValidationError as error:
             errors.append(error)
     if errors:
@@ -100,14 +138,17 @@ class MinimumLengthValidator:
     Validate whether the password is of a minimum length.
     """
 
-    def __init__(self, min_length=8):
+    rule = PASSWORD_RULE_MIN_LENGTH
+
+    def __init__(self, min_length=PASSWORD_MIN_LENGTH):
         self.min_length = min_length
 
     def validate(self, password, user=None):
         if len(password) < self.min_length:
-            raise StandardException(
-                400, ugettext_lazy("Please enter at least 8 digits")
-            )
+            self.raise_error()
+
+    def raise_error(self):
+        raise StandardException(400, ugettext_lazy("Please enter at least 8 digits"))
 
     def get_help_text(self):
         return _(
@@ -214,25 +255,22 @@ class CommonPasswordValidator:
     passwords (lowercased and deduplicated), created by Royce Williams:
     https://gist.github.com/roycewilliams/281ce539915a947a23db17137d91aeb7
     The password list must be lowercased to match the comparison in validate().
+
+    - 목록은 password_policy.get_common_passwords()에서 프로세스마다 한번만 읽어서 공유
     """
 
-    DEFAULT_PASSWORD_LIST_PATH = (
-        Path(__file__).resolve().parent / "common-passwords.txt.gz"
-    )
+    rule = PASSWORD_RULE_COMMON
+    DEFAULT_PASSWORD_LIST_PATH = COMMON_PASSWORD_LIST_PATH
 
     def __init__(self, password_list_path=DEFAULT_PASSWORD_LIST_PATH):
-        try:
-            with gzip.open(password_list_path, "rt", encoding="utf-8") as f:
-                self.passwords = {x.strip() for x in f}
-        except OSError:
-            with open(password_list_path) as f:
-                self.passwords = {x.strip() for x in f}
+        self.passwords = get_common_passwords(password_list_path)
 
     def validate(self, password, user=None):
-        if password.lower().strip() in self.passwords:
-            raise StandardException(
-                400, ugettext_lazy("The new password is too simple")
-            )
+        if password in self.passwords:
+            self.raise_error()
+
+    def raise_error(self):
+        raise StandardException(400, ugettext_lazy("The new password is too simple"))
 
     def get_help_text(self):
         return _("Your password can’t be a commonly used password.")
@@ -243,12 +281,17 @@ class NumericPasswordValidator:
     Validate whether the password is alphanumeric.
     """
 
+    rule = PASSWORD_RULE_NUMERIC
+
     def validate(self, password, user=None):
         if password.isdigit():
-            raise ValidationError(
-                _("This password is entirely numeric."),
-                code="password_entirely_numeric",
-            )
+            self.raise_error()
+
+    def raise_error(self):
+        raise ValidationError(
+            _("This password is entirely numeric."),
+            code="password_entirely_numeric",
+        )
 
     def get_help_text(self):
         return _("Your password can’t be entirely numeric.")
@@ -259,14 +302,22 @@ class NumberEnglishMixPasswordValidator:
     영문+숫자 유효성 검사
     """
 
+    rule = PASSWORD_RULE_NUMBER_ENGLISH_MIX
+
+    def __init__(self):
+        self.policy = PasswordPolicy(rules=[self.rule])
+
     def validate(self, password, user=None):
-        if not (re.findall("[0-9]", password) and re.findall("[a-zA-z]", password)):
-            raise StandardException(
-                400,
-                ugettext_lazy(
-                    "Please enter a combination of English and numbers for the password"
-                ),
-            )
+        if self.policy.check(password):
+            self.raise_error()
+
+    def raise_error(self):
+        raise StandardException(
+            400,
+            ugettext_lazy(
+                "Please enter a combination of English and numbers for the password"
+            ),
+        )
 
     def get_help_text(self):
         return _("Please enter a combination of English and numbers for the password")
@@ -0,0 +1,75 @@
+# project_api/firebase.py
+"""firebase 모듈 설명
+
+Firebase app registry 모듈
+
+- settings import 시점에 firebase_admin을 불러오거나 initialize_app 하지 않고,
+  푸시 발송 등 처음 사용할 때 settings.FIREBASE_APPS의 설정으로 초기화
+  (manage.py 커맨드 / 테스트 / gunicorn worker 실행 시 firebase_admin, google-auth, gRPC import 비용이 없음)
+- 초기화한 app은 이름별로 저장해서 프로세스 안에서 재사용
+"""
+import threading
+from typing import Final
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+
+FIREBASE_DEFAULT_APP: Final = "default"
+
+_lock = threading.Lock()
+_apps = {}
+
+
+def get_firebase_app_settings(name):
+    try:
+        return settings.FIREBASE_APPS[name]
+    except KeyError:
+        raise ImproperlyConfigured(f"Firebase app '{name}' is not configured")
+
+
+def get_firebase_app(name=FIREBASE_DEFAULT_APP):
+    """
+    이름에 맞는 firebase_admin App (처음 호출할 때 초기화)
+    - "default"는 firebase_admin의 기본 app으로 초기화하므로 app을 넘기지 않는 코드에서도 사용 가능
+    """
+    app = _apps.get(name)
+    if app is not None:
+        return app
+
+    with _lock:
+        app = _apps.get(name)
+        if app is None:
+            import firebase_admin
+            from firebase_admin import credentials
+
+            app_settings = get_firebase_app_settings(name)
+            app_name = (
+                firebase_admin._DEFAULT_APP_NAME
+                if name == FIREBASE_DEFAULT_APP
+                else name
+            )
+            try:
+                app = firebase_admin.get_app(app_name)
+            except ValueError:
+                app = firebase_admin.initialize_app(
+                    credentials.Certificate(app_settings["CREDENTIALS"]),
+                    options=app_settings.get("OPTIONS", None),
+                    name=app_name,
+                )
+            _apps[name] = app
+
+    return app
+
+
+def is_firebase_app_initialized(name=FIREBASE_DEFAULT_APP):
+    return name in _apps
+
+
+def reset_firebase_apps():
+    """초기화한 app을 모두 삭제 (테스트용)"""
+    import firebase_admin
+
+    with _lock:
+        for app in _apps.values():
+            firebase_admin.delete_app(app)
+        _apps.clear()
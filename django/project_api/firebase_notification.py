@@ -1,15 +1,48 @@
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import partial
+from typing import Final
+
+from project_api.firebase import FIREBASE_DEFAULT_APP, get_firebase_app
 from project_api.utils import StandardException
 from firebase_admin import messaging
 
 from django.utils.translation import ugettext_lazy
 
+logger = logging.getLogger(__name__)
+
+# MulticastMessage 한번에 보낼 수 있는 최대 토큰 개수 (FCM 제한)
+FIREBASE_MULTICAST_MAX_TOKENS: Final = 500
+# 동시에 발송하는 multicast 개수
+FIREBASE_FAN_OUT_MAX_WORKERS: Final = 4
+# DB에서 수신자를 한번에 가져오는 개수
+FIREBASE_FAN_OUT_CHUNK_SIZE: Final = 2000
+# 더 이상 사용할 수 없는 토큰이라 삭제하는 에러
+FIREBASE_UNREGISTERED_ERRORS: Final = (
+    messaging.UnregisteredError,
+    messaging.SenderIdMismatchError,
+)
+
 
 class FirebaseAppPush:
-    def __init__(self, registration_token, title: str, body: str, data=None):
+    def __init__(
+        self,
+        registration_token,
+        title: str,
+        body: str,
+        data=None,
+        app_name=FIREBASE_DEFAULT_APP,
+    ):
         self.registration_token = registration_token
         self.title = title
         self.body = body
         self.data = data
+        self.app_name = app_name
+
+    @property
+    def app(self):
+        return get_firebase_app(self.app_name)
 
     def default_single_send_notification(self):
         message = messaging.Message(
@@ -21,7 +54,7 @@ class FirebaseAppPush:
             token=self.registration_token,
         )
         try:
-            response = messaging.send(message)
+            response = messaging.send(message, app=self.app)
         except messaging.UnregisteredError:
             raise StandardException(
                 422,
@@ -30,23 +63,177 @@ class FirebaseAppPush:
 
         return response
 
-    def default_multi_send_notification(self):
-        assert isinstance(self.registration_token, list)
-
-        message = messaging.MulticastMessage(
+    def get_multicast_message(self, registration_tokens=None):
+        return messaging.MulticastMessage(
             notification=messaging.Notification(
                 title=self.title,
                 body=self.body,
             ),
             data=self.data,
-            token=self.registration_token,
+            tokens=registration_tokens or self.registration_token,
         )
-        try:
-            response = messaging.send_multicast(message)
-        except messaging.UnregisteredError:
-            raise StandardException(
-                422,
-                ugettext_lazy("registration_token does not match"),
+
+    def default_multi_send_notification(self):
+        """
+        registration_token 리스트 전체에 발송
+        - FCM 제한(500개)보다 많으면 나누어 발송하고 결과를 하나의 BatchResponse로 합쳐서 반환
+        """
+        assert isinstance(self.registration_token, list)
+
+        responses = []
+        for start in range(
+            0, len(self.registration_token), FIREBASE_MULTICAST_MAX_TOKENS
+        ):
+            message = self.get_multicast_message(
+                self.registration_token[start : start + FIREBASE_MULTICAST_MAX_TOKENS]
             )
+            try:
+                response = messaging.send_multicast(message, app=self.app)
+            except messaging.UnregisteredError:
+                raise StandardException(
+                    422,
+                    ugettext_lazy("registration_token does not match"),
+                )
+            responses += response.responses
 
-        return response
+        return messaging.BatchResponse(responses)
+
+
+class FirebasePushFanOut:
+    """
+    많은 수신자에게 같은 푸시를 보내는 fan-out 발송
+
+    - 수신자 queryset을 DB에서 chunk_size개씩 가져오고(iterator), batch_size개씩 묶어서 multicast로 발송
+    - 최대 max_workers개의 multicast를 스레드 풀에서 동시에 발송
+      (대기 중인 batch도 max_workers개까지만 만들어서 수신자 전체를 메모리에 올리지 않음)
+    - 더 이상 사용할 수 없는 토큰(앱 삭제 등)은 발송이 끝난 batch마다 User.push_token에서 삭제
+    - batch별 발송 개수 / 소요 시간 / 초당 발송 개수를 로그로 남기고 send()에서 반환
+    - send_multicast: 실제 발송 함수 (테스트용, 기본은 app_name의 firebase app으로 발송)
+    """
+
+    def __init__(
+        self,
+        title: str,
+        body: str,
+        data=None,
+        batch_size=FIREBASE_MULTICAST_MAX_TOKENS,
+        max_workers=FIREBASE_FAN_OUT_MAX_WORKERS,
+        chunk_size=FIREBASE_FAN_OUT_CHUNK_SIZE,
+        send_multicast=None,
+        app_name=FIREBASE_DEFAULT_APP,
+    ):
+        if not 0 < batch_size <= FIREBASE_MULTICAST_MAX_TOKENS:
+            raise ValueError(
+                f"batch_size must be between 1 and {FIREBASE_MULTICAST_MAX_TOKENS}"
+            )
+
+        self.push = FirebaseAppPush(None, title, body, data, app_name=app_name)
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.chunk_size = chunk_size
+        self.send_multicast = send_multicast or partial(
+            messaging.send_multicast, app=self.push.app
+        )
+
+    def get_batches(self, queryset):
+        tokens = []
+        for token in (
+            queryset.exclude(push_token__isnull=True)
+            .exclude(push_token="")
+            .values_list("push_token", flat=True)
+            .iterator(chunk_size=self.chunk_size)
+        ):
+            tokens.append(token)
+            if len(tokens) == self.batch_size:
+                yield tokens
+                tokens = []
+
+        if tokens:
+            yield tokens
+
+    def send_batch(self, number, tokens):
+        """스레드 풀에서 실행 (DB를 사용하지 않음)"""
+        started_at = time.monotonic()
+        try:
+            response = self.send_multicast(self.push.get_multicast_message(tokens))
+        except Exception as e:
+            logger.warning("Push fan-out batch %s failed: %s", number, e)
+            success_count = 0
+            unregistered_tokens = []
+            error = str(e)
+        else:
+            success_count = response.success_count
+            unregistered_tokens = [
+                token
+                for token, send_response in zip(tokens, response.responses)
+                if isinstance(send_response.exception, FIREBASE_UNREGISTERED_ERRORS)
+            ]
+            error = None
+
+        elapsed = time.monotonic() - started_at
+        return {
+            "batch": number,
+            "size": len(tokens),
+            "success_count": success_count,
+            "failure_count": len(tokens) - success_count,
+            "unregistered_tokens": unregistered_tokens,
+            "error": error,
+            "elapsed": elapsed,
+            "throughput": len(tokens) / elapsed if elapsed > 0 else float(len(tokens)),
+        }
+
+    def prune_tokens(self, tokens):
+        from users.models import User
+
+        if not tokens:
+            return 0
+        return User.objects.filter(push_token__in=tokens).update(push_token=None)
+
+    def finish_batch(self, result, report):
+        result["pruned_count"] = self.prune_tokens(result.pop("unregistered_tokens"))
+        logger.info(
+            "Push fan-out batch %s: %s sent, %s failed, %s pruned in %.3fs (%.1f/s)",
+            result["batch"],
+            result["success_count"],
+            result["failure_count"],
+            result["pruned_count"],
+            result["elapsed"],
+            result["throughput"],
+        )
+        report["batches"].append(result)
+        for key in ("size", "success_count", "failure_count", "pruned_count"):
+            report[key] += result[key]
+
+    def send(self, queryset):
+        """
+        queryset(User)의 push_token 전체에 발송하고 결과를 반환
+        - 예: {"size": 1200, "success_count": 1190, "failure_count": 10, "pruned_count": 8,
+               "elapsed": 1.2, "throughput": 1000.0, "batches": [...]}
+        """
+        report = {
+            "size": 0,
+            "success_count": 0,
+            "failure_count": 0,
+            "pruned_count": 0,
+            "batches": [],
+        }
+        started_at = time.monotonic()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = set()
+            for number, tokens in enumerate(self.get_batches(queryset), start=1):
+                futures.add(executor.submit(self.send_batch, number, tokens))
+                if len(futures) >= self.max_workers:
+                    done, futures = wait(futures, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        self.finish_batch(future.result(), report)
+
+            for future in futures:
+                self.finish_batch(future.result(), report)
+
+        report["batches"].sort(key=lambda result: result["batch"])
+        report["elapsed"] = time.monotonic() - started_at
+        report["throughput"] = (
+            report["size"] / report["elapsed"] if report["elapsed"] > 0 else 0.0
+        )
+        return report
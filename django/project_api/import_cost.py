@@ -0,0 +1,74 @@
+# project_api/import_cost.py
+"""import_cost 모듈 설명
+
+서버 시작(import) 시간 분석 모듈
+
+- 새 파이썬 프로세스를 `-X importtime` 옵션으로 실행해서 모듈을 import 하고, 출력된 모듈별 import 시간을 집계
+- 이미 import된 모듈은 다시 측정할 수 없으므로 항상 별도 프로세스에서 측정
+- import_cost_report 커맨드에서 사용
+"""
+import os
+import re
+import subprocess
+import sys
+from collections import defaultdict, namedtuple
+
+IMPORT_TIME_LINE = re.compile(
+    r"^import time:\s+(?P<self>\d+) \|\s+(?P<cumulative>\d+) \|(?P<indent>\s*)(?P<module>\S+)$"
+)
+
+ImportCost = namedtuple("ImportCost", ["module", "self_us", "cumulative_us", "depth"])
+
+
+def parse_import_time(output):
+    """`-X importtime` 출력을 ImportCost 리스트로 변환 (import가 끝난 순서)"""
+    costs = []
+    for line in output.splitlines():
+        match = IMPORT_TIME_LINE.match(line)
+        if match is None:
+            continue
+        costs.append(
+            ImportCost(
+                module=match["module"],
+                self_us=int(match["self"]),
+                cumulative_us=int(match["cumulative"]),
+                # 최상위 import는 공백 1칸, 한 단계 내려갈 때마다 2칸씩 들여쓰기
+                depth=(len(match["indent"]) - 1) // 2,
+            )
+        )
+
+    return costs
+
+
+def measure_import_cost(module, cwd=None, env=None):
+    """새 프로세스에서 module을 import 하면서 측정한 ImportCost 리스트"""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=cwd,
+        env={**os.environ, **(env or {})},
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    if completed.returncode != 0:
+        errors = [
+            line
+            for line in completed.stderr.splitlines()
+            if not IMPORT_TIME_LINE.match(line)
+        ]
+        raise RuntimeError(f"Failed to import {module}:\n" + "\n".join(errors))
+
+    return parse_import_time(completed.stderr)
+
+
+def get_package_costs(costs):
+    """최상위 패키지별 self 시간 합계 (큰 순서)"""
+    totals = defaultdict(int)
+    for cost in costs:
+        totals[cost.module.split(".")[0]] += cost.self_us
+
+    return sorted(totals.items(), key=lambda item: item[1], reverse=True)
+
+
+def get_total_import_time(costs):
+    return sum(cost.cumulative_us for cost in costs if cost.depth == 0)
@@ -0,0 +1,29 @@
+# project_api/parsers.py
+from typing import Final
+
+import orjson
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+
+from django.conf import settings
+
+UTF8_ENCODINGS: Final = ("utf-8", "utf8")
+
+
+class ORJSONParser(JSONParser):
+    """
+    orjson을 사용하는 JSON body parser
+    - NaN / Infinity는 JSONParser(STRICT_JSON)와 같이 허용하지 않음
+    - UTF-8이 아닌 charset으로 보낸 body는 JSONParser로 처리
+    """
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+        if encoding.lower().replace("_", "-") not in UTF8_ENCODINGS:
+            return super().parse(stream, media_type, parser_context)
+
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError(f"JSON parse error - {exc}")
@@ -0,0 +1,139 @@
+# project_api/password_policy.py
+"""password_policy 모듈 설명
+
+비밀번호 정책 검사 모듈
+
+- 흔한 비밀번호 목록(common-passwords.txt.gz)은 프로세스에서 한번만 읽고,
+  문자열 set 대신 정렬한 bytes 하나 + offset 배열로 저장해서 이진 탐색 (메모리 1/10 이하)
+- 길이 / 숫자로만 구성 / 영문 + 숫자 조합 규칙은 문자열을 한번만 훑어서 같이 검사
+- custom_password_validation의 validator들과 users.utils.validate_password_format에서 같이 사용
+"""
+import functools
+import gzip
+from array import array
+from pathlib import Path
+from typing import Final
+
+PASSWORD_MIN_LENGTH: Final = 8
+COMMON_PASSWORD_LIST_PATH: Final = Path(__file__).resolve().parent / (
+    "common-passwords.txt.gz"
+)
+
+# 검사 규칙 (PasswordPolicy.check()는 위반한 규칙을 이 순서대로 반환)
+PASSWORD_RULE_MIN_LENGTH: Final = "min_length"
+PASSWORD_RULE_COMMON: Final = "common"
+PASSWORD_RULE_NUMERIC: Final = "numeric"
+PASSWORD_RULE_NUMBER_ENGLISH_MIX: Final = "number_english_mix"
+PASSWORD_RULES: Final = (
+    PASSWORD_RULE_MIN_LENGTH,
+    PASSWORD_RULE_COMMON,
+    PASSWORD_RULE_NUMERIC,
+    PASSWORD_RULE_NUMBER_ENGLISH_MIX,
+)
+
+
+class CommonPasswordList:
+    """
+    흔한 비밀번호 목록
+    - 소문자로 바꾸고 앞뒤 공백을 제거한 값으로 비교 (django CommonPasswordValidator와 같음)
+    """
+
+    def __init__(self, passwords):
+        words = sorted({password.strip().encode() for password in passwords} - {b""})
+        self._data = b"".join(words)
+        self._offsets = array("I", [0])
+        for word in words:
+            self._offsets.append(self._offsets[-1] + len(word))
+        self.max_length = max(map(len, words), default=0)
+
+    @classmethod
+    def from_file(cls, path=COMMON_PASSWORD_LIST_PATH):
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                return cls(f)
+        except OSError:
+            with open(path, encoding="utf-8") as f:
+                return cls(f)
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __contains__(self, password):
+        password = password.lower().strip()
+        if len(password) > self.max_length:
+            return False
+
+        target = password.encode()
+        data = self._data
+        offsets = self._offsets
+        low, high = 0, len(offsets) - 1
+        while low < high:
+            middle = (low + high) // 2
+            word = data[offsets[middle] : offsets[middle + 1]]
+            if word < target:
+                low = middle + 1
+            elif word > target:
+                high = middle
+            else:
+                return True
+
+        return False
+
+
+@functools.lru_cache(maxsize=None)
+def get_common_passwords(path=COMMON_PASSWORD_LIST_PATH):
+    return CommonPasswordList.from_file(path)
+
+
+class PasswordPolicy:
+    """
+    비밀번호 정책 검사
+    - rules: 검사할 규칙 (기본은 전체)
+    """
+
+    def __init__(
+        self,
+        min_length=PASSWORD_MIN_LENGTH,
+        common_passwords=None,
+        rules=PASSWORD_RULES,
+    ):
+        self.min_length = min_length
+        self._common_passwords = common_passwords
+        self.rules = frozenset(rules)
+
+    @property
+    def common_passwords(self):
+        # 목록은 처음 검사할 때 읽음 (import 시점에 읽지 않도록)
+        if self._common_passwords is None:
+            self._common_passwords = get_common_passwords()
+        return self._common_passwords
+
+    def check(self, password):
+        """위반한 규칙 리스트 (모두 통과하면 빈 리스트)"""
+        has_number = has_english = has_non_digit = False
+        for char in password:
+            if "0" <= char <= "9":
+                has_number = True
+            else:
+                if not has_non_digit and not char.isdigit():
+                    has_non_digit = True
+                if ("a" <= char <= "z") or ("A" <= char <= "Z"):
+                    has_english = True
+            if has_number and has_english:
+                # 영문이 있으면 숫자로만 구성된 비밀번호가 아니므로 더 볼 필요 없음
+                break
+
+        violations = []
+        rules = self.rules
+        if PASSWORD_RULE_MIN_LENGTH in rules and len(password) < self.min_length:
+            violations.append(PASSWORD_RULE_MIN_LENGTH)
+        if PASSWORD_RULE_COMMON in rules and password in self.common_passwords:
+            violations.append(PASSWORD_RULE_COMMON)
+        if PASSWORD_RULE_NUMERIC in rules and password and not has_non_digit:
+            violations.append(PASSWORD_RULE_NUMERIC)
+        if PASSWORD_RULE_NUMBER_ENGLISH_MIX in rules and not (
+            has_number and has_english
+        ):
+            violations.append(PASSWORD_RULE_NUMBER_ENGLISH_MIX)
+
+        return violations
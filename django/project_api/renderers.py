@@ -0,0 +1,45 @@
+# project_api/renderers.py
+"""renderers 모듈 설명
+
+orjson을 사용하는 JSON renderer
+
+- datetime / date / time / UUID / dataclass는 orjson에서 직접 변환
+  (naive datetime은 serializer DateTimeField와 같은 isoformat 형식)
+- Decimal / lazy 번역 문자열 / timedelta 등은 DRF JSONEncoder와 같은 방식으로 변환
+- JSONRenderer 기본 설정(UNICODE_JSON, COMPACT_JSON)과 같은 형식이고,
+  JavaScript에서 문자열로 사용할 수 없는 U+2028 / U+2029는 JSONRenderer처럼 escape
+- indent를 요청한 경우(Accept: application/json; indent=4)는 JSONRenderer로 처리
+"""
+from typing import Final
+
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+ORJSON_OPTIONS: Final = orjson.OPT_NON_STR_KEYS
+LINE_SEPARATOR: Final = "\u2028".encode()
+PARAGRAPH_SEPARATOR: Final = "\u2029".encode()
+
+json_encoder_default = JSONEncoder().default
+
+
+def orjson_dumps(data):
+    """ORJSONRenderer와 같은 형식의 JSON bytes"""
+    content = orjson.dumps(data, default=json_encoder_default, option=ORJSON_OPTIONS)
+    if LINE_SEPARATOR in content:
+        content = content.replace(LINE_SEPARATOR, b"\\u2028")
+    if PARAGRAPH_SEPARATOR in content:
+        content = content.replace(PARAGRAPH_SEPARATOR, b"\\u2029")
+    return content
+
+
+class ORJSONRenderer(JSONRenderer):
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        renderer_context = renderer_context or {}
+        if self.get_indent(accepted_media_type, renderer_context):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        return orjson_dumps(data)
@@ -0,0 +1,200 @@
+# project_api/response_schema.py
+"""response_schema 모듈 설명
+
+응답 전용 serializer를 빠르게 출력하기 위한 모듈
+
+- 응답 데이터만 만드는 serializer(dict를 넣고 .data만 사용하는 경우)는 필드마다
+  get_attribute / to_representation을 호출하는 비용이 커서, 목록이 길면 응답 시간 대부분을 차지
+- ResponseSchema(serializer 클래스)는 처음 사용할 때 serializer 필드를 읽어서
+  필드별 변환 코드를 한 함수로 생성하고, dict(Mapping) 데이터는 생성한 함수로 변환
+    - 결과는 serializer.data와 같은 값 / 같은 key 순서 (렌더링한 JSON bytes도 같음)
+    - 기본 형식(int / float / str / bool / ISO 8601 날짜·시간)은 직접 변환하고,
+      그 외 필드는 해당 필드의 to_representation을 그대로 호출
+    - 모델 객체 등 Mapping이 아닌 데이터는 serializer로 변환
+- swagger 문서(drf_yasg)는 기존처럼 serializer 클래스를 사용
+- 예시: `exercise_record_schema = ResponseSchema(ExerciseRecordSerializer)` (serializer 정의 아래에 선언)
+"""
+import datetime
+from collections.abc import Mapping
+
+from rest_framework import ISO_8601, fields, serializers
+from rest_framework.settings import api_settings
+
+from django.db import models
+
+
+def _is_iso_format(field, default_format):
+    output_format = getattr(field, "format", default_format)
+    return output_format is not None and output_format.lower() == ISO_8601
+
+
+def _uses_representation_of(field, field_class):
+    """field가 field_class의 to_representation을 그대로 사용하는지 여부"""
+    return (
+        isinstance(field, field_class)
+        and type(field).to_representation is field_class.to_representation
+    )
+
+
+def _datetime_to_representation(value, field):
+    if value.__class__ is datetime.datetime and value.tzinfo is None:
+        return value.isoformat()
+    return field.to_representation(value)
+
+
+def _date_to_representation(value, field):
+    if value.__class__ is datetime.date:
+        return value.isoformat()
+    return field.to_representation(value)
+
+
+def _time_to_representation(value, field):
+    if value.__class__ is datetime.time:
+        return value.isoformat()
+    return field.to_representation(value)
+
+
+def _bool_to_representation(value, field):
+    if value is True or value is False:
+        return value
+    return field.to_representation(value)
+
+
+class ResponseSchema:
+    """
+    serializer 클래스의 출력(.data)을 생성한 함수로 만들어주는 응답 schema
+    - encode(instance): serializer(instance).data와 같은 dict
+    - encode_many(instances): serializer(instances, many=True).data와 같은 list
+    """
+
+    def __init__(self, serializer_class):
+        self.serializer_class = serializer_class
+        self._encode_mapping = None
+        self._serializer = None
+
+    def __repr__(self):
+        return f"ResponseSchema({self.serializer_class.__name__})"
+
+    def encode(self, instance):
+        if self._encode_mapping is None:
+            self.compile()
+        if isinstance(instance, Mapping):
+            return self._encode_mapping(instance)
+        return self._serializer.to_representation(instance)
+
+    def encode_many(self, instances):
+        if isinstance(instances, models.Manager):
+            instances = instances.all()
+        encode = self.encode
+        return [encode(instance) for instance in instances]
+
+    def compile(self):
+        """serializer 필드로 Mapping 데이터를 변환하는 함수 생성"""
+        serializer = self.serializer_class()
+        namespace = {
+            "SkipField": fields.SkipField,
+            "PKOnlyObject": serializers.PKOnlyObject,
+            "datetime_to_representation": _datetime_to_representation,
+            "date_to_representation": _date_to_representation,
+            "time_to_representation": _time_to_representation,
+            "bool_to_representation": _bool_to_representation,
+        }
+        lines = ["def encode(instance):", "    ret = {}"]
+
+        for index, field in enumerate(serializer._readable_fields):
+            field_ref = f"field_{index}"
+            namespace[field_ref] = field
+            lines.extend(
+                "    " + line
+                for line in self._compile_field(field, field_ref, namespace)
+            )
+
+        lines.append("    return ret")
+        exec("\n".join(lines), namespace)
+
+        self._serializer = serializer
+        self._encode_mapping = namespace["encode"]
+
+    def _compile_field(self, field, field_ref, namespace):
+        name = repr(field.field_name)
+        if len(field.source_attrs) != 1 or isinstance(field, serializers.RelatedField):
+            # source="*", "a.b" / 관계 필드는 serializer와 같은 방식으로 처리
+            return [
+                "try:",
+                f"    value = {field_ref}.get_attribute(instance)",
+                "except SkipField:",
+                "    pass",
+                "else:",
+                "    check_for_none = value.pk if isinstance(value, PKOnlyObject) else value",
+                f"    ret[{name}] = None if check_for_none is None else "
+                f"{field_ref}.to_representation(value)",
+            ]
+
+        key = repr(field.source_attrs[0])
+        assign = (
+            f"ret[{name}] = None if value is None else "
+            f"{self._get_representation(field, field_ref, namespace)}"
+        )
+        # key가 없는 경우는 Field.get_attribute()와 같은 순서로 처리 (default -> null -> 생략)
+        if field.default is not fields.empty:
+            missing_value = f"{field_ref}.get_default()"
+        elif field.allow_null:
+            missing_value = "None"
+        elif not field.required:
+            return [
+                "try:",
+                f"    value = instance[{key}]",
+                "except KeyError:",
+                "    pass",
+                "else:",
+                f"    {assign}",
+            ]
+        else:
+            return [f"value = instance[{key}]", assign]
+
+        return [
+            "try:",
+            f"    value = instance[{key}]",
+            "except KeyError:",
+            f"    value = {missing_value}",
+            assign,
+        ]
+
+    def _get_representation(self, field, field_ref, namespace):
+        """None이 아닌 value를 field.to_representation(value)와 같은 값으로 변환하는 코드"""
+        if isinstance(field, serializers.ListSerializer) and isinstance(
+            field.child, serializers.Serializer
+        ):
+            schema_ref = f"{field_ref}_schema"
+            namespace[schema_ref] = ResponseSchema(type(field.child))
+            return f"{schema_ref}.encode_many(value)"
+        if isinstance(field, serializers.Serializer):
+            schema_ref = f"{field_ref}_schema"
+            namespace[schema_ref] = ResponseSchema(type(field))
+            return f"{schema_ref}.encode(value)"
+
+        if _uses_representation_of(field, fields.IntegerField):
+            return "int(value)"
+        if _uses_representation_of(field, fields.FloatField):
+            return "float(value)"
+        if _uses_representation_of(field, fields.CharField):
+            return "str(value)"
+        if _uses_representation_of(field, fields.BooleanField):
+            return f"bool_to_representation(value, {field_ref})"
+
+        if (
+            _uses_representation_of(field, fields.DateTimeField)
+            and _is_iso_format(field, api_settings.DATETIME_FORMAT)
+            and getattr(field, "timezone", field.default_timezone()) is None
+        ):
+            return f"datetime_to_representation(value, {field_ref})"
+        if _uses_representation_of(field, fields.DateField) and _is_iso_format(
+            field, api_settings.DATE_FORMAT
+        ):
+            return f"date_to_representation(value, {field_ref})"
+        if _uses_representation_of(field, fields.TimeField) and _is_iso_format(
+            field, api_settings.TIME_FORMAT
+        ):
+            return f"time_to_representation(value, {field_ref})"
+
+        return f"{field_ref}.to_representation(value)"
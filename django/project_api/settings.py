@@ -15,8 +15,6 @@ import socket
 import sys
 from pathlib import Path
 
-import firebase_admin
-
 from django.utils.translation import gettext_lazy as _
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -41,9 +39,15 @@ sys.path.insert(0, os.path.join(BASE_DIR, "project_api/apps"))
 # Django 3.2 버전부터 Primary Key 속성을 설정해줘야하는 것 때문에 나오는 Warning을 해결하기 위한 코드
 DEFAULT_AUTO_FIELD = "django.db.models.AutoField"
 
-cred_obj = firebase_admin.credentials.Certificate("./FBserviceAccountKey.json")
-
-default_app = firebase_admin.initialize_app(cred_obj)
+# Firebase app 설정 (project_api/firebase.py에서 처음 사용할 때 초기화)
+# - CREDENTIALS: 서비스 계정 키 파일 경로, OPTIONS: firebase_admin.initialize_app options
+FIREBASE_APPS = {
+    "default": {
+        "CREDENTIALS": os.environ.get(
+            "FIREBASE_CREDENTIALS", default="./FBserviceAccountKey.json"
+        ),
+    },
+}
 
 # Application definition
 
@@ -60,7 +64,6 @@ INSTALLED_APPS = [
     "rest_framework.authtoken",
     "dj_rest_auth",
     "drf_yasg",
-    "firebase_admin",
     # Custom Apps
     "commons",
     "users",
@@ -164,12 +167,18 @@ REST_FRAMEWORK = {
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.DjangoModelPermissionsOrAnonReadOnly"
     ],
-    # 하단 옵션은 Dev 모드일 때에는 주석처리
-    # 'DEFAULT_RENDERER_CLASSES': (
-    #     'rest_framework.renderers.JSONRenderer',
-    # ),
+    # orjson renderer / parser (project_api/renderers.py, project_api/parsers.py)
+    # - browsable API는 Dev 모드(DEBUG)에서만 사용
+    "DEFAULT_RENDERER_CLASSES": ["project_api.renderers.ORJSONRenderer"]
+    + (["rest_framework.renderers.BrowsableAPIRenderer"] if DEBUG else []),
+    "DEFAULT_PARSER_CLASSES": [
+        "project_api.parsers.ORJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework.authentication.TokenAuthentication",
+        # TokenAuthentication + 토큰 캐시 (users/authentication.py)
+        "users.authentication.CachedTokenAuthentication",
         # 'rest_framework.authentication.SessionAuthentication',
     ),
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
@@ -180,6 +189,25 @@ REST_FRAMEWORK = {
 
 AUTH_USER_MODEL = "users.User"
 
+# 인증 토큰 캐시 (users.authentication.CachedTokenAuthentication)
+# - 기본값은 사용하지 않음 (요청마다 Token + User를 DB에서 조회)
+# - 여러 서버 / 프로세스가 같이 사용하는 캐시(redis, memcached 등)를 CACHES에 설정한 경우
+#   "CACHE"를 그 alias로 변경하면 토큰 조회 쿼리 대신 캐시 조회 한번으로 인증
+AUTH_TOKEN_CACHE = {
+    "CACHE": None,
+    "TIMEOUT": 300,
+}
+
+# 이메일 / 핸드폰 인증번호 저장소 (users/verification_store.py)
+VERIFICATION_CODE_STORE = {
+    # 여러 서버 / 프로세스가 같이 사용하는 캐시를 설정한 경우
+    # users.verification_store.CacheVerificationCodeStore로 변경하면 인증번호를 DB에 저장하지 않음
+    "BACKEND": "users.verification_store.ModelVerificationCodeStore",
+    "CACHE": "default",
+    "TIMEOUT": 60 * 60,
+    "AUDIT": False,
+}
+
 AUTHENTICATION_BACKENDS = [
     # Needed to login by username in Django admin, regardless of allauth
     "django.contrib.auth.backends.ModelBackend",
@@ -201,12 +229,42 @@ SWAGGER_SETTINGS = {
     "JSON_EDITOR": True,
 }
 
+# *** Google OAuth ****
+GOOGLE_WEB_CLIENT_ID = os.environ.get("GOOGLE_WEB_CLIENT_ID")
+# id_token 서명 검증용 인증서 (users.utils.google_auth에서 Cache-Control max-age 동안 캐시)
+GOOGLE_OAUTH2_CERTS_URL = os.environ.get(
+    "GOOGLE_OAUTH2_CERTS_URL", default="https://www.googleapis.com/oauth2/v1/certs"
+)
+
+# *** Apple Sign In ****
+# 애플 로그인 id_token 검증 (users/apple_auth.py)
+APPLE_AUTH = {
+    # 앱 bundle id / 서비스 id (쉼표로 구분)
+    # - 환경변수(.env.dev의 APPLE_CLIENT_IDS)가 없으면 애플 로그인 요청이 실패함
+    "CLIENT_IDS": [
+        client_id
+        for client_id in os.environ.get("APPLE_CLIENT_IDS", default="").split(",")
+        if client_id
+    ],
+    "JWKS_URL": "https://appleid.apple.com/auth/keys",
+    "KEYS_TIMEOUT": 60 * 60 * 24,
+    "REFRESH_INTERVAL": 60,
+}
 
 # *** AWS Configuration ****
 AWS_ACCESS_KEY_ID = os.environ.get("AWS_ACCESS_KEY_ID")
 AWS_SECRET_ACCESS_KEY = os.environ.get("AWS_SECRET_ACCESS_KEY")
 AWS_REGION = os.environ.get("AWS_REGION")
 
+# AWS client 서비스별 HTTP keep-alive connection pool 크기 (project_api/aws_clients.py)
+# - worker 하나에서 동시에 발송 / 업로드하는 스레드 수보다 크게 설정
+AWS_CLIENT_POOL_SIZES = {
+    "default": int(os.environ.get("AWS_CLIENT_POOL_SIZE", default=10)),
+    "ses": int(os.environ.get("AWS_SES_POOL_SIZE", default=10)),
+    "sns": int(os.environ.get("AWS_SNS_POOL_SIZE", default=10)),
+    "s3": int(os.environ.get("AWS_S3_POOL_SIZE", default=20)),
+}
+
 # django-storages to S3 ---------------
 AWS_STORAGE_BUCKET_NAME = os.environ.get("AWS_STORAGE_BUCKET_NAME")
 AWS_S3_CUSTOM_DOMAIN = "%s.s3.%s.amazonaws.com" % (
@@ -216,7 +274,7 @@ AWS_S3_CUSTOM_DOMAIN = "%s.s3.%s.amazonaws.com" % (
 AWS_S3_OBJECT_PARAMETERS = {
     "CacheControl": "max-age=86400",
 }
-DEFAULT_FILE_STORAGE = "storages.backends.s3boto3.S3Boto3Storage"
+DEFAULT_FILE_STORAGE = "project_api.aws_clients.PooledS3Boto3Storage"
 AWS_S3_CUSTOM_DOMAIN = "d1dzkb91qond6a.cloudfront.net"
 # -------------------------------------
 
@@ -283,5 +341,24 @@ DEFAULT_FROM_EMAIL = "info@popprika.com"
 SERVER_EMAIL = "las@popprika.com"
 ADMINS = [("ethan", "ethan@popprika.com"), ("las", "las@popprika.com")]
 
+# 이메일 / 문자 외부 발송 transport (commons/outbound.py)
+# - production이 아닌 환경에서는 실제로 발송하지 않고 로그만 남김
+OUTBOUND_MESSAGE_TRANSPORT = os.environ.get(
+    "OUTBOUND_MESSAGE_TRANSPORT",
+    default=(
+        "commons.outbound.AWSMessageTransport"
+        if os.environ.get("ENVIRONMENT") == "production"
+        else "commons.outbound.LocalMessageTransport"
+    ),
+)
 
-FIREBASE_APP = default_app
+# 운동 상세 기록 저장 방식
+# - "rows": 샘플마다 ExerciseDetailRecord row로 저장
+# - "blob": 세션 전체를 ExerciseRecord.detail_blob에 압축해서 저장
+EXERCISE_DETAIL_STORAGE = os.environ.get("EXERCISE_DETAIL_STORAGE", default="rows")
+
+# 운동기록 저장 요청(JSON) body 최대 크기 (bytes)
+# - body를 순차적으로 읽기 때문에 DATA_UPLOAD_MAX_MEMORY_SIZE 대신 이 값으로 제한
+EXERCISE_RECORD_MAX_BODY_SIZE = int(
+    os.environ.get("EXERCISE_RECORD_MAX_BODY_SIZE", default=32 * 1024 * 1024)
+)
@@ -5,10 +5,10 @@ import random
 import string
 from collections import OrderedDict
 
-import boto3
 from botocore.exceptions import ClientError
 from drf_yasg.inspectors import SwaggerAutoSchema
 from drf_yasg.utils import no_body
+from project_api.aws_clients import get_aws_client
 from rest_framework import serializers, status
 from rest_framework.exceptions import APIException
 from rest_framework.response import Response
@@ -50,8 +50,9 @@ class StandardException(APIException):
     status_code = None
 
     def __init__(self, status_code, message):
-        StandardException.status_code = status_code
-        StandardException.detail = message
+        # 클래스 속성을 바꾸면 동시에 처리 중인 다른 요청의 에러 내용이 섞이므로 인스턴스에 저장
+        self.status_code = status_code
+        self.detail = message
 
 
 # class DbDoesNotExist:
@@ -120,7 +121,13 @@ class ReadWriteAutoSchema(SwaggerAutoSchema):  # pragma: no cover
         return new_serializer
 
 
-def aws_email_single_send(recipient, subject, body_html):
+# SES / SNS 리전
+AWS_SES_REGION = "ap-northeast-2"
+AWS_SNS_REGION = "ap-northeast-1"
+
+
+def get_ses_email_kwargs(recipient, subject, body_html):
+    """SES send_email에 넘길 파라미터"""
     # Replace sender@example.com with your "From" address.
     # This address must be verified with Amazon SES.
     email = "info@popprika.com"
@@ -131,23 +138,6 @@ def aws_email_single_send(recipient, subject, body_html):
 
     sender = "=?utf-8?B?" + name_base64_str + "?=" + " <{}>".format(email)
 
-    SENDER = sender
-
-    # Replace recipient@example.com with a "To" address. If your account
-    # is still in the sandbox, this address must be verified.
-    RECIPIENT = recipient
-
-    # Specify a configuration set. If you do not want to use a configuration
-    # set, comment the following variable, and the
-    # ConfigurationSetName = CONFIGURATION_SET  argument below.
-    # CONFIGURATION_SET = "ConfigSet"
-
-    # If necessary, replace us-west-2 with the AWS Region you're using for Amazon SES.
-    AWS_REGION = "ap-northeast-2"
-
-    # The subject line for the email.
-    SUBJECT = subject
-
     # The email body for recipients with non-HTML email clients.
     BODY_TEXT = (
         "Amazon SES Test (Python)\r\n"
@@ -155,44 +145,64 @@ def aws_email_single_send(recipient, subject, body_html):
         "AWS SDK for Python (Boto)."
     )
 
-    # The HTML body of the email.
-    BODY_HTML = body_html
-
     CHARSET = "UTF-8"
 
+    return {
+        "Destination": {
+            "ToAddresses": [
+                recipient,
+            ],
+        },
+        "Message": {
+            "Body": {
+                "Html": {
+                    "Charset": CHARSET,
+                    "Data": body_html,
+                },
+                "Text": {
+                    "Charset": CHARSET,
+                    "Data": BODY_TEXT,
+                },
+            },
+            "Subject": {
+                "Charset": CHARSET,
+                "Data": subject,
+            },
+        },
+        "Source": sender,
+        # If you are not using a configuration set, comment or delete the
+        # following line
+        # "ConfigurationSetName": "ConfigSet",
+    }
+
+
+def get_sns_sms_kwargs(phone_number, messeage):
+    """
+    SNS publish에 넘길 파라미터
+    - 발송할 때마다 set_sms_attributes를 호출하지 않도록 메시지 속성으로 Transactional 타입 지정
+    """
+    return {
+        "PhoneNumber": phone_number,
+        "Message": messeage,
+        "MessageAttributes": {
+            "AWS.SNS.SMS.SMSType": {
+                "DataType": "String",
+                "StringValue": "Transactional",
+            },
+        },
+    }
+
+
+def aws_email_single_send(recipient, subject, body_html):
     # 사용시에만 주석 풀것
     # Create a new SES resource and specify a region.
-    ses_client = boto3.client("ses", region_name=AWS_REGION)
+    ses_client = get_aws_client("ses", region_name=AWS_SES_REGION)
     response = ""
     # Try to send the email.
     try:
         # Provide the contents of the email.
         response = ses_client.send_email(
-            Destination={
-                "ToAddresses": [
-                    RECIPIENT,
-                ],
-            },
-            Message={
-                "Body": {
-                    "Html": {
-                        "Charset": CHARSET,
-                        "Data": BODY_HTML,
-                    },
-                    "Text": {
-                        "Charset": CHARSET,
-                        "Data": BODY_TEXT,
-                    },
-                },
-                "Subject": {
-                    "Charset": CHARSET,
-                    "Data": SUBJECT,
-                },
-            },
-            Source=SENDER,
-            # If you are not using a configuration set, comment or delete the
-            # following line
-            # ConfigurationSetName="ConfigSet",
+            **get_ses_email_kwargs(recipient, subject, body_html)
         )
         # Display an error if something goes wrong.
     except ClientError as e:
@@ -203,17 +213,9 @@ def aws_email_single_send(recipient, subject, body_html):
 
 
 def aws_sms_single_send(phone_number, messeage):
-    sms_client = boto3.client(
-        "sns",
-        region_name="ap-northeast-1",
-    )
-
-    sms_client.set_sms_attributes(attributes={"DefaultSMSType": "Transactional"})
+    sms_client = get_aws_client("sns", region_name=AWS_SNS_REGION)
 
-    sms_client.publish(
-        PhoneNumber=phone_number,
-        Message=messeage,
-    )
+    sms_client.publish(**get_sns_sms_kwargs(phone_number, messeage))
 
 
 def get_random_number_code(length: int):